@@ -0,0 +1,7 @@
+"""
+Offline benchmarks for Modmail's hot paths.
+
+Each module can be run on its own, e.g. ``python -m bench.media``.
+``bench.fake`` runs the whole bot against an in-memory Discord and
+database, ``python -m bench.relay`` load tests it.
+"""
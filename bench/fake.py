@@ -0,0 +1,482 @@
+"""
+An in-memory stand-in for Discord, to run `ModmailBot` offline.
+
+`FakeDiscord` replaces the bot's `HTTPClient.request` with handlers that
+answer the REST routes Modmail uses from an in-memory model of a guild,
+and feeds gateway events (messages, edits, reactions, channel updates)
+straight into discord.py's connection state, the same way the websocket
+would. The database is an in-memory MongoDB from ``mongomock-motor``.
+"""
+
+import asyncio
+import contextvars
+import json
+import os
+import re
+import typing
+from collections import Counter
+from datetime import datetime
+
+import discord
+from discord.http import Route
+
+try:
+    from mongomock_motor import AsyncMongoMockClient
+except ImportError:
+    AsyncMongoMockClient = None
+
+# Overrides any .env or config.json of the checkout.
+BOT_CONFIG = {
+    "token": "MTAw.bench.token",
+    "connection_uri": "mongodb://localhost:27017",
+    "log_level": "WARNING",
+    "data_collection": False,
+    "disable_autoupdates": True,
+    "update_notifications": False,
+    "confirm_thread_creation": False,
+}
+
+EVERYONE = discord.Permissions.general().value | discord.Permissions.text().value
+ADMINISTRATOR = discord.Permissions.all().value
+
+
+def _timestamp() -> str:
+    return datetime.utcnow().isoformat() + "+00:00"
+
+
+def make_bot(**config):
+    """Creates a `ModmailBot` for the fake Discord, backed by an in-memory database."""
+    if AsyncMongoMockClient is None:
+        raise RuntimeError("The benchmarks need mongomock-motor: pip install mongomock-motor")
+
+    os.environ.setdefault("TOKEN", BOT_CONFIG["token"])
+    os.environ.setdefault("LOG_LEVEL", BOT_CONFIG["log_level"])
+    from bot import ModmailBot
+    from core.clients import ApiClient, MongoDBClient
+
+    class InMemoryClient(MongoDBClient):
+        def __init__(self, bot):
+            ApiClient.__init__(self, bot, AsyncMongoMockClient().modmail_bot)
+            self.read_preference = None
+            self._log_reader = None
+            self._stats_cache = {}
+
+        @property
+        def log_reader(self):
+            return self.db.logs
+
+        # mongomock drops the other fields of $slice projections.
+        async def get_user_logs(self, user_id):
+            query = {"recipient.id": str(user_id), "guild_id": str(self.bot.guild_id)}
+            logs = await self.db.logs.find(query).to_list(None)
+            return [{**log, "messages": log["messages"][:5]} for log in logs]
+
+        async def get_latest_user_logs(self, user_id):
+            query = {"recipient.id": str(user_id), "guild_id": str(self.bot.guild_id)}
+            log = await self.db.logs.find_one({**query, "open": False}, sort=[("closed_at", -1)])
+            return log and {**log, "messages": log["messages"][:5]}
+
+    class BenchBot(ModmailBot):
+        def startup(self):
+            # The plugin registry is fetched from GitHub.
+            self.loaded_cogs = [cog for cog in self.loaded_cogs if cog != "cogs.plugins"]
+            super().startup()
+
+    bot = BenchBot()
+    bot.config._cache.update(BOT_CONFIG)
+    bot.config._cache.update(config)
+    bot._api = InMemoryClient(bot)
+    return bot
+
+
+class FakeWebSocket:
+    """The parts of the gateway connection used outside of the event handlers."""
+
+    latency = 0.0
+
+    async def change_presence(self, **_):
+        pass
+
+
+class FakeDiscord:
+    """
+    The REST API and gateway of a single guild, kept in memory.
+
+    Parameters
+    ----------
+    bot : ModmailBot
+        The bot to serve, its HTTP client is patched by `connect`.
+    rest_latency : float
+        The time every REST call takes, in seconds.
+    """
+
+    def __init__(self, bot, *, rest_latency: float = 0.0):
+        self.bot = bot
+        self.state = bot._connection
+        self.rest_latency = rest_latency
+        self.calls = Counter()
+        self.unhandled = Counter()
+        self.observers = []
+
+        self._next_id = discord.utils.time_snowflake(datetime.utcnow())
+        self._channels = {}  # ID -> channel payload
+        self._messages = {}  # channel ID -> {message ID -> message payload}
+        self._users = {}
+        self._dm_channels = {}  # user ID -> DM channel payload
+        self._members = {}
+
+        self.user = self._user("Modmail", bot=True)
+        self.guild_id = self.snowflake()
+        self.staff_role = self.snowflake()
+        self.category = self._channel("Modmail", type_=4)
+        self.log_channel = self._channel("bot-logs", parent_id=self.category["id"])
+        self.staff = []
+        self.recipients = []
+
+        message = "/channels/{channel_id}/messages/{message_id}"
+        reaction = message + "/reactions/{emoji}/{member_id}"
+        self._routes = [
+            (self._compile(path), method, handler)
+            for method, path, handler in (
+                ("POST", "/channels/{channel_id}/messages", self.create_message),
+                ("GET", "/channels/{channel_id}/messages", self.history),
+                ("GET", message, self.get_message),
+                ("PATCH", message, self.edit_message),
+                ("DELETE", message, self.delete_message),
+                ("PUT", reaction, self.no_content),
+                ("DELETE", reaction, self.no_content),
+                ("POST", "/channels/{channel_id}/typing", self.no_content),
+                ("PUT", "/channels/{channel_id}/pins/{message_id}", self.no_content),
+                ("DELETE", "/channels/{channel_id}/pins/{message_id}", self.no_content),
+                ("GET", "/channels/{channel_id}", self.get_channel),
+                ("PATCH", "/channels/{channel_id}", self.edit_channel),
+                ("DELETE", "/channels/{channel_id}", self.delete_channel),
+                ("POST", "/guilds/{guild_id}/channels", self.create_channel),
+                ("GET", "/guilds/{guild_id}/audit-logs", self.audit_logs),
+                ("GET", "/guilds/{guild_id}/members/{user_id}", self.get_member),
+                ("GET", "/oauth2/applications/@me", self.application_info),
+                ("POST", "/users/@me/channels", self.start_private_message),
+                ("GET", "/users/{user_id}", self.get_user),
+            )
+        ]
+
+    @staticmethod
+    def _compile(path: str) -> typing.Pattern:
+        pattern = re.sub(r"\\{(\w+)\\}", r"(?P<\1>[^/]+)", re.escape(path))
+        return re.compile(re.escape(Route.BASE) + pattern + "$")
+
+    def snowflake(self) -> str:
+        self._next_id += 1
+        return str(self._next_id)
+
+    def _user(self, name: str, *, bot: bool = False) -> dict:
+        user = {
+            "id": self.snowflake(),
+            "username": name,
+            "discriminator": f"{len(self._users) % 9999 + 1:04}",
+            "avatar": None,
+            "bot": bot,
+        }
+        self._users[user["id"]] = user
+        return user
+
+    def _member(self, user: dict, roles: typing.List[str] = ()) -> dict:
+        return {
+            "user": user,
+            "roles": list(roles),
+            "joined_at": "2020-01-01T00:00:00+00:00",
+            "nick": None,
+            "deaf": False,
+            "mute": False,
+        }
+
+    def _channel(self, name: str, *, type_: int = 0, parent_id: str = None, **fields) -> dict:
+        channel = {
+            "id": self.snowflake(),
+            "type": type_,
+            "guild_id": self.guild_id,
+            "name": name,
+            "position": len(self._channels),
+            "parent_id": parent_id,
+            "topic": None,
+            "nsfw": False,
+            "permission_overwrites": [],
+            **fields,
+        }
+        self._channels[channel["id"]] = channel
+        self._messages[channel["id"]] = {}
+        return channel
+
+    def _message(self, channel_id: str, author: dict, content: str = "", **fields) -> dict:
+        message = {
+            "id": self.snowflake(),
+            "channel_id": channel_id,
+            "author": author,
+            "content": content,
+            "timestamp": _timestamp(),
+            "edited_timestamp": None,
+            "tts": False,
+            "mention_everyone": False,
+            "mentions": [],
+            "mention_roles": [],
+            "attachments": [],
+            "embeds": [],
+            "pinned": False,
+            "type": 0,
+            **fields,
+        }
+        channel = self._channels.get(channel_id)
+        if channel is not None and channel["type"] != 1:
+            message["guild_id"] = self.guild_id
+            if author["id"] in self._members:
+                message["member"] = {
+                    k: v for k, v in self._members[author["id"]].items() if k != "user"
+                }
+        self._messages.setdefault(channel_id, {})[message["id"]] = message
+        return message
+
+    def _attachment(self, channel_id: str, filename: str) -> dict:
+        attachment_id = self.snowflake()
+        path = f"attachments/{channel_id}/{attachment_id}/{filename}"
+        return {
+            "id": attachment_id,
+            "filename": filename,
+            "size": 1024,
+            "url": f"https://cdn.discordapp.com/{path}",
+            "proxy_url": f"https://media.discordapp.net/{path}",
+        }
+
+    # Gateway
+
+    def dispatch(self, event: str, data: dict) -> None:
+        """Feeds a gateway event to the bot."""
+        self.state.parsers[event](data)
+
+    async def connect(self, *, staff: int = 1, recipients: int = 10) -> None:
+        """
+        Creates the guild and its members, and brings the bot to the state `on_ready` would.
+        """
+        self.staff = [self._user(f"staff{i}") for i in range(staff)]
+        self.recipients = [self._user(f"user{i}") for i in range(recipients)]
+        self._members = {self.user["id"]: self._member(self.user, [self.staff_role])}
+        for user in self.staff:
+            self._members[user["id"]] = self._member(user, [self.staff_role])
+        for user in self.recipients:
+            self._members[user["id"]] = self._member(user)
+
+        self.bot.http.request = self.request
+        from core import ratelimits
+
+        ratelimits.install(self.bot.http)
+
+        self.bot.ws = FakeWebSocket()
+        self.state.user = discord.ClientUser(state=self.state, data=self.user)
+        self.guild = self.state._add_guild_from_data(
+            {
+                "id": self.guild_id,
+                "name": "Modmail Bench",
+                "owner_id": self.staff[0]["id"] if self.staff else self.user["id"],
+                "region": "us-west",
+                "verification_level": 0,
+                "default_message_notifications": 0,
+                "explicit_content_filter": 0,
+                "mfa_level": 0,
+                "features": [],
+                "emojis": [],
+                "roles": [
+                    {"id": self.guild_id, "name": "@everyone", "permissions": EVERYONE},
+                    {"id": self.staff_role, "name": "Staff", "permissions": ADMINISTRATOR},
+                ],
+                "channels": [self.category, self.log_channel],
+                "members": list(self._members.values()),
+                "member_count": len(self._members),
+            }
+        )
+        for user in self.recipients:
+            self.state.add_dm_channel(self._dm_channel(user))
+
+        config = self.bot.config
+        await config.refresh()
+        config._cache.update(
+            guild_id=self.guild_id,
+            main_category_id=self.category["id"],
+            log_channel_id=self.log_channel["id"],
+            owners=str(self.guild.owner_id),
+        )
+        self.bot.load_deferred_cogs()
+        self.bot._connected.set()
+        await self.bot.threads.populate_cache()
+        self.bot._ready.set()
+
+    def _dm_channel(self, user: dict) -> dict:
+        channel = self._dm_channels.get(user["id"])
+        if channel is None:
+            channel = self._dm_channels[user["id"]] = {
+                "id": self.snowflake(),
+                "type": 1,
+                "recipients": [user],
+            }
+            self._channels[channel["id"]] = channel
+            self._messages[channel["id"]] = {}
+        return channel
+
+    def dm_channel_id(self, user: dict) -> str:
+        return self._dm_channel(user)["id"]
+
+    def send_dm(self, user: dict, content: str, *, attachments: int = 0) -> dict:
+        """A recipient sends a DM to the bot."""
+        channel_id = self._dm_channel(user)["id"]
+        files = [
+            self._attachment(channel_id, name)
+            for name in ("screenshot.png", "log.txt", "photo.jpg")[:attachments]
+        ]
+        message = self._message(channel_id, user, content, attachments=files)
+        self.dispatch("MESSAGE_CREATE", message)
+        return message
+
+    def send_guild_message(self, user: dict, channel_id: str, content: str) -> dict:
+        """A staff member sends a message in a guild channel."""
+        message = self._message(channel_id, user, content)
+        self.dispatch("MESSAGE_CREATE", message)
+        return message
+
+    def edit(self, message: dict, content: str) -> dict:
+        message["content"] = content
+        message["edited_timestamp"] = _timestamp()
+        self.dispatch("MESSAGE_UPDATE", dict(message))
+        return message
+
+    def react(self, user: dict, channel_id: str, message_id: str, emoji: str = "👍") -> None:
+        data = {
+            "user_id": user["id"],
+            "channel_id": channel_id,
+            "message_id": message_id,
+            "emoji": {"id": None, "name": emoji},
+        }
+        if self._channels[channel_id]["type"] != 1:
+            data["guild_id"] = self.guild_id
+            data["member"] = self._members[user["id"]]
+        self.dispatch("MESSAGE_REACTION_ADD", data)
+
+    # REST
+
+    async def request(self, route: Route, *, files=None, form=None, **kwargs):
+        for pattern, method, handler in self._routes:
+            if method != route.method:
+                continue
+            match = pattern.match(route.url.split("?")[0])
+            if match is not None:
+                break
+        else:
+            self.unhandled[f"{route.method} {route.path}"] += 1
+            return None
+
+        self.calls[f"{route.method} {route.path}"] += 1
+        if self.rest_latency:
+            await asyncio.sleep(self.rest_latency)
+
+        body = kwargs.get("json")
+        if form:
+            # Uploads, the message itself is in payload_json
+            body = json.loads(next(f["value"] for f in form if f["name"] == "payload_json"))
+        params = kwargs.get("params") or {}
+        response = handler(body=body, params=params, files=files, **match.groupdict())
+        for observer in self.observers:
+            observer(route, match.groupdict(), body, response)
+        return response
+
+    def _later(self, event: str, data: dict) -> None:
+        # Gateway events of the bot's own actions arrive after the REST response,
+        # from the gateway's task rather than the context of the request.
+        self.bot.loop.call_soon(self.dispatch, event, data, context=contextvars.Context())
+
+    def no_content(self, **_):
+        return None
+
+    def create_message(self, *, channel_id, body, files, **_):
+        body = body or {}
+        attachments = [self._attachment(channel_id, file.filename) for file in files or ()]
+        embeds = body.get("embeds") or ([body["embed"]] if body.get("embed") else [])
+        content = body.get("content") or ""
+        message = self._message(
+            channel_id, self.user, content, embeds=embeds, attachments=attachments
+        )
+        self._later("MESSAGE_CREATE", message)
+        return message
+
+    def history(self, *, channel_id, params, **_):
+        messages = self._messages.get(channel_id, {}).values()
+        messages = sorted(messages, key=lambda m: int(m["id"]), reverse=True)
+        if "before" in params:
+            messages = [m for m in messages if int(m["id"]) < int(params["before"])]
+        if "after" in params:
+            messages = [m for m in messages if int(m["id"]) > int(params["after"])]
+        return messages[: int(params.get("limit", 50))]
+
+    def get_message(self, *, channel_id, message_id, **_):
+        return self._messages.get(channel_id, {}).get(message_id)
+
+    def edit_message(self, *, channel_id, message_id, body, **_):
+        message = self._messages[channel_id][message_id]
+        body = body or {}
+        if "content" in body:
+            message["content"] = body["content"] or ""
+        if "embed" in body:
+            message["embeds"] = [body["embed"]] if body["embed"] else []
+        message["edited_timestamp"] = _timestamp()
+        self._later("MESSAGE_UPDATE", dict(message))
+        return message
+
+    def delete_message(self, *, channel_id, message_id, **_):
+        message = self._messages.get(channel_id, {}).pop(message_id, None)
+        if message is not None:
+            data = {"id": message_id, "channel_id": channel_id}
+            if "guild_id" in message:
+                data["guild_id"] = message["guild_id"]
+            self._later("MESSAGE_DELETE", data)
+
+    def get_channel(self, *, channel_id, **_):
+        return self._channels.get(channel_id)
+
+    def create_channel(self, *, body, **_):
+        body = dict(body)
+        name = body.pop("name")
+        channel = self._channel(name, type_=body.pop("type", 0), **body)
+        self.dispatch("CHANNEL_CREATE", channel)
+        return channel
+
+    def edit_channel(self, *, channel_id, body, **_):
+        channel = self._channels[channel_id]
+        channel.update(body or {})
+        self.dispatch("CHANNEL_UPDATE", channel)
+        return channel
+
+    def delete_channel(self, *, channel_id, **_):
+        channel = self._channels.pop(channel_id)
+        self.dispatch("CHANNEL_DELETE", channel)
+        return channel
+
+    def audit_logs(self, **_):
+        return {"audit_log_entries": [], "users": [], "webhooks": [], "integrations": []}
+
+    def get_member(self, *, user_id, **_):
+        return self._members.get(user_id)
+
+    def application_info(self, **_):
+        return {
+            "id": self.user["id"],
+            "name": self.user["username"],
+            "icon": None,
+            "description": "",
+            "summary": "",
+            "verify_key": "",
+            "bot_public": False,
+            "bot_require_code_grant": False,
+            "owner": self._users[str(self.guild.owner_id)],
+        }
+
+    def start_private_message(self, *, body, **_):
+        return self._dm_channel(self._users[str(body["recipient_id"])])
+
+    def get_user(self, *, user_id, **_):
+        return self._users.get(user_id)
@@ -0,0 +1,117 @@
+"""
+Benchmarks the classification of message attachments, image links and stickers.
+
+Replays a synthetic corpus shaped like real Modmail traffic (mostly plain
+text, some links, screenshots and files) through `core.utils.classify_media`
+and through the former per-message implementation of `Thread.send`::
+
+    python -m bench.media --messages 20000
+"""
+
+import argparse
+import random
+import re
+import timeit
+from types import SimpleNamespace
+
+from core.utils import _image_url, classify_media, parse_image_url
+
+WORDS = "hello i need help with my account please someone answer thanks the a to is".split()
+LINKS = [
+    "https://example.com/some/page",
+    "https://cdn.discordapp.com/attachments/1/2/screenshot.png",
+    "https://i.imgur.com/mILuQ5U.png",
+    "https://gyazo.com/0123456789abcdef",
+    "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+    "http://example.org/image.JPG?width=200",
+]
+FILES = ["screenshot.png", "photo.jpg", "log.txt", "clip.mp4", "report.pdf", "meme.gif"]
+
+
+def make_corpus(size: int, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    corpus = []
+    for i in range(size):
+        words = rng.choices(WORDS, k=rng.randint(1, 40))
+        roll = rng.random()
+        attachments = []
+        stickers = []
+        if roll < 0.15:
+            words.insert(rng.randrange(len(words) + 1), rng.choice(LINKS))
+        elif roll < 0.25:
+            for n in range(rng.randint(1, 3)):
+                name = rng.choice(FILES)
+                url = f"https://cdn.discordapp.com/attachments/1/{i}{n}/{name}"
+                attachments.append(SimpleNamespace(url=url, filename=name))
+        elif roll < 0.27:
+            url = f"https://media.discordapp.net/stickers/{i}.png"
+            stickers.append(SimpleNamespace(name="wave", image_url=url))
+        corpus.append(
+            SimpleNamespace(content=" ".join(words), attachments=attachments, stickers=stickers)
+        )
+    return corpus
+
+
+def _legacy_is_image_url(url, **kwargs):
+    if url.startswith("https://gyazo.com") or url.startswith("http://gyazo.com"):
+        url = re.sub(
+            r"(http[s]?:\/\/)((?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*(),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+)",
+            r"\1i.\2.png",
+            url,
+        )
+    return parse_image_url(url, **kwargs)
+
+
+def legacy_classify(message):
+    ext = [(a.url, a.filename, False) for a in message.attachments]
+    images = []
+    attachments = []
+    for attachment in ext:
+        if _legacy_is_image_url(attachment[0]):
+            images.append(attachment)
+        else:
+            attachments.append(attachment)
+    image_urls = re.findall(
+        r"http[s]?:\/\/(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*(),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+",
+        message.content,
+    )
+    images.extend(
+        (_legacy_is_image_url(url, convert_size=False), None, False)
+        for url in image_urls
+        if _legacy_is_image_url(url, convert_size=False)
+    )
+    images.extend((i.image_url, f"{i.name} Sticker", True) for i in message.stickers)
+    prioritize_uploads = any(i[1] is not None for i in images)
+    for url, filename, _ in images:
+        if prioritize_uploads and url is not None and filename:
+            _legacy_is_image_url(url)
+    return images, attachments
+
+
+def run(corpus: list, repeat: int) -> None:
+    for name, function in (("legacy", legacy_classify), ("classify_media", classify_media)):
+
+        def bench():
+            # Attachment URLs are unique, don't let a warm cache flatter the numbers.
+            _image_url.cache_clear()
+            for message in corpus:
+                function(message)
+
+        best = min(timeit.repeat(bench, number=1, repeat=repeat))
+        print(
+            f"{name:>15}: {best * 1000:8.2f} ms for {len(corpus)} messages, "
+            f"{best / len(corpus) * 1e6:6.2f} us/message"
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m bench.media", description=__doc__)
+    parser.add_argument("--messages", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    run(make_corpus(args.messages, args.seed), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
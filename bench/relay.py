@@ -0,0 +1,294 @@
+"""
+Load test of the whole bot against a fake Discord and an in-memory database.
+
+Opens `--threads` threads, then replays synthetic traffic at `--rate`
+events per second for `--duration` seconds: DMs from the recipients
+(some with attachments), staff replies, edits of DMs and reactions on
+replies. Every event carries a marker so its relay is timed from the
+gateway event to the REST call that delivers it::
+
+    python -m bench.relay --threads 50 --rate 200 --duration 10
+
+Reports the throughput, the p50/p99 relay latency per event, the REST
+calls made and the memory allocated per event. ``--json`` writes the
+results to compare runs, e.g. before and after a change.
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import random
+import re
+import sys
+import time
+import tracemalloc
+import typing
+from collections import defaultdict
+
+from bench.fake import FakeDiscord, make_bot
+
+WORDS = "hello i need help with my account please someone answer thanks the a to is".split()
+MARKER = re.compile(r"bench-(\d+)")
+KINDS = ("open", "dm", "reply", "edit", "reaction")
+
+
+def percentile(values: list, q: float) -> float:
+    if not values:
+        return float("nan")
+    values = sorted(values)
+    return values[min(int(q * len(values)), len(values) - 1)]
+
+
+class Relay:
+    """Drives the traffic and times the relay of every event."""
+
+    def __init__(self, fake: FakeDiscord, *, seed: int = 0, timeout: float = 10):
+        self.fake = fake
+        self.rng = random.Random(seed)
+        self.timeout = timeout
+        self.latencies = defaultdict(list)
+        self.timeouts = defaultdict(int)
+        self.completed = 0
+
+        self._markers = 0
+        # marker -> (kind, expected channel ID or None for any guild channel, start, future)
+        self._pending = {}
+        self._threads = {}  # recipient ID -> thread channel ID
+        self._dms = defaultdict(list)  # recipient ID -> relayed DM message payloads
+        self._replies = defaultdict(list)  # recipient ID -> (thread message ID, DM message ID)
+        self._reply_dm = {}  # marker -> DM message ID
+        self._reactions = {}  # DM message ID -> (start, future)
+        fake.observers.append(self.observe)
+
+    def _words(self) -> str:
+        return " ".join(self.rng.choices(WORDS, k=self.rng.randint(1, 30)))
+
+    def _probe(self, kind: str, channel_id: str = None):
+        self._markers += 1
+        future = asyncio.get_running_loop().create_future()
+        self._pending[str(self._markers)] = (kind, channel_id, time.perf_counter(), future)
+        return f"bench-{self._markers}", future
+
+    def observe(self, route, params, body, response) -> None:
+        now = time.perf_counter()
+        channel_id = params.get("channel_id")
+
+        if route.method == "PUT" and "reactions" in route.path:
+            probe = self._reactions.pop(params["message_id"], None)
+            if probe is not None:
+                self._done("reaction", probe[0], probe[1], now)
+            return
+
+        if route.method not in {"POST", "PATCH"} or body is None or channel_id is None:
+            return
+        # Edits keep the former content, with its marker, in a field.
+        for marker in MARKER.findall(json.dumps(body)):
+            if marker in self._reply_dm and channel_id in self._threads.values():
+                # The thread channel copy of a reply, reactions on it are transferred.
+                recipient_id = next(r for r, c in self._threads.items() if c == channel_id)
+                self._replies[recipient_id].append((response["id"], self._reply_dm.pop(marker)))
+
+            probe = self._pending.get(marker)
+            if probe is None:
+                continue
+            kind, expected, start, future = probe
+            is_dm = self.fake._channels.get(channel_id, {}).get("type") == 1
+            if expected is None and is_dm or expected is not None and expected != channel_id:
+                continue
+            del self._pending[marker]
+            if kind == "reply":
+                self._reply_dm[marker] = response["id"]
+            self._done(kind, start, future, now)
+
+    def _done(self, kind: str, start: float, future: asyncio.Future, now: float) -> None:
+        self.latencies[kind].append(now - start)
+        self.completed += 1
+        if not future.done():
+            future.set_result(None)
+
+    async def _wait(self, kind: str, future: asyncio.Future) -> bool:
+        try:
+            await asyncio.wait_for(future, self.timeout)
+        except asyncio.TimeoutError:
+            self.timeouts[kind] += 1
+            return False
+        return True
+
+    async def open_thread(self, recipient: dict) -> None:
+        marker, future = self._probe("open")
+        message = self.fake.send_dm(recipient, f"{self._words()} {marker}")
+        if await self._wait("open", future):
+            thread = await self.fake.bot.threads.find(recipient_id=int(recipient["id"]))
+            await thread.wait_until_ready()
+            self._threads[recipient["id"]] = str(thread.channel.id)
+            self._dms[recipient["id"]].append(message)
+
+    async def dm(self, recipient: dict, attachments: int) -> None:
+        marker, future = self._probe("dm", self._threads[recipient["id"]])
+        content = f"{self._words()} {marker}"
+        message = self.fake.send_dm(recipient, content, attachments=attachments)
+        if await self._wait("dm", future):
+            self._dms[recipient["id"]].append(message)
+
+    async def reply(self, recipient: dict) -> None:
+        marker, future = self._probe("reply", self.fake.dm_channel_id(recipient))
+        staff = self.rng.choice(self.fake.staff)
+        channel_id = self._threads[recipient["id"]]
+        self.fake.send_guild_message(staff, channel_id, f"?reply {self._words()} {marker}")
+        await self._wait("reply", future)
+
+    async def edit(self, recipient: dict) -> None:
+        message = self.rng.choice(self._dms[recipient["id"]])
+        marker, future = self._probe("edit", self._threads[recipient["id"]])
+        self.fake.edit(message, f"{self._words()} {marker}")
+        await self._wait("edit", future)
+
+    async def reaction(self, recipient: dict) -> None:
+        thread_message_id, dm_message_id = self.rng.choice(self._replies[recipient["id"]])
+        future = asyncio.get_running_loop().create_future()
+        self._reactions[dm_message_id] = (time.perf_counter(), future)
+        staff = self.rng.choice(self.fake.staff)
+        self.fake.react(staff, self._threads[recipient["id"]], thread_message_id)
+        await self._wait("reaction", future)
+
+    def pick(self, args) -> typing.Awaitable[None]:
+        recipient = self.rng.choice([r for r in self.fake.recipients if r["id"] in self._threads])
+        roll = self.rng.random()
+        if roll < args.replies:
+            return self.reply(recipient)
+        roll -= args.replies
+        if roll < args.edits and self._dms[recipient["id"]]:
+            return self.edit(recipient)
+        roll -= args.edits
+        if roll < args.reactions and self._replies[recipient["id"]]:
+            return self.reaction(recipient)
+        attachments = self.rng.randint(1, 3) if self.rng.random() < args.attachments else 0
+        return self.dm(recipient, attachments)
+
+    async def run(self, args) -> float:
+        """Replays the traffic at a fixed rate, returns the time it took."""
+        events = int(args.rate * args.duration)
+        tasks = []
+        start = time.perf_counter()
+        for i in range(events):
+            delay = start + i / args.rate - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(asyncio.ensure_future(self.pick(args)))
+        await asyncio.gather(*tasks)
+        return time.perf_counter() - start
+
+
+async def bench(args) -> dict:
+    bot = make_bot(concurrent_reply_delivery=args.concurrent_replies)
+    fake = FakeDiscord(bot, rest_latency=args.rest_latency / 1000)
+    await fake.connect(staff=args.staff, recipients=args.threads)
+    relay = Relay(fake, seed=args.seed, timeout=args.timeout)
+
+    await asyncio.gather(*(relay.open_thread(r) for r in fake.recipients))
+    if not relay._threads:
+        raise RuntimeError("No thread could be opened, see the bot's log file.")
+    await asyncio.sleep(0.1)
+
+    opened = relay.completed
+    calls = sum(fake.calls.values())
+    gc.collect()
+    blocks = sys.getallocatedblocks()
+    if args.tracemalloc:
+        tracemalloc.start()
+    elapsed = await relay.run(args)
+    if args.tracemalloc:
+        allocated, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    blocks = sys.getallocatedblocks() - blocks
+
+    events = relay.completed - opened
+    results = {
+        "events": events,
+        "timeouts": sum(v for k, v in relay.timeouts.items() if k != "open"),
+        "seconds": elapsed,
+        "throughput": events / elapsed,
+        "rest_calls_per_event": (sum(fake.calls.values()) - calls) / max(events, 1),
+        "blocks_per_event": blocks / max(events, 1),
+        "latency": {
+            kind: {
+                "count": len(relay.latencies[kind]),
+                "timeouts": relay.timeouts[kind],
+                "p50": percentile(relay.latencies[kind], 0.5),
+                "p99": percentile(relay.latencies[kind], 0.99),
+                "max": max(relay.latencies[kind], default=float("nan")),
+            }
+            for kind in KINDS
+        },
+        "rest": dict(fake.calls.most_common()),
+        "unhandled": dict(fake.unhandled),
+    }
+    if args.tracemalloc:
+        results["allocated_bytes_per_event"] = allocated / max(events, 1)
+        results["peak_bytes"] = peak
+    return results
+
+
+def report(results: dict) -> None:
+    print(
+        f"{results['events']} events in {results['seconds']:.2f}s, "
+        f"{results['throughput']:.1f} events/s, {results['timeouts']} timed out"
+    )
+    print(f"{'event':>10} {'count':>7} {'timeouts':>9} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8}")
+    for kind, stats in results["latency"].items():
+        if not stats["count"] and not stats["timeouts"]:
+            continue
+        print(
+            f"{kind:>10} {stats['count']:>7} {stats['timeouts']:>9} {stats['p50'] * 1000:>8.2f}"
+            f" {stats['p99'] * 1000:>8.2f} {stats['max'] * 1000:>8.2f}"
+        )
+    print(f"REST calls per event: {results['rest_calls_per_event']:.2f}")
+    print(f"Allocated blocks per event (net): {results['blocks_per_event']:.0f}")
+    if "allocated_bytes_per_event" in results:
+        print(
+            f"Allocated bytes per event (net): {results['allocated_bytes_per_event']:.0f}, "
+            f"peak {results['peak_bytes'] / 1024:.0f} KiB"
+        )
+    for route, count in results["rest"].items():
+        print(f"{count:>8} {route}")
+    for route, count in results["unhandled"].items():
+        print(f"{count:>8} {route} (not handled by the fake Discord)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m bench.relay",
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--threads", type=int, default=20, help="concurrent threads")
+    parser.add_argument("--staff", type=int, default=3, help="staff members replying")
+    parser.add_argument("--rate", type=float, default=50, help="events per second")
+    parser.add_argument("--duration", type=float, default=5, help="seconds of traffic")
+    parser.add_argument("--replies", type=float, default=0.4, help="share of staff replies")
+    parser.add_argument("--edits", type=float, default=0.05, help="share of DM edits")
+    parser.add_argument("--reactions", type=float, default=0.05, help="share of reactions")
+    parser.add_argument(
+        "--attachments", type=float, default=0.1, help="share of DMs with attachments"
+    )
+    parser.add_argument("--rest-latency", type=float, default=0, help="REST latency in ms")
+    parser.add_argument("--concurrent-replies", action="store_true")
+    parser.add_argument(
+        "--timeout", type=float, default=10, help="seconds before an event is lost"
+    )
+    parser.add_argument("--tracemalloc", action="store_true", help="trace the allocated bytes")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", metavar="PATH", help="write the results to PATH")
+    args = parser.parse_args(argv)
+
+    loop = asyncio.get_event_loop()
+    results = loop.run_until_complete(bench(args))
+    report(results)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,10 @@
 __version__ = "3.8.4"
 
 
+from core.startup import profiler
+
+profiler.start()
+
 import asyncio
 import copy
 import logging
@@ -18,7 +22,6 @@ from aiohttp import ClientSession
 from discord.ext import commands, tasks
 from discord.ext.commands.view import StringView
 from emoji import UNICODE_EMOJI
-from pkg_resources import parse_version
 
 from core.utils import tryint
 
@@ -31,7 +34,9 @@ try:
 except ImportError:
     pass
 
-from core import checks
+from core import checks, ratelimits
+from core.attachments import AttachmentFetcher
+from core.audit_logs import AuditLogCache
 from core.changelog import Changelog
 from core.clients import ApiClient, MongoDBClient, PluginDatabaseClient
 from core.config import ConfigManager
@@ -46,9 +51,12 @@ from core.models import (
 )
 from core.thread import ThreadManager
 from core.time import human_timedelta
+from core.tracing import tracer
 from core.utils import human_join, normalize_alias, truncate
+from core.watchdog import LoopWatchdog, label_task
 
 logger = getLogger(__name__)
+profiler.mark("imports")
 
 temp_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "temp")
 if not os.path.exists(temp_dir):
@@ -66,24 +74,40 @@ class ModmailBot(commands.Bot):
         intents = discord.Intents.all()
         super().__init__(command_prefix=None, intents=intents)  # implemented in `get_prefix`
         self._session = None
+        self._attachment_fetcher = None
         self._api = None
         self.metadata_loop = None
         self.autoupdate_loop = None
+        self.archive_loop = None
+        self.metrics_server = None
         self.formatter = SafeFormatter()
         self.loaded_cogs = ["cogs.modmail", "cogs.plugins", "cogs.utility"]
+        # loaded once connected, their imports don't delay the login
+        self.deferred_cogs = {"cogs.plugins", "cogs.utility"}
         self._connected = asyncio.Event()
         self.start_time = datetime.utcnow()
+        ratelimits.install(self.http)
 
         self.config = ConfigManager(self)
         self.config.populate_cache()
 
         self.threads = ThreadManager(self)
+        self.audit_logs = AuditLogCache()
 
         self.log_file_name = os.path.join(temp_dir, f"{self.token.split('.')[0]}.log")
         self._configure_logging()
+        tracer.configure(self.config["trace_export"])
+        self.watchdog = LoopWatchdog(self._slow_callback_threshold())
 
         self.plugin_db = PluginDatabaseClient(self)  # Deprecated
         self.startup()
+        profiler.mark("initialized")
+
+    async def _run_event(self, coro, event_name, *args, **kwargs):
+        # Attributes the REST calls made while handling this event
+        ratelimits.origin.set(f"event:{event_name}")
+        label_task(f"event:{event_name}")
+        await super()._run_event(coro, event_name, *args, **kwargs)
 
     @property
     def uptime(self) -> str:
@@ -124,14 +148,22 @@ class ModmailBot(commands.Bot):
         logger.info("discord.py: v%s", discord.__version__)
         logger.line()
 
-        for cog in self.loaded_cogs:
+        self.load_cogs(cog for cog in self.loaded_cogs if cog not in self.deferred_cogs)
+        logger.line("debug")
+
+    def load_cogs(self, cogs: typing.Iterable[str]) -> None:
+        for cog in cogs:
+            if cog in self.extensions:
+                continue
             logger.debug("Loading %s.", cog)
             try:
                 self.load_extension(cog)
                 logger.debug("Successfully loaded %s.", cog)
             except Exception:
                 logger.exception("Failed to load %s.", cog)
-        logger.line("debug")
+
+    def load_deferred_cogs(self) -> None:
+        self.load_cogs(cog for cog in self.loaded_cogs if cog in self.deferred_cogs)
 
     def _configure_logging(self):
         level_text = self.config["log_level"].upper()
@@ -152,12 +184,34 @@ class ModmailBot(commands.Bot):
         else:
             logger.info("Logging level: %s", level_text)
 
+        rotation = {}
+        for key, default in (("log_max_bytes", 48000), ("log_backup_count", 1)):
+            try:
+                rotation[key] = max(int(self.config[key]), 0)
+            except (TypeError, ValueError):
+                logger.warning("Invalid %s set: %s.", key.upper(), self.config[key])
+                rotation[key] = default
+
+        log_format = str(self.config["log_format"]).lower()
+        if log_format not in {"text", "json"}:
+            logger.warning("Invalid LOG_FORMAT set: %s, using text.", log_format)
+            log_format = "text"
+
         logger.info("Log file: %s", self.log_file_name)
-        configure_logging(self.log_file_name, log_level)
+        configure_logging(
+            self.log_file_name,
+            log_level,
+            max_bytes=rotation["log_max_bytes"],
+            backup_count=rotation["log_backup_count"],
+            json_format=log_format == "json",
+        )
         logger.debug("Successfully configured logging.")
 
     @property
     def version(self):
+        # pkg_resources takes long to import, it's imported once the bot is up.
+        from pkg_resources import parse_version
+
         return parse_version(__version__)
 
     @property
@@ -166,6 +220,12 @@ class ModmailBot(commands.Bot):
             self._session = ClientSession(loop=self.loop)
         return self._session
 
+    @property
+    def attachment_fetcher(self) -> AttachmentFetcher:
+        if self._attachment_fetcher is None:
+            self._attachment_fetcher = AttachmentFetcher(self.session)
+        return self._attachment_fetcher
+
     @property
     def api(self) -> ApiClient:
         if self._api is None:
@@ -184,6 +244,37 @@ class ModmailBot(commands.Bot):
     async def get_prefix(self, message=None):
         return [self.prefix, f"<@{self.user.id}> ", f"<@!{self.user.id}> "]
 
+    def _slow_callback_threshold(self) -> float:
+        threshold = self.config["slow_callback_threshold"]
+        try:
+            return max(float(threshold), 0)
+        except (TypeError, ValueError):
+            logger.warning("Invalid SLOW_CALLBACK_THRESHOLD %r, using 0.25.", threshold)
+            return 0.25
+
+    async def start(self, *args, **kwargs):
+        self.watchdog.start()
+        port = self.config["metrics_port"]
+        if port is not None and self.metrics_server is None:
+            # aiohttp's server is only imported when the metrics are served.
+            from core.metrics_server import MetricsServer
+
+            try:
+                server = MetricsServer(self, self.config["metrics_host"], int(port))
+                await server.start()
+            except (ValueError, OSError) as e:
+                logger.error("Failed to serve the metrics on port %s: %s", port, e)
+            else:
+                self.metrics_server = server
+        await super().start(*args, **kwargs)
+
+    async def close(self):
+        if self.metrics_server is not None:
+            await self.metrics_server.stop()
+            self.metrics_server = None
+        self.watchdog.stop()
+        await super().close()
+
     def run(self, *args, **kwargs):
         try:
             self.loop.run_until_complete(self.start(self.token))
@@ -454,8 +545,12 @@ class ModmailBot(commands.Bot):
             return await self.logout()
 
         logger.debug("Connected to gateway.")
+        if not profiler.finished:
+            profiler.mark("connected")
         await self.config.refresh()
         await self.api.setup_indexes()
+        # Before the bot is ready, so the plugins' on_ready listeners run.
+        self.load_deferred_cogs()
         self._connected.set()
 
     async def on_ready(self):
@@ -485,6 +580,8 @@ class ModmailBot(commands.Bot):
         logger.line()
 
         await self.threads.populate_cache()
+        if not profiler.finished:
+            profiler.mark("threads cached")
 
         # closures
         closures = self.config["closures"]
@@ -564,6 +661,19 @@ class ModmailBot(commands.Bot):
         self.autoupdate_loop.before_loop(self.before_autoupdate)
         self.autoupdate_loop.start()
 
+        if self.config.get("log_archive_after") != isodate.Duration():
+            self.archive_loop = tasks.Loop(
+                self.archive_logs,
+                seconds=0,
+                minutes=0,
+                hours=1,
+                count=None,
+                reconnect=True,
+                loop=None,
+            )
+            self.archive_loop.before_loop(self.wait_for_connected)
+            self.archive_loop.start()
+
         other_guilds = [
             guild for guild in self.guilds if guild not in {self.guild, self.modmail_guild}
         ]
@@ -575,6 +685,12 @@ class ModmailBot(commands.Bot):
             )
             logger.warning("If the external servers are valid, you may ignore this message.")
 
+        if not profiler.finished:
+            profiler.mark("ready")
+            profiler.stop()
+            logger.info("Started in %.2fs.", profiler.elapsed())
+            logger.info("Startup profile:\n%s", profiler.report())
+
     async def convert_emoji(self, name: str) -> str:
         ctx = SimpleNamespace(bot=self, guild=self.modmail_guild)
         converter = commands.EmojiConverter()
@@ -827,17 +943,21 @@ class ModmailBot(commands.Bot):
 
     async def process_dm_modmail(self, message: discord.Message) -> None:
         """Processes messages sent to the bot."""
-        blocked = await self._process_blocked(message)
+        with tracer.span("blocked"):
+            blocked = await self._process_blocked(message)
         if blocked:
             return
-        sent_emoji, blocked_emoji = await self.retrieve_emoji()
+        with tracer.span("emoji"):
+            sent_emoji, blocked_emoji = await self.retrieve_emoji()
 
         if message.type != discord.MessageType.default:
             return
 
-        thread = await self.threads.find(recipient=message.author)
+        with tracer.span("find_thread"):
+            thread = await self.threads.find(recipient=message.author)
         if thread is None:
-            delta = await self.get_thread_cooldown(message.author)
+            with tracer.span("cooldown"):
+                delta = await self.get_thread_cooldown(message.author)
             if delta:
                 await message.channel.send(
                     embed=discord.Embed(
@@ -863,7 +983,8 @@ class ModmailBot(commands.Bot):
                 await self.add_reaction(message, blocked_emoji)
                 return await message.channel.send(embed=embed)
 
-            thread = await self.threads.create(message.author, message=message)
+            with tracer.span("create_thread"):
+                thread = await self.threads.create(message.author, message=message)
         else:
             if self.config["dm_disabled"] == DMDisabled.ALL_THREADS:
                 embed = discord.Embed(
@@ -883,12 +1004,14 @@ class ModmailBot(commands.Bot):
 
         if not thread.cancelled:
             try:
-                await thread.send(message)
+                with tracer.span("send"):
+                    await thread.send(message)
             except Exception:
                 logger.error("Failed to send message:", exc_info=True)
                 await self.add_reaction(message, blocked_emoji)
             else:
-                await self.add_reaction(message, sent_emoji)
+                with tracer.span("add_reaction"):
+                    await self.add_reaction(message, sent_emoji)
                 self.dispatch("thread_reply", thread, False, message, False, False)
 
     async def get_contexts(self, message, *, cls=commands.Context):
@@ -1046,30 +1169,35 @@ class ModmailBot(commands.Bot):
         await self.config.update()
 
     async def on_message(self, message):
-        await self.wait_for_connected()
-        if message.type == discord.MessageType.pins_add and message.author == self.user:
-            await message.delete()
-
-        if (
-            (f"<@{self.user.id}" in message.content or f"<@!{self.user.id}" in message.content)
-            and self.config["alert_on_mention"]
-            and not message.author.bot
+        relay = isinstance(message.channel, discord.DMChannel) and not message.author.bot
+        with tracer.trace(
+            "dm_relay", enabled=relay, message_id=message.id, user_id=message.author.id
         ):
-            em = discord.Embed(
-                title="Bot mention",
-                description=f"[Jump URL]({message.jump_url})\n{truncate(message.content, 50)}",
-                color=self.main_color,
-            )
-            if self.config["show_timestamp"]:
-                em.timestamp = datetime.utcnow()
+            with tracer.span("connected"):
+                await self.wait_for_connected()
+            if message.type == discord.MessageType.pins_add and message.author == self.user:
+                await message.delete()
 
-            if not self.config["silent_alert_on_mention"]:
-                content = self.config["mention"]
-            else:
-                content = ""
-            await self.mention_channel.send(content=content, embed=em)
+            if (
+                (f"<@{self.user.id}" in message.content or f"<@!{self.user.id}" in message.content)
+                and self.config["alert_on_mention"]
+                and not message.author.bot
+            ):
+                em = discord.Embed(
+                    title="Bot mention",
+                    description=f"[Jump URL]({message.jump_url})\n{truncate(message.content, 50)}",
+                    color=self.main_color,
+                )
+                if self.config["show_timestamp"]:
+                    em.timestamp = datetime.utcnow()
+
+                if not self.config["silent_alert_on_mention"]:
+                    content = self.config["mention"]
+                else:
+                    content = ""
+                await self.mention_channel.send(content=content, embed=em)
 
-        await self.process_commands(message)
+            await self.process_commands(message)
 
     async def process_commands(self, message):
         if message.author.bot:
@@ -1101,6 +1229,8 @@ class ModmailBot(commands.Bot):
                     )
                     checks.has_permissions(PermissionLevel.INVALID)(ctx.command)
 
+                ratelimits.origin.set(f"command:{ctx.command.qualified_name}")
+                label_task(f"command:{ctx.command.qualified_name}")
                 await self.invoke(ctx)
                 continue
 
@@ -1140,7 +1270,7 @@ class ModmailBot(commands.Bot):
             thread = await self.threads.find(recipient=user)
 
             if thread:
-                await thread.channel.trigger_typing()
+                await self.threads.typing.trigger(thread.channel)
         else:
             if not self.config.get("mod_typing"):
                 return
@@ -1149,44 +1279,77 @@ class ModmailBot(commands.Bot):
             if thread is not None and thread.recipient:
                 if await self.is_blocked(thread.recipient):
                     return
-                await thread.recipient.trigger_typing()
+                await self.threads.typing.trigger(thread.recipient)
 
     async def handle_reaction_events(self, payload):
         user = self.get_user(payload.user_id)
         if user is None or user.bot:
             return
 
-        channel = self.get_channel(payload.channel_id)
-        if not channel:  # dm channel not in internal cache
-            _thread = await self.threads.find(recipient=user)
-            if not _thread:
-                return
-            channel = await _thread.recipient.create_dm()
-
-        try:
-            message = await channel.fetch_message(payload.message_id)
-        except (discord.NotFound, discord.Forbidden):
-            return
-
         reaction = payload.emoji
+        transfer = self.config["transfer_reactions"]
 
-        close_emoji = await self.convert_emoji(self.config["close_emoji"])
-
-        if isinstance(channel, discord.DMChannel):
+        # Drop reactions unrelated to threads before making any request.
+        if payload.guild_id is None:
+            # Only the recipient can react in their DM channel
             thread = await self.threads.find(recipient=user)
             if not thread:
                 return
-            if (
+            close_emoji = await self.convert_emoji(self.config["close_emoji"])
+            closing = (
                 payload.event_type == "REACTION_ADD"
-                and message.embeds
                 and str(reaction) == str(close_emoji)
                 and self.config.get("recipient_thread_close")
+            )
+            if not transfer and not closing:
+                return
+            channel = self.get_channel(payload.channel_id)
+            if not channel:  # dm channel not in internal cache
+                channel = thread.recipient.dm_channel or await thread.recipient.create_dm()
+        else:
+            if (
+                not transfer
+                or self.modmail_guild is None
+                or payload.guild_id != self.modmail_guild.id
             ):
-                ts = message.embeds[0].timestamp
-                if thread and ts == thread.channel.created_at:
-                    # the reacted message is the corresponding thread creation embed
-                    # closing thread
-                    return await thread.close(closer=user)
+                return
+            channel = self.get_channel(payload.channel_id)
+            if not isinstance(channel, discord.TextChannel):
+                return
+            thread = await self.threads.find(channel=channel)
+            if not thread:
+                return
+            closing = False
+
+        linked_id = self.threads.links.get(payload.message_id)
+
+        message = None
+        if closing or linked_id is None:
+            message = self._connection._get_message(payload.message_id)
+            if message is None:
+                try:
+                    message = await channel.fetch_message(payload.message_id)
+                except (discord.NotFound, discord.Forbidden):
+                    return
+
+        if closing and message.embeds:
+            ts = message.embeds[0].timestamp
+            if ts == thread.channel.created_at:
+                # the reacted message is the corresponding thread creation embed
+                # closing thread
+                return await thread.close(closer=user)
+        if not transfer:
+            return
+
+        if linked_id is not None:
+            if isinstance(channel, discord.DMChannel):
+                linked_message = thread.channel.get_partial_message(linked_id)
+            else:
+                dm_channel = thread.recipient.dm_channel or await thread.recipient.create_dm()
+                linked_message = dm_channel.get_partial_message(linked_id)
+            if message is None:
+                message = channel.get_partial_message(payload.message_id)
+        elif isinstance(channel, discord.DMChannel):
             if not thread.recipient.dm_channel:
                 await thread.recipient.create_dm()
             try:
@@ -1197,9 +1360,6 @@ class ModmailBot(commands.Bot):
                 logger.warning("Failed to find linked message for reactions: %s", e)
                 return
         else:
-            thread = await self.threads.find(channel=channel)
-            if not thread:
-                return
             try:
                 _, linked_message = await thread.find_linked_messages(
                     message.id, either_direction=True
@@ -1208,7 +1368,8 @@ class ModmailBot(commands.Bot):
                 logger.warning("Failed to find linked message for reactions: %s", e)
                 return
 
-        if self.config["transfer_reactions"] and linked_message is not None:
+        if linked_message is not None:
+            self.threads.links.add(message.id, linked_message.id)
             if payload.event_type == "REACTION_ADD":
                 if await self.add_reaction(linked_message, reaction):
                     await self.add_reaction(message, reaction)
@@ -1250,10 +1411,30 @@ class ModmailBot(commands.Bot):
         if self.config["transfer_reactions"]:
             await self.handle_reaction_events(payload)
 
+    async def on_guild_channel_create(self, channel):
+        if channel.guild != self.modmail_guild:
+            return
+
+        self.threads.categories.track(channel)
+        if isinstance(channel, discord.TextChannel):
+            self.threads.names.track(channel)
+
+    async def on_guild_channel_update(self, before, after):
+        if after.guild != self.modmail_guild:
+            return
+
+        if before.category_id != after.category_id:
+            self.threads.categories.track(after)
+        if isinstance(after, discord.TextChannel) and before.name != after.name:
+            self.threads.names.track(after)
+
     async def on_guild_channel_delete(self, channel):
         if channel.guild != self.modmail_guild:
             return
 
+        self.threads.names.untrack(channel)
+        self.threads.categories.untrack(channel)
+
         if isinstance(channel, discord.CategoryChannel):
             if self.main_category == channel:
                 logger.debug("Main category was deleted.")
@@ -1270,10 +1451,11 @@ class ModmailBot(commands.Bot):
             await self.config.update()
             return
 
-        audit_logs = self.modmail_guild.audit_logs(
-            limit=10, action=discord.AuditLogAction.channel_delete
+        entry = await self.audit_logs.find(
+            self.modmail_guild,
+            discord.AuditLogAction.channel_delete,
+            lambda a: int(a.target.id) == channel.id,
         )
-        entry = await audit_logs.find(lambda a: int(a.target.id) == channel.id)
 
         if entry is None:
             logger.debug("Cannot find the audit log entry for channel delete of %d.", channel.id)
@@ -1345,15 +1527,18 @@ class ModmailBot(commands.Bot):
         if not thread:
             return
 
-        audit_logs = self.modmail_guild.audit_logs(
-            limit=10, action=discord.AuditLogAction.message_delete
+        entry = await self.audit_logs.find(
+            self.modmail_guild,
+            discord.AuditLogAction.message_delete,
+            lambda a: a.target == self.user,
         )
 
-        entry = await audit_logs.find(lambda a: a.target == self.user)
-
         if entry is None:
             return
 
+        await self._delete_linked_message(thread, message)
+
+    async def _delete_linked_message(self, thread, message):
         try:
             await thread.delete_message(message, note=False)
             embed = discord.Embed(
@@ -1373,7 +1558,25 @@ class ModmailBot(commands.Bot):
         return await message.channel.send(embed=embed)
 
     async def on_bulk_message_delete(self, messages):
-        await discord.utils.async_all(self.on_message_delete(msg) for msg in messages)
+        # Bulk deletes only happen in guild channels, and all in the same channel.
+        messages = [m for m in messages if m.author == self.user and not m.is_system()]
+        if not messages:
+            return
+
+        thread = await self.threads.find(channel=messages[0].channel)
+        if not thread:
+            return
+
+        entry = await self.audit_logs.find(
+            self.modmail_guild,
+            discord.AuditLogAction.message_delete,
+            lambda a: a.target == self.user,
+        )
+
+        if entry is None:
+            return
+
+        await discord.utils.async_all(self._delete_linked_message(thread, msg) for msg in messages)
 
     async def on_message_edit(self, before, after):
         if after.author.bot:
@@ -1485,7 +1688,25 @@ class ModmailBot(commands.Bot):
         if not self.guild:
             self.metadata_loop.cancel()
 
+    async def archive_logs(self):
+        before = datetime.utcnow() - self.config.get("log_archive_after")
+        total = 0
+        while True:
+            count = await self.api.archive_closed_logs(before, limit=100)
+            if count is NotImplemented:
+                logger.warning("Log archiving is not supported by this database.")
+                return self.archive_loop.cancel()
+            total += count
+            if count < 100:
+                break
+            # let the message relaying catch up between batches
+            await asyncio.sleep(1)
+        if total:
+            logger.info("Archived %d closed log(s).", total)
+
     async def autoupdate(self):
+        from pkg_resources import parse_version
+
         changelog = await Changelog.from_url(self)
         latest = changelog.latest_version
 
@@ -1,7 +1,8 @@
 import asyncio
+import os
 from operator import truediv
 import re
-from datetime import datetime
+from datetime import datetime, timedelta
 from itertools import zip_longest
 from typing import Optional, Union
 from types import SimpleNamespace
@@ -16,6 +17,8 @@ from dateutil import parser
 from natural.date import duration
 
 from core import checks
+from core.backup import build_log_query, export_collection, open_ndjson
+from core.clients import zstandard
 from core.models import DMDisabled, PermissionLevel, SimilarCategoryConverter, getLogger
 from core.paginator import EmbedPaginatorSession
 from core.thread import Thread
@@ -798,6 +801,140 @@ class Modmail(commands.Cog):
         session = EmbedPaginatorSession(ctx, *embeds)
         await session.run()
 
+    @logs.command(name="export", usage="[days] [recipient:<user>] [closer:<user>]")
+    @checks.has_permissions(PermissionLevel.OWNER)
+    async def logs_export(self, ctx, days: Optional[int] = None, *, filters: str = ""):
+        """
+        Exports logs as a NDJSON file.
+
+        Provide `days` to only export the logs created in the last number of days.
+        Filter by recipient or closer with `recipient:<user>` and `closer:<user>`.
+
+        The file is uploaded here when small enough, otherwise it is kept in the
+        bot's `temp/exports` folder. For large exports, use `python -m core.backup`.
+        """
+        options = {}
+        for token in filters.split():
+            name, sep, value = token.partition(":")
+            if not sep or name.lower() not in {"recipient", "closer"}:
+                raise commands.BadArgument(f"Unknown filter `{token}`.")
+            options[name.lower()] = (await User().convert(ctx, value)).id
+
+        if days is not None:
+            options["since"] = datetime.utcnow() - timedelta(days=days)
+        query = build_log_query(guild=self.bot.guild_id, **options)
+
+        export_dir = os.path.join(
+            os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "temp", "exports"
+        )
+        os.makedirs(export_dir, exist_ok=True)
+        ext = ".ndjson.zst" if zstandard is not None else ".ndjson.gz"
+        path = os.path.join(export_dir, f"logs-{datetime.utcnow():%Y%m%d-%H%M%S}{ext}")
+
+        async with ctx.typing():
+            with open_ndjson(path, "w") as fp:
+                count = await export_collection(self.bot.api.db, "logs", fp, query)
+
+        embed = discord.Embed(color=self.bot.main_color, description=f"Exported {count} log(s).")
+        limit = ctx.guild.filesize_limit if ctx.guild is not None else 8 * 1024 * 1024
+        if os.path.getsize(path) <= limit:
+            await ctx.send(embed=embed, file=discord.File(path))
+            os.remove(path)
+        else:
+            embed.description += f"\nThe file is too large to upload, it was saved to `{path}`."
+            await ctx.send(embed=embed)
+
+    @commands.group(invoke_without_command=True)
+    @checks.has_permissions(PermissionLevel.MODERATOR)
+    async def stats(self, ctx, days: int = 7):
+        """
+        Shows ticket statistics for the last number of days.
+
+        Reports the tickets opened and closed, the median time
+        until the first staff reply, the most active staff members
+        and the busiest hours (UTC). Defaults to the last 7 days.
+        """
+        if not 1 <= days <= 3660:
+            raise commands.BadArgument("`days` must be between 1 and 3660.")
+
+        async with ctx.typing():
+            stats = await self.bot.api.get_stats(days)
+        if stats is NotImplemented:
+            embed = discord.Embed(
+                color=self.bot.error_color,
+                description="Statistics are not available with this database.",
+            )
+            return await ctx.send(embed=embed)
+
+        embed = discord.Embed(
+            title=f"Ticket statistics, last {days} day(s)", color=self.bot.main_color
+        )
+        embed.add_field(name="Opened", value=str(stats["opened"]))
+        embed.add_field(name="Closed", value=str(stats["closed"]))
+
+        if stats["median_response"] is not None:
+            now = datetime.utcnow()
+            response = human_timedelta(
+                now + timedelta(seconds=stats["median_response"]), source=now
+            )
+            embed.add_field(
+                name="Median first response",
+                value=f"{response} ({stats['responses']} ticket(s) answered)",
+                inline=False,
+            )
+        else:
+            embed.add_field(name="Median first response", value="No replies yet.", inline=False)
+
+        mods = sorted(stats["replies"].items(), key=lambda m: m[1]["count"], reverse=True)
+        if mods:
+            embed.add_field(
+                name="Top responders",
+                value="\n".join(
+                    f"<@{mod_id}> - {mod['count']} repl{'y' if mod['count'] == 1 else 'ies'}"
+                    for mod_id, mod in mods[:5]
+                ),
+                inline=False,
+            )
+
+        hours = sorted(range(24), key=lambda h: stats["hours"][h], reverse=True)
+        busiest = [f"{h:02d}:00 ({stats['hours'][h]})" for h in hours[:3] if stats["hours"][h]]
+        if busiest:
+            embed.add_field(name="Busiest hours (UTC)", value=", ".join(busiest), inline=False)
+
+        embed.set_footer(text=f"Use {self.bot.prefix}stats mods {days} for every staff member.")
+        await ctx.send(embed=embed)
+
+    @stats.command(name="mods", aliases=["staff"])
+    @checks.has_permissions(PermissionLevel.MODERATOR)
+    async def stats_mods(self, ctx, days: int = 7):
+        """Shows the replies sent by each staff member in the last number of days."""
+        if not 1 <= days <= 3660:
+            raise commands.BadArgument("`days` must be between 1 and 3660.")
+
+        async with ctx.typing():
+            stats = await self.bot.api.get_stats(days)
+        if stats is NotImplemented or not stats["replies"]:
+            embed = discord.Embed(
+                color=self.bot.error_color, description="No staff replies in this period."
+            )
+            return await ctx.send(embed=embed)
+
+        mods = sorted(stats["replies"].items(), key=lambda m: m[1]["count"], reverse=True)
+        embeds = []
+        for i in range(0, len(mods), 15):
+            embed = discord.Embed(
+                title=f"Staff replies, last {days} day(s)",
+                color=self.bot.main_color,
+                description="\n".join(
+                    f"`{n}.` <@{mod_id}> ({escape_markdown(mod['name'] or '')}) - {mod['count']}"
+                    for n, (mod_id, mod) in enumerate(mods[i : i + 15], start=i + 1)
+                ),
+            )
+            embeds.append(embed)
+
+        session = EmbedPaginatorSession(ctx, *embeds)
+        await session.run()
+
     @commands.command()
     @checks.has_permissions(PermissionLevel.SUPPORTER)
     @checks.thread_only()
@@ -1461,7 +1598,7 @@ class Modmail(commands.Cog):
             )
             if len(users) == 1:
                 user = users.pop()
-                name = format_channel_name(
+                name = self.bot.threads.names.reserve(
                     user, self.bot.modmail_guild, exclude_channel=ctx.channel
                 )
                 recipient = self.bot.get_user(user.id)
@@ -1491,9 +1628,13 @@ class Modmail(commands.Cog):
                     )
                 thread.ready = True
                 logger.info("Setting current channel's topic to User ID and created new thread.")
-                await ctx.channel.edit(
-                    reason="Fix broken Modmail thread", name=name, topic=f"User ID: {user.id}"
-                )
+                try:
+                    await ctx.channel.edit(
+                        reason="Fix broken Modmail thread", name=name, topic=f"User ID: {user.id}"
+                    )
+                finally:
+                    self.bot.threads.names.track(ctx.channel)
+                    self.bot.threads.names.release(name)
                 return await self.bot.add_reaction(ctx.message, sent_emoji)
 
             elif len(users) >= 2:
@@ -1,26 +1,30 @@
 import asyncio
-import io
+import hashlib
 import json
 import os
 import shutil
 import sys
+import time
 import typing
 import zipfile
+from collections import defaultdict
 from importlib import invalidate_caches
 from difflib import get_close_matches
 from pathlib import Path, PurePath
-from re import match
+from re import fullmatch, match
 from site import USER_SITE
 from subprocess import PIPE
 
 import discord
+from aiohttp import ClientError
 from discord.ext import commands
 
-from pkg_resources import parse_version
+from pkg_resources import Requirement, ResolutionError, WorkingSet, parse_version
 
 from core import checks
 from core.models import PermissionLevel, getLogger
 from core.paginator import EmbedPaginatorSession
+from core.startup import profiler
 from core.utils import truncate, trigger_typing
 
 logger = getLogger(__name__)
@@ -49,13 +53,25 @@ class Plugin:
 
     @property
     def cache_path(self):
+        return self.archive_path(self.branch)
+
+    def archive_path(self, ref):
+        """The cached archive of the repository at `ref`, a branch or a commit sha."""
         return (
             Path(__file__).absolute().parent.parent
             / "temp"
             / "plugins-cache"
-            / f"{self.user}-{self.repo}-{self.branch}.zip"
+            / f"{self.user}-{self.repo}-{ref}.zip"
         )
 
+    def archive_url(self, ref):
+        return f"https://github.com/{self.user}/{self.repo}/archive/{ref}.zip"
+
+    @property
+    def commit_path(self):
+        # holds the sha of the commit the files were extracted from
+        return self.abs_path / ".commit"
+
     @property
     def ext_string(self):
         return f"plugins.{self.user}.{self.repo}.{self.name}-{self.branch}.{self.name}"
@@ -86,6 +102,187 @@ class Plugin:
         return isinstance(other, Plugin) and self.__str__() == other.__str__()
 
 
+class PluginRequirements:
+    """
+    Installs the requirements of the plugins into the bot's environment.
+
+    Every requirement is built into a local wheel cache, then installed
+    from it, so they can be installed again offline. The hash of each
+    plugin's requirements.txt is recorded once installed: its requirements
+    are installed again only when the file changes, or when they are no
+    longer satisfied.
+
+    Parameters
+    ----------
+    path : Path
+        The directory of the wheel cache and of the record of installations.
+    """
+
+    def __init__(self, path):
+        self.wheels_path = path / "wheels"
+        self.record_path = path / "installed.json"
+        # ext_string -> sha256 of the requirements.txt installed
+        self._installed = None
+        # The packages imported by the bot itself, they can't be replaced while it runs.
+        self._bot_packages = frozenset(name.partition(".")[0] for name in list(sys.modules))
+
+    @staticmethod
+    def read(plugin):
+        try:
+            return (plugin.abs_path / "requirements.txt").read_text()
+        except FileNotFoundError:
+            return None
+
+    @staticmethod
+    def digest(text):
+        return hashlib.sha256(text.encode()).hexdigest()
+
+    @staticmethod
+    def parse(text):
+        """The requirements of a requirements.txt, without its options and URLs."""
+        requirements = []
+        for line in text.splitlines():
+            line = line.split(" #", 1)[0].strip()
+            if not line or line.startswith(("#", "-")):
+                continue
+            try:
+                requirements.append(Requirement.parse(line))
+            except ValueError:
+                logger.debug("Not checking requirement %r.", line)
+        return requirements
+
+    def _record(self):
+        if self._installed is None:
+            try:
+                with self.record_path.open() as f:
+                    self._installed = json.load(f)
+            except (OSError, ValueError):
+                self._installed = {}
+        return self._installed
+
+    def record(self, plugins):
+        """Records the requirements of the plugins as installed."""
+        installed = self._record()
+        for plugin, text in plugins.items():
+            installed[plugin.ext_string] = self.digest(text)
+        self.record_path.parent.mkdir(parents=True, exist_ok=True)
+        partial = self.record_path.with_suffix(".part")
+        with partial.open("w") as f:
+            json.dump(installed, f, indent=4)
+        os.replace(partial, self.record_path)
+
+    def pending(self, plugins):
+        """
+        The plugins whose requirements have to be installed.
+
+        Returns
+        -------
+        Dict[Plugin, str]
+            The plugins, with the contents of their requirements.txt.
+        """
+        installed = self._record()
+        working_set = None
+        pending = {}
+        for plugin in plugins:
+            text = self.read(plugin)
+            if text is None:
+                continue
+            if installed.get(plugin.ext_string) == self.digest(text):
+                if working_set is None:
+                    working_set = WorkingSet()
+                try:
+                    working_set.resolve(self.parse(text))
+                except ResolutionError:
+                    logger.debug("The requirements of %s are no longer satisfied.", plugin)
+                else:
+                    continue
+            pending[plugin] = text
+        return pending
+
+    def conflicts(self, plugins, pending):
+        """
+        The requirements of the `pending` plugins that conflict.
+
+        The requirements conflict with the requirements of the other
+        `plugins` when they pin different versions of a package, and with
+        the bot when they need another version of a package it imported.
+        Pip reports the other conflicts when installing.
+
+        Returns
+        -------
+        List[str]
+            The conflicts, described.
+        """
+        by_project = defaultdict(list)
+        for plugin in plugins:
+            text = pending[plugin] if plugin in pending else self.read(plugin)
+            for requirement in self.parse(text or ""):
+                by_project[requirement.key].append((plugin, requirement))
+
+        working_set = WorkingSet()
+        conflicts = []
+        for key, requirements in by_project.items():
+            for i, (plugin, requirement) in enumerate(requirements):
+                pins = [v for op, v in requirement.specs if op == "==" and "*" not in v]
+                for other, other_requirement in requirements[i + 1 :]:
+                    if other == plugin or (plugin not in pending and other not in pending):
+                        continue
+                    other_pins = [
+                        v for op, v in other_requirement.specs if op == "==" and "*" not in v
+                    ]
+                    if any(v not in other_requirement for v in pins) or any(
+                        v not in requirement for v in other_pins
+                    ):
+                        conflicts.append(
+                            f"{plugin.name} requires {requirement}, "
+                            f"{other.name} requires {other_requirement}."
+                        )
+
+            dist = working_set.by_key.get(key)
+            if dist is None or not self._imported_by_bot(dist):
+                continue
+            for plugin, requirement in requirements:
+                if plugin in pending and dist not in requirement:
+                    conflicts.append(f"{plugin.name} requires {requirement}, the bot uses {dist}.")
+        return conflicts
+
+    def _imported_by_bot(self, dist):
+        packages = list(dist.get_metadata_lines("top_level.txt")) or [
+            dist.project_name.replace("-", "_")
+        ]
+        return any(package in self._bot_packages for package in packages)
+
+    async def _pip(self, *args):
+        proc = await asyncio.create_subprocess_exec(
+            sys.executable, "-m", "pip", *args, "-q", "-q", stderr=PIPE, stdout=PIPE
+        )
+        stdout, stderr = await proc.communicate()
+        if stdout:
+            logger.debug("[stdout]\n%s.", stdout.decode())
+        if stderr:
+            logger.debug("[stderr]\n%s.", stderr.decode())
+        return proc.returncode, stderr.decode()
+
+    async def install(self, pending):
+        """Builds the requirements of the `pending` plugins into the cache, and installs them."""
+        files = []
+        for plugin in pending:
+            files += ["-r", str(plugin.abs_path / "requirements.txt")]
+        cache = ["--find-links", str(self.wheels_path)]
+
+        code, _ = await self._pip("wheel", "--wheel-dir", str(self.wheels_path), *cache, *files)
+        if code != 0:
+            logger.warning("Failed to build the requirements, installing them from the cache.")
+
+        venv = hasattr(sys, "real_prefix") or hasattr(sys, "base_prefix")  # in a virtual env
+        user_install = ["--user"] if not venv else []
+        code, stderr = await self._pip(
+            "install", "--upgrade", *user_install, "--no-index", *cache, *files
+        )
+        if code != 0:
+            raise InvalidPluginError(f"Unable to download requirements: ```\n{stderr}\n```")
+
+
 class Plugins(commands.Cog):
     """
     Plugins expand Modmail functionality by allowing third-party addons.
@@ -96,11 +293,21 @@ class Plugins(commands.Cog):
     https://github.com/kyb3r/modmail/wiki/Plugins
     """
 
+    # seconds the last commit of a branch is cached
+    COMMIT_TTL = 60
+
     def __init__(self, bot):
         self.bot = bot
         self.registry = {}
         self.loaded_plugins = set()
         self._ready_event = asyncio.Event()
+        # (user, repo, branch) -> (time resolved, task resolving the last commit)
+        self._commits = {}
+        # archive path -> task downloading it, shared by the plugins of a repository
+        self._downloads = {}
+        self.requirements = PluginRequirements(
+            Path(__file__).absolute().parent.parent / "temp" / "plugins-requirements"
+        )
 
         self.bot.loop.create_task(self.populate_registry())
 
@@ -117,6 +324,7 @@ class Plugins(commands.Cog):
     async def initial_load_plugins(self):
         await self.bot.wait_for_connected()
 
+        plugins = []
         for plugin_name in list(self.bot.config["plugins"]):
             try:
                 plugin = Plugin.from_string(plugin_name, strict=True)
@@ -131,10 +339,27 @@ class Plugins(commands.Cog):
 
                 logger.info("Migrated legacy plugin name: %s, now %s.", plugin_name, str(plugin))
                 self.bot.config["plugins"].append(str(plugin))
+            plugins.append((plugin_name, plugin))
 
+        # The plugins are downloaded concurrently, and loaded in order.
+        downloads = await asyncio.gather(
+            *(self.download_plugin(plugin) for _, plugin in plugins), return_exceptions=True
+        )
+        try:
+            await self.install_requirements(
+                [plugin for (_, plugin), error in zip(plugins, downloads) if error is None]
+            )
+        except InvalidPluginError:
+            logger.warning("Installing the requirements of each plugin separately.")
+            installed = False
+        else:
+            installed = True
+
+        for (plugin_name, plugin), error in zip(plugins, downloads):
             try:
-                await self.download_plugin(plugin)
-                await self.load_plugin(plugin)
+                if isinstance(error, BaseException):
+                    raise error
+                await self.load_plugin(plugin, requirements=not installed)
             except Exception:
                 self.bot.config["plugins"].remove(plugin_name)
                 logger.error(
@@ -145,49 +370,100 @@ class Plugins(commands.Cog):
                 continue
 
         logger.debug("Finished loading all plugins.")
+        logger.info(
+            "Loaded %d plugin(s), %.2fs after start.", len(self.loaded_plugins), profiler.elapsed()
+        )
 
         self.bot.dispatch("plugins_ready")
 
         self._ready_event.set()
         await self.bot.config.update()
 
-    async def download_plugin(self, plugin, force=False):
-        if plugin.abs_path.exists() and not force:
-            return
-
-        plugin.abs_path.mkdir(parents=True, exist_ok=True)
+    def _github_headers(self, **headers):
+        github_token = self.bot.config["github_token"]
+        if github_token is not None:
+            headers["Authorization"] = f"token {github_token}"
+        return headers
 
-        if plugin.cache_path.exists() and not force:
-            plugin_io = plugin.cache_path.open("rb")
-            logger.debug("Loading cached %s.", plugin.cache_path)
-        else:
-            headers = {}
-            github_token = self.bot.config["github_token"]
-            if github_token is not None:
-                headers["Authorization"] = f"token {github_token}"
+    async def _fetch_commit(self, plugin):
+        url = f"https://api.github.com/repos/{plugin.user}/{plugin.repo}/commits/{plugin.branch}"
+        headers = self._github_headers(Accept="application/vnd.github.sha")
+        try:
+            async with self.bot.session.get(url, headers=headers) as resp:
+                if resp.status != 200:
+                    logger.debug("Failed to resolve the commit of %s: %s.", plugin, resp.status)
+                    return None
+                sha = (await resp.text()).strip()
+        except (ClientError, asyncio.TimeoutError):
+            logger.debug("Failed to resolve the commit of %s.", plugin, exc_info=True)
+            return None
+        return sha if fullmatch(r"[0-9a-f]{40}", sha) else None
+
+    async def resolve_commit(self, plugin):
+        """
+        The sha of the last commit of the plugin's branch, `None` if GitHub can't tell.
 
-            async with self.bot.session.get(plugin.url, headers=headers) as resp:
-                logger.debug("Downloading %s.", plugin.url)
-                raw = await resp.read()
+        The plugins of a repository share the request, and the sha is cached
+        for `COMMIT_TTL` seconds.
+        """
+        key = (plugin.user, plugin.repo, plugin.branch)
+        cached = self._commits.get(key)
+        if cached is None or time.monotonic() - cached[0] > self.COMMIT_TTL:
+            task = asyncio.ensure_future(self._fetch_commit(plugin))
+            cached = self._commits[key] = (time.monotonic(), task)
+        sha = await asyncio.shield(cached[1])
+        if sha is None and self._commits.get(key) is cached:
+            del self._commits[key]
+        return sha
+
+    async def _download_archive(self, plugin, ref, force):
+        path = plugin.archive_path(ref)
+        if path.exists() and not force:
+            logger.debug("Loading cached %s.", path)
+            return path
+
+        url = plugin.archive_url(ref)
+        async with self.bot.session.get(url, headers=self._github_headers()) as resp:
+            logger.debug("Downloading %s.", url)
+            raw = await resp.read()
 
-                try:
-                    raw = await resp.text()
-                except UnicodeDecodeError:
-                    pass
+            try:
+                raw = await resp.text()
+            except UnicodeDecodeError:
+                pass
+            else:
+                if raw == "Not Found":
+                    raise InvalidPluginError("Plugin not found")
                 else:
-                    if raw == "Not Found":
-                        raise InvalidPluginError("Plugin not found")
-                    else:
-                        raise InvalidPluginError("Invalid download recieved, non-bytes object")
-
-                plugin_io = io.BytesIO(raw)
-                if not plugin.cache_path.parent.exists():
-                    plugin.cache_path.parent.mkdir(parents=True)
-
-                with plugin.cache_path.open("wb") as f:
-                    f.write(raw)
+                    raise InvalidPluginError("Invalid download recieved, non-bytes object")
+
+        await self.bot.loop.run_in_executor(None, self._write_archive, path, raw)
+        return path
+
+    @staticmethod
+    def _write_archive(path, raw):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Written aside then renamed, so a partial archive is never read.
+        partial = path.with_suffix(".part")
+        with partial.open("wb") as f:
+            f.write(raw)
+        os.replace(partial, path)
+
+    async def fetch_archive(self, plugin, ref, force=False):
+        """Downloads the plugin's repository at `ref`, once for all its plugins."""
+        path = plugin.archive_path(ref)
+        task = self._downloads.get(path)
+        if task is None:
+            task = asyncio.ensure_future(self._download_archive(plugin, ref, force))
+            self._downloads[path] = task
+            task.add_done_callback(lambda _: self._downloads.pop(path, None))
+        return await asyncio.shield(task)
+
+    @staticmethod
+    def _extract(plugin, archive, sha):
+        plugin.abs_path.mkdir(parents=True, exist_ok=True)
 
-        with zipfile.ZipFile(plugin_io) as zipf:
+        with zipfile.ZipFile(archive) as zipf:
             for info in zipf.infolist():
                 path = PurePath(info.filename)
                 if len(path.parts) >= 3 and path.parts[1] == plugin.name:
@@ -199,43 +475,74 @@ class Plugins(commands.Cog):
                         with zipf.open(info) as src, plugin_path.open("wb") as dst:
                             shutil.copyfileobj(src, dst)
 
-        plugin_io.close()
+        if sha is not None:
+            plugin.commit_path.write_text(sha)
+        elif plugin.commit_path.exists():
+            plugin.commit_path.unlink()
 
-    async def load_plugin(self, plugin):
-        if not (plugin.abs_path / f"{plugin.name}.py").exists():
-            raise InvalidPluginError(f"{plugin.name}.py not found.")
+    @staticmethod
+    def extracted_commit(plugin):
+        """The sha of the commit the plugin's files were extracted from, if known."""
+        try:
+            return plugin.commit_path.read_text().strip()
+        except OSError:
+            return None
 
-        req_txt = plugin.abs_path / "requirements.txt"
+    async def download_plugin(self, plugin, force=False):
+        if plugin.abs_path.exists() and not force:
+            return
 
-        if req_txt.exists():
-            # Install PIP requirements
+        # Archives are cached by commit, unchanged plugins are not downloaded nor extracted again.
+        sha = await self.resolve_commit(plugin)
+        if sha is not None and self.extracted_commit(plugin) == sha:
+            logger.debug("%s is already at commit %s.", plugin, sha[:7])
+            return
 
-            venv = hasattr(sys, "real_prefix") or hasattr(sys, "base_prefix")  # in a virtual env
-            user_install = " --user" if not venv else ""
-            proc = await asyncio.create_subprocess_shell(
-                f'"{sys.executable}" -m pip install --upgrade{user_install} -r {req_txt} -q -q',
-                stderr=PIPE,
-                stdout=PIPE,
-            )
+        if sha is not None:
+            archive = await self.fetch_archive(plugin, sha)
+        else:
+            archive = await self.fetch_archive(plugin, plugin.branch, force=force)
+        await self.bot.loop.run_in_executor(None, self._extract, plugin, archive, sha)
 
-            logger.debug("Downloading requirements for %s.", plugin.ext_string)
+    async def install_requirements(self, plugins):
+        """
+        Installs the requirements of the plugins, all at once.
 
-            stdout, stderr = await proc.communicate()
+        Only the requirements that changed since they were installed are
+        installed, once checked that they don't conflict with the
+        requirements of the other plugins.
+        """
+        pending = await self.bot.loop.run_in_executor(None, self.requirements.pending, plugins)
+        if not pending:
+            return
 
-            if stdout:
-                logger.debug("[stdout]\n%s.", stdout.decode())
+        names = ", ".join(plugin.ext_string for plugin in pending)
+        conflicts = await self.bot.loop.run_in_executor(
+            None, self.requirements.conflicts, self.loaded_plugins.union(plugins), pending
+        )
+        if conflicts:
+            logger.error("Conflicting requirements for %s.", names)
+            raise InvalidPluginError(
+                "Conflicting requirements: ```\n{}\n```".format("\n".join(conflicts))
+            )
 
-            if stderr:
-                logger.debug("[stderr]\n%s.", stderr.decode())
-                logger.error(
-                    "Failed to download requirements for %s.", plugin.ext_string, exc_info=True
-                )
-                raise InvalidPluginError(
-                    f"Unable to download requirements: ```\n{stderr.decode()}\n```"
-                )
+        logger.debug("Downloading requirements for %s.", names)
+        try:
+            await self.requirements.install(pending)
+        except InvalidPluginError:
+            logger.error("Failed to download requirements for %s.", names)
+            raise
+        await self.bot.loop.run_in_executor(None, self.requirements.record, pending)
+
+        if os.path.exists(USER_SITE) and USER_SITE not in sys.path:
+            sys.path.insert(0, USER_SITE)
+
+    async def load_plugin(self, plugin, requirements=True):
+        if not (plugin.abs_path / f"{plugin.name}.py").exists():
+            raise InvalidPluginError(f"{plugin.name}.py not found.")
 
-            if os.path.exists(USER_SITE):
-                sys.path.insert(0, USER_SITE)
+        if requirements:
+            await self.install_requirements([plugin])
 
         try:
             self.bot.load_extension(plugin.ext_string)
@@ -8,7 +8,7 @@ import traceback
 from contextlib import redirect_stdout
 from datetime import datetime
 from difflib import get_close_matches
-from io import BytesIO, StringIO
+from io import StringIO
 from itertools import takewhile, zip_longest
 from json import JSONDecodeError, loads
 from subprocess import PIPE
@@ -23,8 +23,9 @@ from discord.ext import commands, tasks
 from discord.ext.commands.view import StringView
 from pkg_resources import parse_version
 
-from core import checks, utils
+from core import checks, ratelimits, utils
 from core.changelog import Changelog
+from core.clients import DB_FAILURES, DB_LATENCY
 from core.models import (
     HostingMethod,
     InvalidConfigError,
@@ -32,8 +33,11 @@ from core.models import (
     UnseenFormatter,
     getLogger,
 )
-from core.utils import trigger_typing, truncate
-from core.paginator import EmbedPaginatorSession, MessagePaginatorSession
+from core.utils import TailReader, iter_file, trigger_typing, truncate
+from core.paginator import EmbedPaginatorSession, TailPaginatorSession
+from core.ratelimits import REST_LATENCY, REST_RATELIMITED, REST_RATELIMIT_WAIT, REST_REQUESTS
+from core.thread import REPLY_LATENCY, TYPING_REQUESTS
+from core.tracing import tracer
 
 
 logger = getLogger(__name__)
@@ -379,53 +383,25 @@ class Utility(commands.Cog):
     async def debug(self, ctx):
         """Providencia as últimas logs do bot."""
 
-        log_file_name = self.bot.token.split(".")[0]
-
-        with open(
-            os.path.join(
-                os.path.dirname(os.path.abspath(__file__)), f"../temp/{log_file_name}.log"
-            ),
-            "r+",
-        ) as f:
-            logs = f.read().strip()
-
-        if not logs:
-            embed = discord.Embed(
-                color=self.bot.main_color,
-                title="Debug Logs:",
-                description="You don't have any logs at the moment.",
-            )
-            embed.set_footer(text="Go to Heroku to see your logs.")
-            return await ctx.send(embed=embed)
-
-        messages = []
-
         # Using Haskell formatting because it's similar to Python for exceptions
         # and it does a fine job formatting the logs.
-        msg = "```Haskell\n"
-
-        for line in logs.splitlines(keepends=True):
-            if msg != "```Haskell\n":
-                if len(line) + len(msg) + 3 > 2000:
-                    msg += "```"
-                    messages.append(msg)
-                    msg = "```Haskell\n"
-            msg += line
-            if len(msg) + 3 > 2000:
-                msg = msg[:1993] + "[...]```"
-                messages.append(msg)
-                msg = "```Haskell\n"
-
-        if msg != "```Haskell\n":
-            msg += "```"
-            messages.append(msg)
-
+        reader = TailReader(self.bot.log_file_name, page_size=2000 - len("```Haskell\n```"))
         embed = discord.Embed(color=self.bot.main_color)
         embed.set_footer(text="Debug logs - Navigate using the reactions below.")
+        session = TailPaginatorSession(ctx, reader, fmt="```Haskell\n{}```", embed=embed)
 
-        session = MessagePaginatorSession(ctx, *messages, embed=embed)
-        session.current = len(messages) - 1
-        return await session.run()
+        try:
+            if not await session.load_page():
+                embed = discord.Embed(
+                    color=self.bot.main_color,
+                    title="Debug Logs:",
+                    description="You don't have any logs at the moment.",
+                )
+                embed.set_footer(text="Go to Heroku to see your logs.")
+                return await ctx.send(embed=embed)
+            return await session.run()
+        finally:
+            reader.close()
 
     @debug.command(name="hastebin", aliases=["haste"])
     @checks.has_permissions(PermissionLevel.OWNER)
@@ -434,15 +410,13 @@ class Utility(commands.Cog):
         """Posts application-logs to Hastebin."""
 
         haste_url = os.environ.get("HASTE_URL", "https://hastebin.cc")
-        log_file_name = self.bot.token.split(".")[0]
 
-        with open(
-            os.path.join(
-                os.path.dirname(os.path.abspath(__file__)), f"../temp/{log_file_name}.log"
-            ),
-            "rb+",
-        ) as f:
-            logs = BytesIO(f.read().strip())
+        # The logs written during the upload are left out.
+        try:
+            size = os.path.getsize(self.bot.log_file_name)
+        except OSError:
+            size = 0
+        logs = iter_file(self.bot.log_file_name, limit=size)
 
         try:
             async with self.bot.session.post(haste_url + "/documents", data=logs) as resp:
@@ -457,7 +431,7 @@ class Utility(commands.Cog):
                     color=self.bot.main_color,
                     description=f"{haste_url}/" + key,
                 )
-        except (JSONDecodeError, ClientResponseError, IndexError, KeyError):
+        except (JSONDecodeError, ClientResponseError, IndexError, KeyError, OSError):
             embed = discord.Embed(
                 title="Debug Logs",
                 color=self.bot.main_color,
@@ -487,6 +461,163 @@ class Utility(commands.Cog):
             )
         )
 
+    @debug.command(name="ratelimits", aliases=["rl"])
+    @checks.has_permissions(PermissionLevel.OWNER)
+    @utils.trigger_typing
+    async def debug_ratelimits(self, ctx):
+        """
+        Shows the REST calls made to Discord and the rate limits hit.
+
+        Calls are counted since the bot started, per route and per
+        command or event that made them.
+        """
+        routes = {}
+        origins = {}
+        for name, labels, value in REST_REQUESTS.samples():
+            routes[labels["route"]] = routes.get(labels["route"], 0) + value
+            origins[labels["origin"]] = origins.get(labels["origin"], 0) + value
+        limited_routes = {}
+        limited_origins = {}
+        for name, labels, value in REST_RATELIMITED.samples():
+            if labels["scope"] != "bucket":
+                continue
+            limited_routes[labels["route"]] = limited_routes.get(labels["route"], 0) + value
+            limited_origins[labels["origin"]] = limited_origins.get(labels["origin"], 0) + value
+
+        embed = discord.Embed(title="Rate Limits", color=self.bot.main_color)
+        if not routes:
+            embed.description = "No REST calls were recorded yet."
+            return await ctx.send(embed=embed)
+
+        table = f"{'route':<36}{'calls':>7}{'p50':>7}{'429':>5}{'wait':>7}\n"
+        for route, calls in sorted(routes.items(), key=lambda r: r[1], reverse=True)[:15]:
+            p50 = (REST_LATENCY.quantile(0.5, route=route) or 0) * 1000
+            table += (
+                f"{truncate(route, 36):<36}{int(calls):>7}{p50:>7.0f}"
+                f"{int(limited_routes.get(route, 0)):>5}"
+                f"{REST_RATELIMIT_WAIT.get(route=route):>7.1f}\n"
+            )
+        embed.description = f"```\n{table}```"
+
+        embed.add_field(
+            name="Top Origins (calls / 429s)",
+            value="\n".join(
+                f"`{origin}`: {int(calls)} / {int(limited_origins.get(origin, 0))}"
+                for origin, calls in sorted(origins.items(), key=lambda o: o[1], reverse=True)[:8]
+            ),
+            inline=False,
+        )
+
+        limited_buckets = [b for b in ratelimits.buckets.top(5) if b[2]]
+        if limited_buckets:
+            embed.add_field(
+                name="Most Limited Buckets (429s / wait)",
+                value="\n".join(
+                    f"`{truncate(bucket, 60)}`: {limited} / {waited:.1f}s"
+                    for bucket, _, limited, waited in limited_buckets
+                ),
+                inline=False,
+            )
+
+        global_limits = sum(
+            value for _, labels, value in REST_RATELIMITED.samples() if labels["scope"] == "global"
+        )
+        embed.set_footer(
+            text=f"Latencies in ms, waits in seconds. Global rate limits: {int(global_limits)}."
+        )
+        await ctx.send(embed=embed)
+
+    @debug.command(name="trace")
+    @checks.has_permissions(PermissionLevel.OWNER)
+    async def debug_trace(self, ctx, count: int = 3):
+        """
+        Shows the slowest recent DM relays, broken down by stage.
+
+        The last 200 relays are kept. Stages marked with `*` ended
+        after the relay (e.g. saving the message to the logs), stages
+        marked with `!` failed.
+        """
+        relays = [t for t in tracer.recent if t.name == "dm_relay"]
+        embed = discord.Embed(title="Slowest Relays", color=self.bot.main_color)
+        if not relays:
+            embed.description = "No DM was relayed yet."
+            return await ctx.send(embed=embed)
+
+        durations = {}
+        for trace in relays:
+            for stage in trace.stages:
+                durations.setdefault(stage.name, []).append(stage.duration)
+        table = f"{'stage':<16}{'count':>7}{'p50':>8}{'max':>8}\n"
+        for name, values in sorted(durations.items(), key=lambda d: max(d[1]), reverse=True):
+            values.sort()
+            table += (
+                f"{name:<16}{len(values):>7}{values[len(values) // 2] * 1000:>8.1f}"
+                f"{values[-1] * 1000:>8.1f}\n"
+            )
+        embed.description = f"Over the last {len(relays)} relays:\n```\n{table}```"
+
+        for trace in tracer.slowest(max(1, min(count, 10)), name="dm_relay"):
+            lines = []
+            for stage in trace.sorted_stages():
+                name = "  " * stage.depth + stage.name
+                flags = ("*" if stage.background else "") + ("!" if stage.error else "")
+                lines.append(f"{name:<20}{stage.duration * 1000:>8.1f} {flags}")
+            lines = truncate("\n".join(lines), 1000)
+            started_at = datetime.utcfromtimestamp(trace.started_at)
+            embed.add_field(
+                name=f"{trace.duration * 1000:.1f} ms, {started_at:%H:%M:%S} UTC",
+                value=f"```\n{lines}```",
+                inline=False,
+            )
+        embed.set_footer(text="Durations in ms.")
+        await ctx.send(embed=embed)
+
+    @debug.command(name="slow")
+    @checks.has_permissions(PermissionLevel.OWNER)
+    async def debug_slow(self, ctx, count: int = 3):
+        """
+        Shows the callbacks that blocked the event loop the longest.
+
+        A callback is reported when it blocks the loop for longer than
+        `SLOW_CALLBACK_THRESHOLD`, with the event, command or task that
+        ran it and the innermost frames of its stack.
+        """
+        watchdog = self.bot.watchdog
+        embed = discord.Embed(title="Slow Callbacks", color=self.bot.main_color)
+        if not watchdog.reports:
+            if watchdog.threshold > 0:
+                embed.description = (
+                    f"No callback blocked the event loop for more than "
+                    f"{watchdog.threshold * 1000:.0f} ms yet."
+                )
+            else:
+                embed.description = (
+                    "Slow callbacks are not detected, `SLOW_CALLBACK_THRESHOLD` is 0."
+                )
+            return await ctx.send(embed=embed)
+
+        handlers = {}
+        for slow in watchdog.reports:
+            handlers.setdefault(slow.handler, []).append(slow.duration)
+        embed.description = "\n".join(
+            f"`{truncate(handler, 40)}`: {len(durations)}x, up to {max(durations) * 1000:.0f} ms"
+            for handler, durations in sorted(
+                handlers.items(), key=lambda h: max(h[1]), reverse=True
+            )[:10]
+        )
+
+        for slow in watchdog.slowest(max(1, min(count, 5))):
+            at = datetime.utcfromtimestamp(slow.at)
+            stack = truncate(slow.format_stack(limit=6), 1000)
+            embed.add_field(
+                name=f"{slow.duration * 1000:.0f} ms in {truncate(slow.handler, 60)}, "
+                f"{at:%H:%M:%S} UTC",
+                value=f"```\n{stack}```",
+                inline=False,
+            )
+        embed.set_footer(text=f"{len(watchdog.reports)} recent slow callbacks.")
+        await ctx.send(embed=embed)
+
     @commands.command(aliases=["presence"])
     @checks.has_permissions(PermissionLevel.ADMINISTRATOR)
     async def activity(self, ctx, activity_type: str.lower, *, message: str = ""):
@@ -655,8 +786,76 @@ class Utility(commands.Cog):
             description=f"{self.bot.ws.latency * 1000:.4f} ms",
             color=self.bot.main_color,
         )
+        for mode in ("serial", "concurrent"):
+            count = REPLY_LATENCY.count(mode=mode)
+            if count:
+                embed.add_field(
+                    name=f"Reply Delivery ({mode})",
+                    value=f"p50 {REPLY_LATENCY.quantile(0.5, mode=mode) * 1000:.0f} ms, "
+                    f"p99 {REPLY_LATENCY.quantile(0.99, mode=mode) * 1000:.0f} ms "
+                    f"({count} replies)",
+                )
+        sent = int(TYPING_REQUESTS.get(result="sent"))
+        skipped = int(TYPING_REQUESTS.get(result="skipped"))
+        if sent or skipped:
+            embed.add_field(
+                name="Typing Indicators", value=f"{sent} sent, {skipped} skipped",
+            )
         return await ctx.send(embed=embed)
 
+    @commands.command()
+    @checks.has_permissions(PermissionLevel.OWNER)
+    @utils.trigger_typing
+    async def dbstats(self, ctx):
+        """
+        Shows the latency of the database operations.
+
+        Latencies are measured since the bot started, per database command.
+        """
+        rows = []
+        for labels in DB_LATENCY.label_values():
+            command = labels["command"]
+            count = DB_LATENCY.count(command=command)
+            if not count:
+                continue
+            rows.append(
+                (
+                    command,
+                    count,
+                    DB_LATENCY.sum(command=command) / count * 1000,
+                    DB_LATENCY.quantile(0.5, command=command) * 1000,
+                    DB_LATENCY.quantile(0.99, command=command) * 1000,
+                    int(DB_FAILURES.get(command=command)),
+                )
+            )
+
+        embed = discord.Embed(title="Database Statistics", color=self.bot.main_color)
+
+        if not rows:
+            embed.description = "No database operations were recorded yet."
+        else:
+            rows.sort(key=lambda r: r[1], reverse=True)
+            table = f"{'command':<16}{'count':>7}{'avg':>9}{'p50':>9}{'p99':>9}{'fail':>6}\n"
+            for command, count, avg, p50, p99, failures in rows[:20]:
+                table += (
+                    f"{truncate(command, 16):<16}{count:>7}"
+                    f"{avg:>9.1f}{p50:>9.1f}{p99:>9.1f}{failures:>6}\n"
+                )
+            embed.description = f"```\n{table}```"
+            embed.set_footer(text="Latencies are in milliseconds.")
+
+        options = getattr(self.bot.api, "options", {})
+        if options:
+            embed.add_field(
+                name="Connection Options",
+                value="\n".join(f"`{k}`: {v}" for k, v in options.items()),
+            )
+        read_preference = getattr(self.bot.api, "read_preference", None)
+        if read_preference is not None:
+            embed.add_field(name="Log Read Preference", value=f"`{read_preference.mongos_mode}`")
+
+        await ctx.send(embed=embed)
+
     @commands.command()
     @checks.has_permissions(PermissionLevel.ADMINISTRATOR)
     async def mention(self, ctx, *mention: Union[discord.Role, discord.Member]):
@@ -1,6 +1,9 @@
 """
 Retrieved from matplotlib colors library.
 Slightly modified to conform with usage.
+
+The bot looks colours up in `core._color_table`, generated from these
+tables with ``python -m core._color_data`` whenever they change.
 """
 
 
@@ -1192,3 +1195,34 @@ ALL_COLORS.update(TABLEAU_COLORS)
 ALL_COLORS.update(TABLEAU_COLORS_NORM)
 ALL_COLORS.update(DISCORD_COLORS)
 ALL_COLORS.update(DISCORD_COLORS_NORM)
+
+
+def generate_table(path: str) -> None:
+    """Writes the names of `ALL_COLORS`, sorted, and their values to `path`."""
+    import json
+
+    names = sorted(ALL_COLORS)
+    values = "".join(ALL_COLORS[name] for name in names)
+    lines = [
+        "# Generated from core/_color_data.py by `python -m core._color_data`, do not edit.",
+        "",
+        "# the colour names, sorted",
+        "NAMES = (",
+    ]
+    lines += [f"    {json.dumps(name)}," for name in names]
+    lines += [
+        ")",
+        "",
+        "# the hex RGB value of NAMES[i] is VALUES[6 * i : 6 * i + 6]",
+        "VALUES = (",
+    ]
+    lines += [f'    "{values[i : i + 90]}"' for i in range(0, len(values), 90)]
+    lines.append(")")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+
+
+if __name__ == "__main__":
+    import os
+
+    generate_table(os.path.join(os.path.dirname(os.path.abspath(__file__)), "_color_table.py"))
@@ -0,0 +1,2348 @@
+# Generated from core/_color_data.py by `python -m core._color_data`, do not edit.
+
+# the colour names, sorted
+NAMES = (
+    "acid green",
+    "adobe",
+    "algae",
+    "algae green",
+    "aliceblue",
+    "almost black",
+    "amber",
+    "amethyst",
+    "antiquewhite",
+    "apple",
+    "apple green",
+    "apricot",
+    "aqua",
+    "aqua blue",
+    "aqua green",
+    "aqua marine",
+    "aquamarine",
+    "army green",
+    "asparagus",
+    "aubergine",
+    "auburn",
+    "avocado",
+    "avocado green",
+    "azul",
+    "azure",
+    "b",
+    "baby blue",
+    "baby green",
+    "baby pink",
+    "baby poo",
+    "baby poop",
+    "baby poop green",
+    "baby puke green",
+    "baby purple",
+    "baby shit brown",
+    "baby shit green",
+    "banana",
+    "banana yellow",
+    "barbie pink",
+    "barf green",
+    "barney",
+    "barney purple",
+    "battleship grey",
+    "beige",
+    "berry",
+    "bile",
+    "bisque",
+    "black",
+    "blanchedalmond",
+    "bland",
+    "blood",
+    "blood orange",
+    "blood red",
+    "blue",
+    "blue blue",
+    "blue green",
+    "blue grey",
+    "blue purple",
+    "blue violet",
+    "blue with a hint of purple",
+    "blue/green",
+    "blue/grey",
+    "blue/purple",
+    "blueberry",
+    "bluegreen",
+    "bluegrey",
+    "blueviolet",
+    "bluey green",
+    "bluey grey",
+    "bluey purple",
+    "bluish",
+    "bluish green",
+    "bluish grey",
+    "bluish purple",
+    "blurple",
+    "blush",
+    "blush pink",
+    "booger",
+    "booger green",
+    "bordeaux",
+    "boring green",
+    "bottle green",
+    "brick",
+    "brick orange",
+    "brick red",
+    "bright aqua",
+    "bright blue",
+    "bright cyan",
+    "bright green",
+    "bright lavender",
+    "bright light blue",
+    "bright light green",
+    "bright lilac",
+    "bright lime",
+    "bright lime green",
+    "bright magenta",
+    "bright olive",
+    "bright orange",
+    "bright pink",
+    "bright purple",
+    "bright red",
+    "bright sea green",
+    "bright sky blue",
+    "bright teal",
+    "bright turquoise",
+    "bright violet",
+    "bright yellow",
+    "bright yellow green",
+    "british racing green",
+    "bronze",
+    "brown",
+    "brown green",
+    "brown grey",
+    "brown orange",
+    "brown red",
+    "brown yellow",
+    "brownish",
+    "brownish green",
+    "brownish grey",
+    "brownish orange",
+    "brownish pink",
+    "brownish purple",
+    "brownish red",
+    "brownish yellow",
+    "browny green",
+    "browny orange",
+    "bruise",
+    "bubble gum pink",
+    "bubblegum",
+    "bubblegum pink",
+    "buff",
+    "burgundy",
+    "burlywood",
+    "burnt orange",
+    "burnt red",
+    "burnt siena",
+    "burnt sienna",
+    "burnt umber",
+    "burnt yellow",
+    "burple",
+    "butter",
+    "butter yellow",
+    "butterscotch",
+    "c",
+    "cadet blue",
+    "cadetblue",
+    "camel",
+    "camo",
+    "camo green",
+    "camouflage green",
+    "canary",
+    "canary yellow",
+    "candy pink",
+    "caramel",
+    "carmine",
+    "carnation",
+    "carnation pink",
+    "carolina blue",
+    "celadon",
+    "celery",
+    "cement",
+    "cerise",
+    "cerulean",
+    "cerulean blue",
+    "charcoal",
+    "charcoal grey",
+    "chartreuse",
+    "cherry",
+    "cherry red",
+    "chestnut",
+    "chocolate",
+    "chocolate brown",
+    "cinnamon",
+    "claret",
+    "clay",
+    "clay brown",
+    "clear blue",
+    "cloudy blue",
+    "cobalt",
+    "cobalt blue",
+    "cocoa",
+    "coffee",
+    "cool blue",
+    "cool green",
+    "cool grey",
+    "copper",
+    "coral",
+    "coral pink",
+    "cornflower",
+    "cornflower blue",
+    "cornflowerblue",
+    "cornsilk",
+    "cranberry",
+    "cream",
+    "creme",
+    "crimson",
+    "css:aliceblue",
+    "css:antiquewhite",
+    "css:aqua",
+    "css:aquamarine",
+    "css:azure",
+    "css:beige",
+    "css:bisque",
+    "css:black",
+    "css:blanchedalmond",
+    "css:blue",
+    "css:blueviolet",
+    "css:brown",
+    "css:burlywood",
+    "css:cadetblue",
+    "css:chartreuse",
+    "css:chocolate",
+    "css:coral",
+    "css:cornflowerblue",
+    "css:cornsilk",
+    "css:crimson",
+    "css:cyan",
+    "css:darkblue",
+    "css:darkcyan",
+    "css:darkgoldenrod",
+    "css:darkgray",
+    "css:darkgreen",
+    "css:darkgrey",
+    "css:darkkhaki",
+    "css:darkmagenta",
+    "css:darkolivegreen",
+    "css:darkorange",
+    "css:darkorchid",
+    "css:darkred",
+    "css:darksalmon",
+    "css:darkseagreen",
+    "css:darkslateblue",
+    "css:darkslategray",
+    "css:darkslategrey",
+    "css:darkturquoise",
+    "css:darkviolet",
+    "css:deeppink",
+    "css:deepskyblue",
+    "css:dimgray",
+    "css:dimgrey",
+    "css:dodgerblue",
+    "css:firebrick",
+    "css:floralwhite",
+    "css:forestgreen",
+    "css:fuchsia",
+    "css:gainsboro",
+    "css:ghostwhite",
+    "css:gold",
+    "css:goldenrod",
+    "css:gray",
+    "css:green",
+    "css:greenyellow",
+    "css:grey",
+    "css:honeydew",
+    "css:hotpink",
+    "css:indianred",
+    "css:indigo",
+    "css:ivory",
+    "css:khaki",
+    "css:lavender",
+    "css:lavenderblush",
+    "css:lawngreen",
+    "css:lemonchiffon",
+    "css:lightblue",
+    "css:lightcoral",
+    "css:lightcyan",
+    "css:lightgoldenrodyellow",
+    "css:lightgray",
+    "css:lightgreen",
+    "css:lightgrey",
+    "css:lightpink",
+    "css:lightsalmon",
+    "css:lightseagreen",
+    "css:lightskyblue",
+    "css:lightslategray",
+    "css:lightslategrey",
+    "css:lightsteelblue",
+    "css:lightyellow",
+    "css:lime",
+    "css:limegreen",
+    "css:linen",
+    "css:magenta",
+    "css:maroon",
+    "css:mediumaquamarine",
+    "css:mediumblue",
+    "css:mediumorchid",
+    "css:mediumpurple",
+    "css:mediumseagreen",
+    "css:mediumslateblue",
+    "css:mediumspringgreen",
+    "css:mediumturquoise",
+    "css:mediumvioletred",
+    "css:midnightblue",
+    "css:mintcream",
+    "css:mistyrose",
+    "css:moccasin",
+    "css:navajowhite",
+    "css:navy",
+    "css:oldlace",
+    "css:olive",
+    "css:olivedrab",
+    "css:orange",
+    "css:orangered",
+    "css:orchid",
+    "css:palegoldenrod",
+    "css:palegreen",
+    "css:paleturquoise",
+    "css:palevioletred",
+    "css:papayawhip",
+    "css:peachpuff",
+    "css:peru",
+    "css:pink",
+    "css:plum",
+    "css:powderblue",
+    "css:purple",
+    "css:rebeccapurple",
+    "css:red",
+    "css:rosybrown",
+    "css:royalblue",
+    "css:saddlebrown",
+    "css:salmon",
+    "css:sandybrown",
+    "css:seagreen",
+    "css:seashell",
+    "css:sienna",
+    "css:silver",
+    "css:skyblue",
+    "css:slateblue",
+    "css:slategray",
+    "css:slategrey",
+    "css:snow",
+    "css:springgreen",
+    "css:steelblue",
+    "css:tan",
+    "css:teal",
+    "css:thistle",
+    "css:tomato",
+    "css:turquoise",
+    "css:violet",
+    "css:wheat",
+    "css:white",
+    "css:whitesmoke",
+    "css:yellow",
+    "css:yellowgreen",
+    "custard",
+    "cyan",
+    "dandelion",
+    "dark",
+    "dark aqua",
+    "dark aquamarine",
+    "dark beige",
+    "dark blue",
+    "dark blue green",
+    "dark blue grey",
+    "dark brown",
+    "dark coral",
+    "dark cream",
+    "dark cyan",
+    "dark forest green",
+    "dark fuchsia",
+    "dark gold",
+    "dark grass green",
+    "dark gray",
+    "dark green",
+    "dark green blue",
+    "dark grey",
+    "dark grey blue",
+    "dark hot pink",
+    "dark indigo",
+    "dark khaki",
+    "dark lavender",
+    "dark lilac",
+    "dark lime",
+    "dark lime green",
+    "dark magenta",
+    "dark maroon",
+    "dark mauve",
+    "dark mint",
+    "dark mint green",
+    "dark mustard",
+    "dark navy",
+    "dark navy blue",
+    "dark olive",
+    "dark olive green",
+    "dark orange",
+    "dark pastel green",
+    "dark peach",
+    "dark periwinkle",
+    "dark pink",
+    "dark plum",
+    "dark purple",
+    "dark red",
+    "dark rose",
+    "dark royal blue",
+    "dark sage",
+    "dark salmon",
+    "dark sand",
+    "dark sea green",
+    "dark seafoam",
+    "dark seafoam green",
+    "dark sky blue",
+    "dark slate blue",
+    "dark tan",
+    "dark taupe",
+    "dark teal",
+    "dark turquoise",
+    "dark violet",
+    "dark yellow",
+    "dark yellow green",
+    "darkblue",
+    "darkcyan",
+    "darker gray",
+    "darkgoldenrod",
+    "darkgray",
+    "darkgreen",
+    "darkgrey",
+    "darkish blue",
+    "darkish green",
+    "darkish pink",
+    "darkish purple",
+    "darkish red",
+    "darkkhaki",
+    "darkmagenta",
+    "darkolivegreen",
+    "darkorange",
+    "darkorchid",
+    "darkred",
+    "darksalmon",
+    "darkseagreen",
+    "darkslateblue",
+    "darkslategray",
+    "darkslategrey",
+    "darkturquoise",
+    "darkviolet",
+    "deep aqua",
+    "deep blue",
+    "deep brown",
+    "deep green",
+    "deep lavender",
+    "deep lilac",
+    "deep magenta",
+    "deep orange",
+    "deep pink",
+    "deep purple",
+    "deep red",
+    "deep rose",
+    "deep sea blue",
+    "deep sky blue",
+    "deep teal",
+    "deep turquoise",
+    "deep violet",
+    "deeppink",
+    "deepskyblue",
+    "default",
+    "denim",
+    "denim blue",
+    "desert",
+    "diarrhea",
+    "dimgray",
+    "dimgrey",
+    "dirt",
+    "dirt brown",
+    "dirty blue",
+    "dirty green",
+    "dirty orange",
+    "dirty pink",
+    "dirty purple",
+    "dirty yellow",
+    "discord:blue",
+    "discord:blurple",
+    "discord:dark blue",
+    "discord:dark gold",
+    "discord:dark gray",
+    "discord:dark green",
+    "discord:dark magenta",
+    "discord:dark orange",
+    "discord:dark purple",
+    "discord:dark red",
+    "discord:dark teal",
+    "discord:darker gray",
+    "discord:default",
+    "discord:gold",
+    "discord:grayple",
+    "discord:green",
+    "discord:light gray",
+    "discord:lighter gray",
+    "discord:magenta",
+    "discord:orange",
+    "discord:purple",
+    "discord:red",
+    "discord:teal",
+    "dodger blue",
+    "dodgerblue",
+    "drab",
+    "drab green",
+    "dried blood",
+    "duck egg blue",
+    "dull blue",
+    "dull brown",
+    "dull green",
+    "dull orange",
+    "dull pink",
+    "dull purple",
+    "dull red",
+    "dull teal",
+    "dull yellow",
+    "dusk",
+    "dusk blue",
+    "dusky blue",
+    "dusky pink",
+    "dusky purple",
+    "dusky rose",
+    "dust",
+    "dusty blue",
+    "dusty green",
+    "dusty lavender",
+    "dusty orange",
+    "dusty pink",
+    "dusty purple",
+    "dusty red",
+    "dusty rose",
+    "dusty teal",
+    "earth",
+    "easter green",
+    "easter purple",
+    "ecru",
+    "egg shell",
+    "eggplant",
+    "eggplant purple",
+    "eggshell",
+    "eggshell blue",
+    "electric blue",
+    "electric green",
+    "electric lime",
+    "electric pink",
+    "electric purple",
+    "emerald",
+    "emerald green",
+    "evergreen",
+    "faded blue",
+    "faded green",
+    "faded orange",
+    "faded pink",
+    "faded purple",
+    "faded red",
+    "faded yellow",
+    "fawn",
+    "fern",
+    "fern green",
+    "fire engine red",
+    "firebrick",
+    "flat blue",
+    "flat green",
+    "floralwhite",
+    "fluorescent green",
+    "fluro green",
+    "foam green",
+    "forest",
+    "forest green",
+    "forestgreen",
+    "forrest green",
+    "french blue",
+    "fresh green",
+    "frog green",
+    "fuchsia",
+    "g",
+    "gainsboro",
+    "ghostwhite",
+    "gold",
+    "golden",
+    "golden brown",
+    "golden rod",
+    "golden yellow",
+    "goldenrod",
+    "grape",
+    "grape purple",
+    "grapefruit",
+    "grass",
+    "grass green",
+    "grassy green",
+    "gray",
+    "grayple",
+    "green",
+    "green apple",
+    "green blue",
+    "green brown",
+    "green grey",
+    "green teal",
+    "green yellow",
+    "green/blue",
+    "green/yellow",
+    "greenblue",
+    "greenish",
+    "greenish beige",
+    "greenish blue",
+    "greenish brown",
+    "greenish cyan",
+    "greenish grey",
+    "greenish tan",
+    "greenish teal",
+    "greenish turquoise",
+    "greenish yellow",
+    "greeny blue",
+    "greeny brown",
+    "greeny grey",
+    "greeny yellow",
+    "greenyellow",
+    "grey",
+    "grey blue",
+    "grey brown",
+    "grey green",
+    "grey pink",
+    "grey purple",
+    "grey teal",
+    "grey/blue",
+    "grey/green",
+    "greyblue",
+    "greyish",
+    "greyish blue",
+    "greyish brown",
+    "greyish green",
+    "greyish pink",
+    "greyish purple",
+    "greyish teal",
+    "gross green",
+    "gunmetal",
+    "hazel",
+    "heather",
+    "heliotrope",
+    "highlighter green",
+    "honeydew",
+    "hospital green",
+    "hot green",
+    "hot magenta",
+    "hot pink",
+    "hot purple",
+    "hotpink",
+    "hunter green",
+    "ice",
+    "ice blue",
+    "icky green",
+    "indian red",
+    "indianred",
+    "indigo",
+    "indigo blue",
+    "iris",
+    "irish green",
+    "ivory",
+    "jade",
+    "jade green",
+    "jungle green",
+    "k",
+    "kelley green",
+    "kelly green",
+    "kermit green",
+    "key lime",
+    "khaki",
+    "khaki green",
+    "kiwi",
+    "kiwi green",
+    "lavender",
+    "lavender blue",
+    "lavender pink",
+    "lavenderblush",
+    "lawn green",
+    "lawngreen",
+    "leaf",
+    "leaf green",
+    "leafy green",
+    "leather",
+    "lemon",
+    "lemon green",
+    "lemon lime",
+    "lemon yellow",
+    "lemonchiffon",
+    "lichen",
+    "light aqua",
+    "light aquamarine",
+    "light beige",
+    "light blue",
+    "light blue green",
+    "light blue grey",
+    "light bluish green",
+    "light bright green",
+    "light brown",
+    "light burgundy",
+    "light cyan",
+    "light eggplant",
+    "light forest green",
+    "light gold",
+    "light grass green",
+    "light gray",
+    "light green",
+    "light green blue",
+    "light greenish blue",
+    "light grey",
+    "light grey blue",
+    "light grey green",
+    "light indigo",
+    "light khaki",
+    "light lavendar",
+    "light lavender",
+    "light light blue",
+    "light light green",
+    "light lilac",
+    "light lime",
+    "light lime green",
+    "light magenta",
+    "light maroon",
+    "light mauve",
+    "light mint",
+    "light mint green",
+    "light moss green",
+    "light mustard",
+    "light navy",
+    "light navy blue",
+    "light neon green",
+    "light olive",
+    "light olive green",
+    "light orange",
+    "light pastel green",
+    "light pea green",
+    "light peach",
+    "light periwinkle",
+    "light pink",
+    "light plum",
+    "light purple",
+    "light red",
+    "light rose",
+    "light royal blue",
+    "light sage",
+    "light salmon",
+    "light sea green",
+    "light seafoam",
+    "light seafoam green",
+    "light sky blue",
+    "light tan",
+    "light teal",
+    "light turquoise",
+    "light urple",
+    "light violet",
+    "light yellow",
+    "light yellow green",
+    "light yellowish green",
+    "lightblue",
+    "lightcoral",
+    "lightcyan",
+    "lighter gray",
+    "lighter green",
+    "lighter purple",
+    "lightgoldenrodyellow",
+    "lightgray",
+    "lightgreen",
+    "lightgrey",
+    "lightish blue",
+    "lightish green",
+    "lightish purple",
+    "lightish red",
+    "lightpink",
+    "lightsalmon",
+    "lightseagreen",
+    "lightskyblue",
+    "lightslategray",
+    "lightslategrey",
+    "lightsteelblue",
+    "lightyellow",
+    "lilac",
+    "liliac",
+    "lime",
+    "lime green",
+    "lime yellow",
+    "limegreen",
+    "linen",
+    "lipstick",
+    "lipstick red",
+    "m",
+    "macaroni and cheese",
+    "magenta",
+    "mahogany",
+    "maize",
+    "mango",
+    "manilla",
+    "marigold",
+    "marine",
+    "marine blue",
+    "maroon",
+    "mauve",
+    "medium blue",
+    "medium brown",
+    "medium green",
+    "medium grey",
+    "medium pink",
+    "medium purple",
+    "mediumaquamarine",
+    "mediumblue",
+    "mediumorchid",
+    "mediumpurple",
+    "mediumseagreen",
+    "mediumslateblue",
+    "mediumspringgreen",
+    "mediumturquoise",
+    "mediumvioletred",
+    "melon",
+    "merlot",
+    "metallic blue",
+    "mid blue",
+    "mid green",
+    "midnight",
+    "midnight blue",
+    "midnight purple",
+    "midnightblue",
+    "military green",
+    "milk chocolate",
+    "mint",
+    "mint green",
+    "mintcream",
+    "minty green",
+    "mistyrose",
+    "moccasin",
+    "mocha",
+    "moss",
+    "moss green",
+    "mossy green",
+    "mud",
+    "mud brown",
+    "mud green",
+    "muddy brown",
+    "muddy green",
+    "muddy yellow",
+    "mulberry",
+    "murky green",
+    "mushroom",
+    "mustard",
+    "mustard brown",
+    "mustard green",
+    "mustard yellow",
+    "muted blue",
+    "muted green",
+    "muted pink",
+    "muted purple",
+    "nasty green",
+    "navajowhite",
+    "navy",
+    "navy blue",
+    "navy green",
+    "neon blue",
+    "neon green",
+    "neon pink",
+    "neon purple",
+    "neon red",
+    "neon yellow",
+    "nice blue",
+    "night blue",
+    "ocean",
+    "ocean blue",
+    "ocean green",
+    "ocher",
+    "ochre",
+    "ocre",
+    "off blue",
+    "off green",
+    "off white",
+    "off yellow",
+    "old pink",
+    "old rose",
+    "oldlace",
+    "olive",
+    "olive brown",
+    "olive drab",
+    "olive green",
+    "olive yellow",
+    "olivedrab",
+    "orange",
+    "orange brown",
+    "orange pink",
+    "orange red",
+    "orange yellow",
+    "orangeish",
+    "orangered",
+    "orangey brown",
+    "orangey red",
+    "orangey yellow",
+    "orangish",
+    "orangish brown",
+    "orangish red",
+    "orchid",
+    "pale",
+    "pale aqua",
+    "pale blue",
+    "pale brown",
+    "pale cyan",
+    "pale gold",
+    "pale green",
+    "pale grey",
+    "pale lavender",
+    "pale light green",
+    "pale lilac",
+    "pale lime",
+    "pale lime green",
+    "pale magenta",
+    "pale mauve",
+    "pale olive",
+    "pale olive green",
+    "pale orange",
+    "pale peach",
+    "pale pink",
+    "pale purple",
+    "pale red",
+    "pale rose",
+    "pale salmon",
+    "pale sky blue",
+    "pale teal",
+    "pale turquoise",
+    "pale violet",
+    "pale yellow",
+    "palegoldenrod",
+    "palegreen",
+    "paleturquoise",
+    "palevioletred",
+    "papayawhip",
+    "parchment",
+    "pastel blue",
+    "pastel green",
+    "pastel orange",
+    "pastel pink",
+    "pastel purple",
+    "pastel red",
+    "pastel yellow",
+    "pea",
+    "pea green",
+    "pea soup",
+    "pea soup green",
+    "peach",
+    "peachpuff",
+    "peachy pink",
+    "peacock blue",
+    "pear",
+    "periwinkle",
+    "periwinkle blue",
+    "perrywinkle",
+    "peru",
+    "petrol",
+    "pig pink",
+    "pine",
+    "pine green",
+    "pink",
+    "pink purple",
+    "pink red",
+    "pink/purple",
+    "pinkish",
+    "pinkish brown",
+    "pinkish grey",
+    "pinkish orange",
+    "pinkish purple",
+    "pinkish red",
+    "pinkish tan",
+    "pinky",
+    "pinky purple",
+    "pinky red",
+    "piss yellow",
+    "pistachio",
+    "plum",
+    "plum purple",
+    "poison green",
+    "poo",
+    "poo brown",
+    "poop",
+    "poop brown",
+    "poop green",
+    "powder blue",
+    "powder pink",
+    "powderblue",
+    "primary blue",
+    "prussian blue",
+    "puce",
+    "puke",
+    "puke brown",
+    "puke green",
+    "puke yellow",
+    "pumpkin",
+    "pumpkin orange",
+    "pure blue",
+    "purple",
+    "purple blue",
+    "purple brown",
+    "purple grey",
+    "purple pink",
+    "purple red",
+    "purple/blue",
+    "purple/pink",
+    "purpleish",
+    "purpleish blue",
+    "purpleish pink",
+    "purpley",
+    "purpley blue",
+    "purpley grey",
+    "purpley pink",
+    "purplish",
+    "purplish blue",
+    "purplish brown",
+    "purplish grey",
+    "purplish pink",
+    "purplish red",
+    "purply",
+    "purply blue",
+    "purply pink",
+    "putty",
+    "r",
+    "racing green",
+    "radioactive green",
+    "raspberry",
+    "raw sienna",
+    "raw umber",
+    "really light blue",
+    "rebeccapurple",
+    "red",
+    "red brown",
+    "red orange",
+    "red pink",
+    "red purple",
+    "red violet",
+    "red wine",
+    "reddish",
+    "reddish brown",
+    "reddish grey",
+    "reddish orange",
+    "reddish pink",
+    "reddish purple",
+    "reddy brown",
+    "rich blue",
+    "rich purple",
+    "robin egg blue",
+    "robin's egg",
+    "robin's egg blue",
+    "rosa",
+    "rose",
+    "rose pink",
+    "rose red",
+    "rosy pink",
+    "rosybrown",
+    "rouge",
+    "royal",
+    "royal blue",
+    "royal purple",
+    "royalblue",
+    "ruby",
+    "russet",
+    "rust",
+    "rust brown",
+    "rust orange",
+    "rust red",
+    "rusty orange",
+    "rusty red",
+    "saddlebrown",
+    "saffron",
+    "sage",
+    "sage green",
+    "salmon",
+    "salmon pink",
+    "sand",
+    "sand brown",
+    "sand yellow",
+    "sandstone",
+    "sandy",
+    "sandy brown",
+    "sandy yellow",
+    "sandybrown",
+    "sap green",
+    "sapphire",
+    "scarlet",
+    "sea",
+    "sea blue",
+    "sea green",
+    "seafoam",
+    "seafoam blue",
+    "seafoam green",
+    "seagreen",
+    "seashell",
+    "seaweed",
+    "seaweed green",
+    "sepia",
+    "shamrock",
+    "shamrock green",
+    "shit",
+    "shit brown",
+    "shit green",
+    "shocking pink",
+    "sick green",
+    "sickly green",
+    "sickly yellow",
+    "sienna",
+    "silver",
+    "sky",
+    "sky blue",
+    "skyblue",
+    "slate",
+    "slate blue",
+    "slate green",
+    "slate grey",
+    "slateblue",
+    "slategray",
+    "slategrey",
+    "slime green",
+    "snot",
+    "snot green",
+    "snow",
+    "soft blue",
+    "soft green",
+    "soft pink",
+    "soft purple",
+    "spearmint",
+    "spring green",
+    "springgreen",
+    "spruce",
+    "squash",
+    "steel",
+    "steel blue",
+    "steel grey",
+    "steelblue",
+    "stone",
+    "stormy blue",
+    "straw",
+    "strawberry",
+    "strong blue",
+    "strong pink",
+    "sun yellow",
+    "sunflower",
+    "sunflower yellow",
+    "sunny yellow",
+    "sunshine yellow",
+    "swamp",
+    "swamp green",
+    "tab:blue",
+    "tab:brown",
+    "tab:cyan",
+    "tab:gray",
+    "tab:green",
+    "tab:olive",
+    "tab:orange",
+    "tab:pink",
+    "tab:purple",
+    "tab:red",
+    "tan",
+    "tan brown",
+    "tan green",
+    "tangerine",
+    "taupe",
+    "tea",
+    "tea green",
+    "teal",
+    "teal blue",
+    "teal green",
+    "tealish",
+    "tealish green",
+    "terra cotta",
+    "terracota",
+    "terracotta",
+    "thistle",
+    "tiffany blue",
+    "tomato",
+    "tomato red",
+    "topaz",
+    "toupe",
+    "toxic green",
+    "tree green",
+    "true blue",
+    "true green",
+    "turquoise",
+    "turquoise blue",
+    "turquoise green",
+    "turtle green",
+    "twilight",
+    "twilight blue",
+    "ugly blue",
+    "ugly brown",
+    "ugly green",
+    "ugly pink",
+    "ugly purple",
+    "ugly yellow",
+    "ultramarine",
+    "ultramarine blue",
+    "umber",
+    "velvet",
+    "vermillion",
+    "very dark blue",
+    "very dark brown",
+    "very dark green",
+    "very dark purple",
+    "very light blue",
+    "very light brown",
+    "very light green",
+    "very light pink",
+    "very light purple",
+    "very pale blue",
+    "very pale green",
+    "vibrant blue",
+    "vibrant green",
+    "vibrant purple",
+    "violet",
+    "violet blue",
+    "violet pink",
+    "violet red",
+    "viridian",
+    "vivid blue",
+    "vivid green",
+    "vivid purple",
+    "vomit",
+    "vomit green",
+    "vomit yellow",
+    "w",
+    "warm blue",
+    "warm brown",
+    "warm grey",
+    "warm pink",
+    "warm purple",
+    "washed out green",
+    "water blue",
+    "watermelon",
+    "weird green",
+    "wheat",
+    "white",
+    "whitesmoke",
+    "windows blue",
+    "wine",
+    "wine red",
+    "wintergreen",
+    "wisteria",
+    "xkcd:acid green",
+    "xkcd:adobe",
+    "xkcd:algae",
+    "xkcd:algae green",
+    "xkcd:almost black",
+    "xkcd:amber",
+    "xkcd:amethyst",
+    "xkcd:apple",
+    "xkcd:apple green",
+    "xkcd:apricot",
+    "xkcd:aqua",
+    "xkcd:aqua blue",
+    "xkcd:aqua green",
+    "xkcd:aqua marine",
+    "xkcd:aquamarine",
+    "xkcd:army green",
+    "xkcd:asparagus",
+    "xkcd:aubergine",
+    "xkcd:auburn",
+    "xkcd:avocado",
+    "xkcd:avocado green",
+    "xkcd:azul",
+    "xkcd:azure",
+    "xkcd:baby blue",
+    "xkcd:baby green",
+    "xkcd:baby pink",
+    "xkcd:baby poo",
+    "xkcd:baby poop",
+    "xkcd:baby poop green",
+    "xkcd:baby puke green",
+    "xkcd:baby purple",
+    "xkcd:baby shit brown",
+    "xkcd:baby shit green",
+    "xkcd:banana",
+    "xkcd:banana yellow",
+    "xkcd:barbie pink",
+    "xkcd:barf green",
+    "xkcd:barney",
+    "xkcd:barney purple",
+    "xkcd:battleship grey",
+    "xkcd:beige",
+    "xkcd:berry",
+    "xkcd:bile",
+    "xkcd:black",
+    "xkcd:bland",
+    "xkcd:blood",
+    "xkcd:blood orange",
+    "xkcd:blood red",
+    "xkcd:blue",
+    "xkcd:blue blue",
+    "xkcd:blue green",
+    "xkcd:blue grey",
+    "xkcd:blue purple",
+    "xkcd:blue violet",
+    "xkcd:blue with a hint of purple",
+    "xkcd:blue/green",
+    "xkcd:blue/grey",
+    "xkcd:blue/purple",
+    "xkcd:blueberry",
+    "xkcd:bluegreen",
+    "xkcd:bluegrey",
+    "xkcd:bluey green",
+    "xkcd:bluey grey",
+    "xkcd:bluey purple",
+    "xkcd:bluish",
+    "xkcd:bluish green",
+    "xkcd:bluish grey",
+    "xkcd:bluish purple",
+    "xkcd:blurple",
+    "xkcd:blush",
+    "xkcd:blush pink",
+    "xkcd:booger",
+    "xkcd:booger green",
+    "xkcd:bordeaux",
+    "xkcd:boring green",
+    "xkcd:bottle green",
+    "xkcd:brick",
+    "xkcd:brick orange",
+    "xkcd:brick red",
+    "xkcd:bright aqua",
+    "xkcd:bright blue",
+    "xkcd:bright cyan",
+    "xkcd:bright green",
+    "xkcd:bright lavender",
+    "xkcd:bright light blue",
+    "xkcd:bright light green",
+    "xkcd:bright lilac",
+    "xkcd:bright lime",
+    "xkcd:bright lime green",
+    "xkcd:bright magenta",
+    "xkcd:bright olive",
+    "xkcd:bright orange",
+    "xkcd:bright pink",
+    "xkcd:bright purple",
+    "xkcd:bright red",
+    "xkcd:bright sea green",
+    "xkcd:bright sky blue",
+    "xkcd:bright teal",
+    "xkcd:bright turquoise",
+    "xkcd:bright violet",
+    "xkcd:bright yellow",
+    "xkcd:bright yellow green",
+    "xkcd:british racing green",
+    "xkcd:bronze",
+    "xkcd:brown",
+    "xkcd:brown green",
+    "xkcd:brown grey",
+    "xkcd:brown orange",
+    "xkcd:brown red",
+    "xkcd:brown yellow",
+    "xkcd:brownish",
+    "xkcd:brownish green",
+    "xkcd:brownish grey",
+    "xkcd:brownish orange",
+    "xkcd:brownish pink",
+    "xkcd:brownish purple",
+    "xkcd:brownish red",
+    "xkcd:brownish yellow",
+    "xkcd:browny green",
+    "xkcd:browny orange",
+    "xkcd:bruise",
+    "xkcd:bubble gum pink",
+    "xkcd:bubblegum",
+    "xkcd:bubblegum pink",
+    "xkcd:buff",
+    "xkcd:burgundy",
+    "xkcd:burnt orange",
+    "xkcd:burnt red",
+    "xkcd:burnt siena",
+    "xkcd:burnt sienna",
+    "xkcd:burnt umber",
+    "xkcd:burnt yellow",
+    "xkcd:burple",
+    "xkcd:butter",
+    "xkcd:butter yellow",
+    "xkcd:butterscotch",
+    "xkcd:cadet blue",
+    "xkcd:camel",
+    "xkcd:camo",
+    "xkcd:camo green",
+    "xkcd:camouflage green",
+    "xkcd:canary",
+    "xkcd:canary yellow",
+    "xkcd:candy pink",
+    "xkcd:caramel",
+    "xkcd:carmine",
+    "xkcd:carnation",
+    "xkcd:carnation pink",
+    "xkcd:carolina blue",
+    "xkcd:celadon",
+    "xkcd:celery",
+    "xkcd:cement",
+    "xkcd:cerise",
+    "xkcd:cerulean",
+    "xkcd:cerulean blue",
+    "xkcd:charcoal",
+    "xkcd:charcoal grey",
+    "xkcd:chartreuse",
+    "xkcd:cherry",
+    "xkcd:cherry red",
+    "xkcd:chestnut",
+    "xkcd:chocolate",
+    "xkcd:chocolate brown",
+    "xkcd:cinnamon",
+    "xkcd:claret",
+    "xkcd:clay",
+    "xkcd:clay brown",
+    "xkcd:clear blue",
+    "xkcd:cloudy blue",
+    "xkcd:cobalt",
+    "xkcd:cobalt blue",
+    "xkcd:cocoa",
+    "xkcd:coffee",
+    "xkcd:cool blue",
+    "xkcd:cool green",
+    "xkcd:cool grey",
+    "xkcd:copper",
+    "xkcd:coral",
+    "xkcd:coral pink",
+    "xkcd:cornflower",
+    "xkcd:cornflower blue",
+    "xkcd:cranberry",
+    "xkcd:cream",
+    "xkcd:creme",
+    "xkcd:crimson",
+    "xkcd:custard",
+    "xkcd:cyan",
+    "xkcd:dandelion",
+    "xkcd:dark",
+    "xkcd:dark aqua",
+    "xkcd:dark aquamarine",
+    "xkcd:dark beige",
+    "xkcd:dark blue",
+    "xkcd:dark blue green",
+    "xkcd:dark blue grey",
+    "xkcd:dark brown",
+    "xkcd:dark coral",
+    "xkcd:dark cream",
+    "xkcd:dark cyan",
+    "xkcd:dark forest green",
+    "xkcd:dark fuchsia",
+    "xkcd:dark gold",
+    "xkcd:dark grass green",
+    "xkcd:dark green",
+    "xkcd:dark green blue",
+    "xkcd:dark grey",
+    "xkcd:dark grey blue",
+    "xkcd:dark hot pink",
+    "xkcd:dark indigo",
+    "xkcd:dark khaki",
+    "xkcd:dark lavender",
+    "xkcd:dark lilac",
+    "xkcd:dark lime",
+    "xkcd:dark lime green",
+    "xkcd:dark magenta",
+    "xkcd:dark maroon",
+    "xkcd:dark mauve",
+    "xkcd:dark mint",
+    "xkcd:dark mint green",
+    "xkcd:dark mustard",
+    "xkcd:dark navy",
+    "xkcd:dark navy blue",
+    "xkcd:dark olive",
+    "xkcd:dark olive green",
+    "xkcd:dark orange",
+    "xkcd:dark pastel green",
+    "xkcd:dark peach",
+    "xkcd:dark periwinkle",
+    "xkcd:dark pink",
+    "xkcd:dark plum",
+    "xkcd:dark purple",
+    "xkcd:dark red",
+    "xkcd:dark rose",
+    "xkcd:dark royal blue",
+    "xkcd:dark sage",
+    "xkcd:dark salmon",
+    "xkcd:dark sand",
+    "xkcd:dark sea green",
+    "xkcd:dark seafoam",
+    "xkcd:dark seafoam green",
+    "xkcd:dark sky blue",
+    "xkcd:dark slate blue",
+    "xkcd:dark tan",
+    "xkcd:dark taupe",
+    "xkcd:dark teal",
+    "xkcd:dark turquoise",
+    "xkcd:dark violet",
+    "xkcd:dark yellow",
+    "xkcd:dark yellow green",
+    "xkcd:darkblue",
+    "xkcd:darkgreen",
+    "xkcd:darkish blue",
+    "xkcd:darkish green",
+    "xkcd:darkish pink",
+    "xkcd:darkish purple",
+    "xkcd:darkish red",
+    "xkcd:deep aqua",
+    "xkcd:deep blue",
+    "xkcd:deep brown",
+    "xkcd:deep green",
+    "xkcd:deep lavender",
+    "xkcd:deep lilac",
+    "xkcd:deep magenta",
+    "xkcd:deep orange",
+    "xkcd:deep pink",
+    "xkcd:deep purple",
+    "xkcd:deep red",
+    "xkcd:deep rose",
+    "xkcd:deep sea blue",
+    "xkcd:deep sky blue",
+    "xkcd:deep teal",
+    "xkcd:deep turquoise",
+    "xkcd:deep violet",
+    "xkcd:denim",
+    "xkcd:denim blue",
+    "xkcd:desert",
+    "xkcd:diarrhea",
+    "xkcd:dirt",
+    "xkcd:dirt brown",
+    "xkcd:dirty blue",
+    "xkcd:dirty green",
+    "xkcd:dirty orange",
+    "xkcd:dirty pink",
+    "xkcd:dirty purple",
+    "xkcd:dirty yellow",
+    "xkcd:dodger blue",
+    "xkcd:drab",
+    "xkcd:drab green",
+    "xkcd:dried blood",
+    "xkcd:duck egg blue",
+    "xkcd:dull blue",
+    "xkcd:dull brown",
+    "xkcd:dull green",
+    "xkcd:dull orange",
+    "xkcd:dull pink",
+    "xkcd:dull purple",
+    "xkcd:dull red",
+    "xkcd:dull teal",
+    "xkcd:dull yellow",
+    "xkcd:dusk",
+    "xkcd:dusk blue",
+    "xkcd:dusky blue",
+    "xkcd:dusky pink",
+    "xkcd:dusky purple",
+    "xkcd:dusky rose",
+    "xkcd:dust",
+    "xkcd:dusty blue",
+    "xkcd:dusty green",
+    "xkcd:dusty lavender",
+    "xkcd:dusty orange",
+    "xkcd:dusty pink",
+    "xkcd:dusty purple",
+    "xkcd:dusty red",
+    "xkcd:dusty rose",
+    "xkcd:dusty teal",
+    "xkcd:earth",
+    "xkcd:easter green",
+    "xkcd:easter purple",
+    "xkcd:ecru",
+    "xkcd:egg shell",
+    "xkcd:eggplant",
+    "xkcd:eggplant purple",
+    "xkcd:eggshell",
+    "xkcd:eggshell blue",
+    "xkcd:electric blue",
+    "xkcd:electric green",
+    "xkcd:electric lime",
+    "xkcd:electric pink",
+    "xkcd:electric purple",
+    "xkcd:emerald",
+    "xkcd:emerald green",
+    "xkcd:evergreen",
+    "xkcd:faded blue",
+    "xkcd:faded green",
+    "xkcd:faded orange",
+    "xkcd:faded pink",
+    "xkcd:faded purple",
+    "xkcd:faded red",
+    "xkcd:faded yellow",
+    "xkcd:fawn",
+    "xkcd:fern",
+    "xkcd:fern green",
+    "xkcd:fire engine red",
+    "xkcd:flat blue",
+    "xkcd:flat green",
+    "xkcd:fluorescent green",
+    "xkcd:fluro green",
+    "xkcd:foam green",
+    "xkcd:forest",
+    "xkcd:forest green",
+    "xkcd:forrest green",
+    "xkcd:french blue",
+    "xkcd:fresh green",
+    "xkcd:frog green",
+    "xkcd:fuchsia",
+    "xkcd:gold",
+    "xkcd:golden",
+    "xkcd:golden brown",
+    "xkcd:golden rod",
+    "xkcd:golden yellow",
+    "xkcd:goldenrod",
+    "xkcd:grape",
+    "xkcd:grape purple",
+    "xkcd:grapefruit",
+    "xkcd:grass",
+    "xkcd:grass green",
+    "xkcd:grassy green",
+    "xkcd:green",
+    "xkcd:green apple",
+    "xkcd:green blue",
+    "xkcd:green brown",
+    "xkcd:green grey",
+    "xkcd:green teal",
+    "xkcd:green yellow",
+    "xkcd:green/blue",
+    "xkcd:green/yellow",
+    "xkcd:greenblue",
+    "xkcd:greenish",
+    "xkcd:greenish beige",
+    "xkcd:greenish blue",
+    "xkcd:greenish brown",
+    "xkcd:greenish cyan",
+    "xkcd:greenish grey",
+    "xkcd:greenish tan",
+    "xkcd:greenish teal",
+    "xkcd:greenish turquoise",
+    "xkcd:greenish yellow",
+    "xkcd:greeny blue",
+    "xkcd:greeny brown",
+    "xkcd:greeny grey",
+    "xkcd:greeny yellow",
+    "xkcd:grey",
+    "xkcd:grey blue",
+    "xkcd:grey brown",
+    "xkcd:grey green",
+    "xkcd:grey pink",
+    "xkcd:grey purple",
+    "xkcd:grey teal",
+    "xkcd:grey/blue",
+    "xkcd:grey/green",
+    "xkcd:greyblue",
+    "xkcd:greyish",
+    "xkcd:greyish blue",
+    "xkcd:greyish brown",
+    "xkcd:greyish green",
+    "xkcd:greyish pink",
+    "xkcd:greyish purple",
+    "xkcd:greyish teal",
+    "xkcd:gross green",
+    "xkcd:gunmetal",
+    "xkcd:hazel",
+    "xkcd:heather",
+    "xkcd:heliotrope",
+    "xkcd:highlighter green",
+    "xkcd:hospital green",
+    "xkcd:hot green",
+    "xkcd:hot magenta",
+    "xkcd:hot pink",
+    "xkcd:hot purple",
+    "xkcd:hunter green",
+    "xkcd:ice",
+    "xkcd:ice blue",
+    "xkcd:icky green",
+    "xkcd:indian red",
+    "xkcd:indigo",
+    "xkcd:indigo blue",
+    "xkcd:iris",
+    "xkcd:irish green",
+    "xkcd:ivory",
+    "xkcd:jade",
+    "xkcd:jade green",
+    "xkcd:jungle green",
+    "xkcd:kelley green",
+    "xkcd:kelly green",
+    "xkcd:kermit green",
+    "xkcd:key lime",
+    "xkcd:khaki",
+    "xkcd:khaki green",
+    "xkcd:kiwi",
+    "xkcd:kiwi green",
+    "xkcd:lavender",
+    "xkcd:lavender blue",
+    "xkcd:lavender pink",
+    "xkcd:lawn green",
+    "xkcd:leaf",
+    "xkcd:leaf green",
+    "xkcd:leafy green",
+    "xkcd:leather",
+    "xkcd:lemon",
+    "xkcd:lemon green",
+    "xkcd:lemon lime",
+    "xkcd:lemon yellow",
+    "xkcd:lichen",
+    "xkcd:light aqua",
+    "xkcd:light aquamarine",
+    "xkcd:light beige",
+    "xkcd:light blue",
+    "xkcd:light blue green",
+    "xkcd:light blue grey",
+    "xkcd:light bluish green",
+    "xkcd:light bright green",
+    "xkcd:light brown",
+    "xkcd:light burgundy",
+    "xkcd:light cyan",
+    "xkcd:light eggplant",
+    "xkcd:light forest green",
+    "xkcd:light gold",
+    "xkcd:light grass green",
+    "xkcd:light green",
+    "xkcd:light green blue",
+    "xkcd:light greenish blue",
+    "xkcd:light grey",
+    "xkcd:light grey blue",
+    "xkcd:light grey green",
+    "xkcd:light indigo",
+    "xkcd:light khaki",
+    "xkcd:light lavendar",
+    "xkcd:light lavender",
+    "xkcd:light light blue",
+    "xkcd:light light green",
+    "xkcd:light lilac",
+    "xkcd:light lime",
+    "xkcd:light lime green",
+    "xkcd:light magenta",
+    "xkcd:light maroon",
+    "xkcd:light mauve",
+    "xkcd:light mint",
+    "xkcd:light mint green",
+    "xkcd:light moss green",
+    "xkcd:light mustard",
+    "xkcd:light navy",
+    "xkcd:light navy blue",
+    "xkcd:light neon green",
+    "xkcd:light olive",
+    "xkcd:light olive green",
+    "xkcd:light orange",
+    "xkcd:light pastel green",
+    "xkcd:light pea green",
+    "xkcd:light peach",
+    "xkcd:light periwinkle",
+    "xkcd:light pink",
+    "xkcd:light plum",
+    "xkcd:light purple",
+    "xkcd:light red",
+    "xkcd:light rose",
+    "xkcd:light royal blue",
+    "xkcd:light sage",
+    "xkcd:light salmon",
+    "xkcd:light sea green",
+    "xkcd:light seafoam",
+    "xkcd:light seafoam green",
+    "xkcd:light sky blue",
+    "xkcd:light tan",
+    "xkcd:light teal",
+    "xkcd:light turquoise",
+    "xkcd:light urple",
+    "xkcd:light violet",
+    "xkcd:light yellow",
+    "xkcd:light yellow green",
+    "xkcd:light yellowish green",
+    "xkcd:lightblue",
+    "xkcd:lighter green",
+    "xkcd:lighter purple",
+    "xkcd:lightgreen",
+    "xkcd:lightish blue",
+    "xkcd:lightish green",
+    "xkcd:lightish purple",
+    "xkcd:lightish red",
+    "xkcd:lilac",
+    "xkcd:liliac",
+    "xkcd:lime",
+    "xkcd:lime green",
+    "xkcd:lime yellow",
+    "xkcd:lipstick",
+    "xkcd:lipstick red",
+    "xkcd:macaroni and cheese",
+    "xkcd:magenta",
+    "xkcd:mahogany",
+    "xkcd:maize",
+    "xkcd:mango",
+    "xkcd:manilla",
+    "xkcd:marigold",
+    "xkcd:marine",
+    "xkcd:marine blue",
+    "xkcd:maroon",
+    "xkcd:mauve",
+    "xkcd:medium blue",
+    "xkcd:medium brown",
+    "xkcd:medium green",
+    "xkcd:medium grey",
+    "xkcd:medium pink",
+    "xkcd:medium purple",
+    "xkcd:melon",
+    "xkcd:merlot",
+    "xkcd:metallic blue",
+    "xkcd:mid blue",
+    "xkcd:mid green",
+    "xkcd:midnight",
+    "xkcd:midnight blue",
+    "xkcd:midnight purple",
+    "xkcd:military green",
+    "xkcd:milk chocolate",
+    "xkcd:mint",
+    "xkcd:mint green",
+    "xkcd:minty green",
+    "xkcd:mocha",
+    "xkcd:moss",
+    "xkcd:moss green",
+    "xkcd:mossy green",
+    "xkcd:mud",
+    "xkcd:mud brown",
+    "xkcd:mud green",
+    "xkcd:muddy brown",
+    "xkcd:muddy green",
+    "xkcd:muddy yellow",
+    "xkcd:mulberry",
+    "xkcd:murky green",
+    "xkcd:mushroom",
+    "xkcd:mustard",
+    "xkcd:mustard brown",
+    "xkcd:mustard green",
+    "xkcd:mustard yellow",
+    "xkcd:muted blue",
+    "xkcd:muted green",
+    "xkcd:muted pink",
+    "xkcd:muted purple",
+    "xkcd:nasty green",
+    "xkcd:navy",
+    "xkcd:navy blue",
+    "xkcd:navy green",
+    "xkcd:neon blue",
+    "xkcd:neon green",
+    "xkcd:neon pink",
+    "xkcd:neon purple",
+    "xkcd:neon red",
+    "xkcd:neon yellow",
+    "xkcd:nice blue",
+    "xkcd:night blue",
+    "xkcd:ocean",
+    "xkcd:ocean blue",
+    "xkcd:ocean green",
+    "xkcd:ocher",
+    "xkcd:ochre",
+    "xkcd:ocre",
+    "xkcd:off blue",
+    "xkcd:off green",
+    "xkcd:off white",
+    "xkcd:off yellow",
+    "xkcd:old pink",
+    "xkcd:old rose",
+    "xkcd:olive",
+    "xkcd:olive brown",
+    "xkcd:olive drab",
+    "xkcd:olive green",
+    "xkcd:olive yellow",
+    "xkcd:orange",
+    "xkcd:orange brown",
+    "xkcd:orange pink",
+    "xkcd:orange red",
+    "xkcd:orange yellow",
+    "xkcd:orangeish",
+    "xkcd:orangered",
+    "xkcd:orangey brown",
+    "xkcd:orangey red",
+    "xkcd:orangey yellow",
+    "xkcd:orangish",
+    "xkcd:orangish brown",
+    "xkcd:orangish red",
+    "xkcd:orchid",
+    "xkcd:pale",
+    "xkcd:pale aqua",
+    "xkcd:pale blue",
+    "xkcd:pale brown",
+    "xkcd:pale cyan",
+    "xkcd:pale gold",
+    "xkcd:pale green",
+    "xkcd:pale grey",
+    "xkcd:pale lavender",
+    "xkcd:pale light green",
+    "xkcd:pale lilac",
+    "xkcd:pale lime",
+    "xkcd:pale lime green",
+    "xkcd:pale magenta",
+    "xkcd:pale mauve",
+    "xkcd:pale olive",
+    "xkcd:pale olive green",
+    "xkcd:pale orange",
+    "xkcd:pale peach",
+    "xkcd:pale pink",
+    "xkcd:pale purple",
+    "xkcd:pale red",
+    "xkcd:pale rose",
+    "xkcd:pale salmon",
+    "xkcd:pale sky blue",
+    "xkcd:pale teal",
+    "xkcd:pale turquoise",
+    "xkcd:pale violet",
+    "xkcd:pale yellow",
+    "xkcd:parchment",
+    "xkcd:pastel blue",
+    "xkcd:pastel green",
+    "xkcd:pastel orange",
+    "xkcd:pastel pink",
+    "xkcd:pastel purple",
+    "xkcd:pastel red",
+    "xkcd:pastel yellow",
+    "xkcd:pea",
+    "xkcd:pea green",
+    "xkcd:pea soup",
+    "xkcd:pea soup green",
+    "xkcd:peach",
+    "xkcd:peachy pink",
+    "xkcd:peacock blue",
+    "xkcd:pear",
+    "xkcd:periwinkle",
+    "xkcd:periwinkle blue",
+    "xkcd:perrywinkle",
+    "xkcd:petrol",
+    "xkcd:pig pink",
+    "xkcd:pine",
+    "xkcd:pine green",
+    "xkcd:pink",
+    "xkcd:pink purple",
+    "xkcd:pink red",
+    "xkcd:pink/purple",
+    "xkcd:pinkish",
+    "xkcd:pinkish brown",
+    "xkcd:pinkish grey",
+    "xkcd:pinkish orange",
+    "xkcd:pinkish purple",
+    "xkcd:pinkish red",
+    "xkcd:pinkish tan",
+    "xkcd:pinky",
+    "xkcd:pinky purple",
+    "xkcd:pinky red",
+    "xkcd:piss yellow",
+    "xkcd:pistachio",
+    "xkcd:plum",
+    "xkcd:plum purple",
+    "xkcd:poison green",
+    "xkcd:poo",
+    "xkcd:poo brown",
+    "xkcd:poop",
+    "xkcd:poop brown",
+    "xkcd:poop green",
+    "xkcd:powder blue",
+    "xkcd:powder pink",
+    "xkcd:primary blue",
+    "xkcd:prussian blue",
+    "xkcd:puce",
+    "xkcd:puke",
+    "xkcd:puke brown",
+    "xkcd:puke green",
+    "xkcd:puke yellow",
+    "xkcd:pumpkin",
+    "xkcd:pumpkin orange",
+    "xkcd:pure blue",
+    "xkcd:purple",
+    "xkcd:purple blue",
+    "xkcd:purple brown",
+    "xkcd:purple grey",
+    "xkcd:purple pink",
+    "xkcd:purple red",
+    "xkcd:purple/blue",
+    "xkcd:purple/pink",
+    "xkcd:purpleish",
+    "xkcd:purpleish blue",
+    "xkcd:purpleish pink",
+    "xkcd:purpley",
+    "xkcd:purpley blue",
+    "xkcd:purpley grey",
+    "xkcd:purpley pink",
+    "xkcd:purplish",
+    "xkcd:purplish blue",
+    "xkcd:purplish brown",
+    "xkcd:purplish grey",
+    "xkcd:purplish pink",
+    "xkcd:purplish red",
+    "xkcd:purply",
+    "xkcd:purply blue",
+    "xkcd:purply pink",
+    "xkcd:putty",
+    "xkcd:racing green",
+    "xkcd:radioactive green",
+    "xkcd:raspberry",
+    "xkcd:raw sienna",
+    "xkcd:raw umber",
+    "xkcd:really light blue",
+    "xkcd:red",
+    "xkcd:red brown",
+    "xkcd:red orange",
+    "xkcd:red pink",
+    "xkcd:red purple",
+    "xkcd:red violet",
+    "xkcd:red wine",
+    "xkcd:reddish",
+    "xkcd:reddish brown",
+    "xkcd:reddish grey",
+    "xkcd:reddish orange",
+    "xkcd:reddish pink",
+    "xkcd:reddish purple",
+    "xkcd:reddy brown",
+    "xkcd:rich blue",
+    "xkcd:rich purple",
+    "xkcd:robin egg blue",
+    "xkcd:robin's egg",
+    "xkcd:robin's egg blue",
+    "xkcd:rosa",
+    "xkcd:rose",
+    "xkcd:rose pink",
+    "xkcd:rose red",
+    "xkcd:rosy pink",
+    "xkcd:rouge",
+    "xkcd:royal",
+    "xkcd:royal blue",
+    "xkcd:royal purple",
+    "xkcd:ruby",
+    "xkcd:russet",
+    "xkcd:rust",
+    "xkcd:rust brown",
+    "xkcd:rust orange",
+    "xkcd:rust red",
+    "xkcd:rusty orange",
+    "xkcd:rusty red",
+    "xkcd:saffron",
+    "xkcd:sage",
+    "xkcd:sage green",
+    "xkcd:salmon",
+    "xkcd:salmon pink",
+    "xkcd:sand",
+    "xkcd:sand brown",
+    "xkcd:sand yellow",
+    "xkcd:sandstone",
+    "xkcd:sandy",
+    "xkcd:sandy brown",
+    "xkcd:sandy yellow",
+    "xkcd:sap green",
+    "xkcd:sapphire",
+    "xkcd:scarlet",
+    "xkcd:sea",
+    "xkcd:sea blue",
+    "xkcd:sea green",
+    "xkcd:seafoam",
+    "xkcd:seafoam blue",
+    "xkcd:seafoam green",
+    "xkcd:seaweed",
+    "xkcd:seaweed green",
+    "xkcd:sepia",
+    "xkcd:shamrock",
+    "xkcd:shamrock green",
+    "xkcd:shit",
+    "xkcd:shit brown",
+    "xkcd:shit green",
+    "xkcd:shocking pink",
+    "xkcd:sick green",
+    "xkcd:sickly green",
+    "xkcd:sickly yellow",
+    "xkcd:sienna",
+    "xkcd:silver",
+    "xkcd:sky",
+    "xkcd:sky blue",
+    "xkcd:slate",
+    "xkcd:slate blue",
+    "xkcd:slate green",
+    "xkcd:slate grey",
+    "xkcd:slime green",
+    "xkcd:snot",
+    "xkcd:snot green",
+    "xkcd:soft blue",
+    "xkcd:soft green",
+    "xkcd:soft pink",
+    "xkcd:soft purple",
+    "xkcd:spearmint",
+    "xkcd:spring green",
+    "xkcd:spruce",
+    "xkcd:squash",
+    "xkcd:steel",
+    "xkcd:steel blue",
+    "xkcd:steel grey",
+    "xkcd:stone",
+    "xkcd:stormy blue",
+    "xkcd:straw",
+    "xkcd:strawberry",
+    "xkcd:strong blue",
+    "xkcd:strong pink",
+    "xkcd:sun yellow",
+    "xkcd:sunflower",
+    "xkcd:sunflower yellow",
+    "xkcd:sunny yellow",
+    "xkcd:sunshine yellow",
+    "xkcd:swamp",
+    "xkcd:swamp green",
+    "xkcd:tan",
+    "xkcd:tan brown",
+    "xkcd:tan green",
+    "xkcd:tangerine",
+    "xkcd:taupe",
+    "xkcd:tea",
+    "xkcd:tea green",
+    "xkcd:teal",
+    "xkcd:teal blue",
+    "xkcd:teal green",
+    "xkcd:tealish",
+    "xkcd:tealish green",
+    "xkcd:terra cotta",
+    "xkcd:terracota",
+    "xkcd:terracotta",
+    "xkcd:tiffany blue",
+    "xkcd:tomato",
+    "xkcd:tomato red",
+    "xkcd:topaz",
+    "xkcd:toupe",
+    "xkcd:toxic green",
+    "xkcd:tree green",
+    "xkcd:true blue",
+    "xkcd:true green",
+    "xkcd:turquoise",
+    "xkcd:turquoise blue",
+    "xkcd:turquoise green",
+    "xkcd:turtle green",
+    "xkcd:twilight",
+    "xkcd:twilight blue",
+    "xkcd:ugly blue",
+    "xkcd:ugly brown",
+    "xkcd:ugly green",
+    "xkcd:ugly pink",
+    "xkcd:ugly purple",
+    "xkcd:ugly yellow",
+    "xkcd:ultramarine",
+    "xkcd:ultramarine blue",
+    "xkcd:umber",
+    "xkcd:velvet",
+    "xkcd:vermillion",
+    "xkcd:very dark blue",
+    "xkcd:very dark brown",
+    "xkcd:very dark green",
+    "xkcd:very dark purple",
+    "xkcd:very light blue",
+    "xkcd:very light brown",
+    "xkcd:very light green",
+    "xkcd:very light pink",
+    "xkcd:very light purple",
+    "xkcd:very pale blue",
+    "xkcd:very pale green",
+    "xkcd:vibrant blue",
+    "xkcd:vibrant green",
+    "xkcd:vibrant purple",
+    "xkcd:violet",
+    "xkcd:violet blue",
+    "xkcd:violet pink",
+    "xkcd:violet red",
+    "xkcd:viridian",
+    "xkcd:vivid blue",
+    "xkcd:vivid green",
+    "xkcd:vivid purple",
+    "xkcd:vomit",
+    "xkcd:vomit green",
+    "xkcd:vomit yellow",
+    "xkcd:warm blue",
+    "xkcd:warm brown",
+    "xkcd:warm grey",
+    "xkcd:warm pink",
+    "xkcd:warm purple",
+    "xkcd:washed out green",
+    "xkcd:water blue",
+    "xkcd:watermelon",
+    "xkcd:weird green",
+    "xkcd:wheat",
+    "xkcd:white",
+    "xkcd:windows blue",
+    "xkcd:wine",
+    "xkcd:wine red",
+    "xkcd:wintergreen",
+    "xkcd:wisteria",
+    "xkcd:yellow",
+    "xkcd:yellow brown",
+    "xkcd:yellow green",
+    "xkcd:yellow ochre",
+    "xkcd:yellow orange",
+    "xkcd:yellow tan",
+    "xkcd:yellow/green",
+    "xkcd:yellowgreen",
+    "xkcd:yellowish",
+    "xkcd:yellowish brown",
+    "xkcd:yellowish green",
+    "xkcd:yellowish orange",
+    "xkcd:yellowish tan",
+    "xkcd:yellowy brown",
+    "xkcd:yellowy green",
+    "y",
+    "yellow",
+    "yellow brown",
+    "yellow green",
+    "yellow ochre",
+    "yellow orange",
+    "yellow tan",
+    "yellow/green",
+    "yellowgreen",
+    "yellowish",
+    "yellowish brown",
+    "yellowish green",
+    "yellowish orange",
+    "yellowish tan",
+    "yellowy brown",
+    "yellowy green",
+)
+
+# the hex RGB value of NAMES[i] is VALUES[6 * i : 6 * i + 6]
+VALUES = (
+    "8ffe09bd6c4854ac6821c36fF0F8FF070d0dfeb3089b5fc0FAEBD76ecb3c76cd26ffb16d13eac902d8e912e193"
+    "2ee8bb04d8b24b5d1677ab563d07349a300190b13487a9221d5dec069af30000ffa2cffe8cff9effb7ceab9004"
+    "937c008f9805b6c406ca9bf7ad900d889717ffff7efafe4bfe46a594ac02ac1db8a004986b7c85e6daa6990f4b"
+    "b5c306FFE4C4000000FFEBCDafa88b770001fe4b039800023498db2242c7137e6d607c8e5729ce5d06e9533cc6"
+    "0f9b8e758da35a06ef464196017a7985a3b28A2BE22bb17989a0b06241c72976bb10a674748b97703be77289da"
+    "f29e8efe828c9bb53c96b4037b002c63b365044a05a03623c14a098f14020bf9ea0165fc41fdfe01ff07c760ff"
+    "26f7fd2dfe54c95efb87fd0565fe08ff08e89cbb04ff5b00fe01b1be03fdff000d05ffa602ccfe01f9c60ffef9"
+    "ad0afdfffd019dff0005480da879008c564b706c118d8468b96902922b05b297059c6d576a6e0986775fcb7723"
+    "c27e7976424e9e3623c9b0036f6c0aca6b027e4071ff69afff6cb5fe83ccfef69e610023DEB887c04e019f2305"
+    "b75203b04e0fa0450ed5ab096832e3ffff81fffd74fdb14700bfbf4e74965F9EA0c69f597f8f4e5265254b6113"
+    "fdff63fffe40ff63e9af6f099d0216fd798fff7fa78ab8febefdb7c1fd95a5a391de0c620485d1056eee343837"
+    "3c4142c1f80acf0234f7022a7428023d1c02411900ac4f06680018b66a50b2713d247afdacc2d91e488f030aa7"
+    "875f42a6814c4984b833b86495a3a6b66325fc5a50ff61636a79f75170d76495EDFFF8DC9e003affffc2ffffb6"
+    "8c000fF0F8FFFAEBD700FFFF7FFFD4F0FFFFF5F5DCFFE4C4000000FFEBCD0000FF8A2BE2A52A2ADEB8875F9EA0"
+    "7FFF00D2691EFF7F506495EDFFF8DCDC143C00FFFF00008B008B8BB8860BA9A9A9006400A9A9A9BDB76B8B008B"
+    "556B2FFF8C009932CC8B0000E9967A8FBC8F483D8B2F4F4F2F4F4F00CED19400D3FF149300BFFF696969696969"
+    "1E90FFB22222FFFAF0228B22FF00FFDCDCDCF8F8FFFFD700DAA520808080008000ADFF2F808080F0FFF0FF69B4"
+    "CD5C5C4B0082FFFFF0F0E68CE6E6FAFFF0F57CFC00FFFACDADD8E6F08080E0FFFFFAFAD2D3D3D390EE90D3D3D3"
+    "FFB6C1FFA07A20B2AA87CEFA778899778899B0C4DEFFFFE000FF0032CD32FAF0E6FF00FF80000066CDAA0000CD"
+    "BA55D39370DB3CB3717B68EE00FA9A48D1CCC71585191970F5FFFAFFE4E1FFE4B5FFDEAD000080FDF5E6808000"
+    "6B8E23FFA500FF4500DA70D6EEE8AA98FB98AFEEEEDB7093FFEFD5FFDAB9CD853FFFC0CBDDA0DDB0E0E6800080"
+    "663399FF0000BC8F8F4169E18B4513FA8072F4A4602E8B57FFF5EEA0522DC0C0C087CEEB6A5ACD708090708090"
+    "FFFAFA00FF7F4682B4D2B48C008080D8BFD8FF634740E0D0EE82EEF5DEB3FFFFFFF5F5F5FFFF009ACD32fffd78"
+    "17becffedf081b243105696b017371ac93622066940052491f3b4d341c02cf524efff39a0a888a002d049d0759"
+    "c27c0e388004607d8b1f8b4c1f635736373729465bd901661f09549b8f558567989c6da584b7017ebd01ad1457"
+    "3c0008874c6248c07220c073a8890500043500022e373e023c4d03a8430056ae57de7e5d665fd1cb416b3f012c"
+    "71368a992d22b5485d02066f598556c85a53a88f5911875d1fb57a3eaf76448ee4214761af884a7f684e11806a"
+    "045c5a34013fd5b60a728f02030764008B8B546e7aB8860BA9A9A9054907A9A9A9014182287c37da467d751973"
+    "a90308BDB76B8B008B556B2FFF8C009932CC8B0000E9967A8FBC8F483D8B2F4F4F2F4F4F00CED19400D308787f"
+    "04027341020002590f8d5eb7966ebda0025cdc4d01cb016236013f9a0200c747670154820d75f800555a017374"
+    "490648FF149300BFFF0000003b638c3b5b92ccad609f83036969696969698a6e458365393f829d667e2cc87606"
+    "ca7b80734a65cdc50a3498db7289da206694c27c0e607d8b1f8b4cad1457a8430071368a992d2211806a546e7a"
+    "000000f1c40f99aab52ecc71979c9f95a5a6e91e63e67e229b59b6e74c3c1abc9c3e82fc1E90FF828344749551"
+    "4b0101c3fbf449759c876e4b74a662d8863bd5869d84597ebb3f3f5f9e8feedc5b4e548126538d475f94cc7a8b"
+    "895b7bba6873b2996e5a86ad76a973ac86a8f0833ad58a94825f87b9484ec0737a4c9085a2653e8cfd7ec071fe"
+    "feffcafffcc4380835430541ffffd4c4fff70652ff21fc0da8ff04ff0490aa23ff01a049028f1e05472a658cbb"
+    "7bb274f0944dde9dac916e99d3494efeff7fcfaf7b63a950548d44fe0002B222223c73a8699d4cFFFAF008ff08"
+    "0aff0290fda90b550906470c228B22154406436bad69d84f58bc08ed0dd9007f00DCDCDCF8F8FFf1c40ff5bf03"
+    "b27a01f9bc08fec615fac2056c34615d1451fd59565cac2d3f9b0b419c037f7f7f99aab52ecc715edc1f06b48b"
+    "544e0377926f0cb577c9ff2701c08db5ce0823c48b40a368c9d1790b8b876961122afeb796ae8dbccb7a32bf84"
+    "00fbb0cdfd0242b3956960067ea07ac6f808ADFF2F9295916b8ba47f7053789b73c3909b826d8c5e9b8a647d8e"
+    "86a17d77a1b5a8a4955e819d7a6a4f82a67dc88d94887191719f91a0bf165362678e7618a484acd94ff51bfc06"
+    "F0FFF09be5aa25ff29f504c9ff028dcb00f5FF69B40b4008d6fffad7fffe8fae22850e04CD5C5C3802823a18b1"
+    "6258c4019529ffffcb1fa7742baf6a04824300000000933702ab2e5cb200aeff6eaaa6627286399cef438ee53f"
+    "c79fef8b88f8dd85d7FFF0F54da4097CFC0071aa345ca90451b73bac7434fdff52adf802bffe28fdff38FFFACD"
+    "8fb67b8cffdb7bfdc7fffeb695d0fc7efbb3b7c9e276fda853fe5cad8150a8415bacfffc8945854f9153fddc5c"
+    "9af764979c9f96f97b56fca263f7b4d8dcd69dbcd4b7e1a16d5acfe6f2a2efc0fedfc5fecafffbc8ffb0edc8ff"
+    "aefd6cb9ff66fa5ff7a24857c292a1b6ffbba6fbb2a6c875f7d5601550842e5a884efd54acbf69a4be5cfdaa48"
+    "b2fba5c4fe82ffd8b1c1c6fcffd1df9d5783bf77f6ff474cffc5cb3a2efebcecacfea99398f6b0a0febfa7ffb5"
+    "c6fcfffbeeac90e4c17ef4ccb36ff6d6b4fcfffe7accfd7fc2ff897bc8f6F08080E0FFFF95a5a675fd63a55af4"
+    "FAFAD2D3D3D376ff7bD3D3D33d7afd61e160a552e6fe2f4aFFB6C1FFA07A20B2AA87CEFA778899778899B0C4DE"
+    "FFFFE0cea2fdc48efdaaff3289fe05d0fe1d32CD32FAF0E6d5174ec0022fbf00bfefb435e91e634a0100f4d054"
+    "ffa62bfffa86fcc006042e6001386a650021ae71812c6fbb7f511239ad487d7f7cf361969e43a266CDAA0000CD"
+    "BA55D39370DB3CB3717B68EE00FA9A48D1CCC71585ff78557300394f738e276ab350a74703012d020035280137"
+    "191970667c3e7f4e1e9ffeb08fff9fF5FFFA0bf77dFFE4E1FFE4B59d7651769958658b38638b27735c1260460f"
+    "606602886806657432bfac05920a4e6c7a0eba9e88ceb301ac7e04a8b504d2bd0a3b719f5fa052d1768f805b87"
+    "70b23fFFDEAD01153e00114635530a04d9ff0cff0cfe019abc13feff073acfff04107ab0040348017b9203719c"
+    "3d9973bf9b0cbf9005c69c045684ae6ba353ffffe4f1f33fc77986c87f89FDF5E6bcbd226454036f7632677a04"
+    "c2b7096B8E23e67e22be6400ff6f52fd411effad01fd8d49fe420fb16002fa4224fdb915fc824ab25f03f43605"
+    "c875c4fff9d0b8ffebd0fefeb1916eb7fffafdde6cc7fdb5fdfdfeeecffeb1fc99e4cbffbefd73b1ff65d767ad"
+    "fed0fcb9cc81b1d27bffa756ffe5adffcfdcb790d4d9544dfdc1c5ffb19abdf6fe82cbb2a5fbd5ceaefaffff84"
+    "EEE8AA98FB98AFEEEEDB7093FFEFD5fefcafa2bffeb0ff9dff964fffbacdcaa0ffdb5856fffe71a4bf208eab12"
+    "92990194a617ffb07cFFDAB9ff9a8a016795cbf85f8e82fe8f99fb8f8ce7CD853F005f6ae78ea52b5d340a481e"
+    "e377c2db4bdaf5054fef1de7d46a7eb17261c8aca9ff724cd648d7f10c45d99b82fc86aac94cbefc2647ddd618"
+    "c0fa8b580f414e055040fd148f7303885f017f5e007a59016f7c00b1d1fcffb2d0B0E0E60804f9004577a57e52"
+    "a5a5029477069aae07c2be0ee17701fb7d070203e29b59b6632de9673a3f866f85e03fd89901475d21d0d725de"
+    "98568d6140efdf4ec88756e45f34e7947e94c83cb994568c601ef96b42477a687fce5daeb0054b983fb2661aee"
+    "f075e6beae8aff00000146002cfa1fb001499a6200a75e09d4ffff663399e74c3c8b2e16fd3c06fa2a55820747"
+    "9e01688c0034c442407f2b0a997570f8481cfe2c549109516e1005021bf97200588af1fe6dedfd98eff9fe86a4"
+    "cf6275f7879abe013cf6688eBC8F8Fab12390c17930504aa4b006e4169E1ca0147a13905a83c098b3103c45508"
+    "aa2704cd5909af2f0d8B4513feb20987ae7388b378ff796cfe7b7ce2ca76cba560fce166c9ae74f1da7ac4a661"
+    "fdee73F4A4605c8b152138abbe01193c999204749553fca180f9ad78d1b67af9ab2E8B57FFF5EE18d17b35ad6b"
+    "985e2b01b44c02c14d7f5f007b5804758000fe02a29db92c94b21cd0e429a9561ec5c9c782cafc75bbfd87CEEB"
+    "5165725b7c99658d6d59656d6A5ACD70809070809099cc04acbb0d9dc100FFFAFA6488ea6fc276fdb0c0a66fb5"
+    "1ef876a9f97100FF7F0a5f38f2ab157385955a7d9a6f828a4682B4ada587507b9cfcf679fb29430c06f7ff0789"
+    "ffdf22ffc512ffda03fff917fffd376983397485001f77b48c564b17becf7f7f7f2ca02cbcbd22ff7f0ee377c2"
+    "9467bdd62728d1b26fab7e4ca9be70ff9408b9a28165ab7cbdf8a31abc9c01889f25a36f24bca80cdc73c9643b"
+    "cb6843ca6641D8BFD87bf2daef4026ec2d0113bbafc7ac7d61de2a2a7e19010fcc08940406c2ac06b1c404f489"
+    "75b84f4e518b0a437a31668a7d71037a9703cd7584a442a0d0c1012000b11805dbb26400750851f4320c000133"
+    "1d0200062e032a0134d5ffffd3b683d1ffbdfff4f2f6cefcd6fffecffdbc0339f80add08ad03de9a0eea510ac9"
+    "fb5ffca500551e9167152eff2fef109900faa2a41589a203c7c10cffffff4b57db964e02978a84fb5581952e8f"
+    "bcf5a60e87ccfd46593ae57ffbdd7effffffF5F5F53778bf80013f7b032320f986a87dc28ffe09bd6c4854ac68"
+    "21c36f070d0dfeb3089b5fc06ecb3c76cd26ffb16d13eac902d8e912e1932ee8bb04d8b24b5d1677ab563d0734"
+    "9a300190b13487a9221d5dec069af3a2cffe8cff9effb7ceab9004937c008f9805b6c406ca9bf7ad900d889717"
+    "ffff7efafe4bfe46a594ac02ac1db8a004986b7c85e6daa6990f4bb5c306000000afa88b770001fe4b03980002"
+    "0343df2242c7137e6d607c8e5729ce5d06e9533cc60f9b8e758da35a06ef464196017a7985a3b22bb17989a0b0"
+    "6241c72976bb10a674748b97703be75539ccf29e8efe828c9bb53c96b4037b002c63b365044a05a03623c14a09"
+    "8f14020bf9ea0165fc41fdfe01ff07c760ff26f7fd2dfe54c95efb87fd0565fe08ff08e89cbb04ff5b00fe01b1"
+    "be03fdff000d05ffa602ccfe01f9c60ffef9ad0afdfffd019dff0005480da87900653700706c118d8468b96902"
+    "922b05b297059c6d576a6e0986775fcb7723c27e7976424e9e3623c9b0036f6c0aca6b027e4071ff69afff6cb5"
+    "fe83ccfef69e610023c04e019f2305b75203b04e0fa0450ed5ab096832e3ffff81fffd74fdb1474e7496c69f59"
+    "7f8f4e5265254b6113fdff63fffe40ff63e9af6f099d0216fd798fff7fa78ab8febefdb7c1fd95a5a391de0c62"
+    "0485d1056eee3438373c4142c1f80acf0234f7022a7428023d1c02411900ac4f06680018b66a50b2713d247afd"
+    "acc2d91e488f030aa7875f42a6814c4984b833b86495a3a6b66325fc5a50ff61636a79f75170d79e003affffc2"
+    "ffffb68c000ffffd7800fffffedf081b243105696b017371ac936200035b0052491f3b4d341c02cf524efff39a"
+    "0a888a002d049d0759b594103880040335001f635736373729465bd901661f09549b8f558567989c6da584b701"
+    "7ebd019600563c0008874c6248c07220c073a8890500043500022e373e023c4d03c6510256ae57de7e5d665fd1"
+    "cb416b3f012c35063e840000b5485d02066f598556c85a53a88f5911875d1fb57a3eaf76448ee4214761af884a"
+    "7f684e014d4e045c5a34013fd5b60a728f02030764054907014182287c37da467d751973a9030808787f040273"
+    "41020002590f8d5eb7966ebda0025cdc4d01cb016236013f9a0200c747670154820d75f800555a017374490648"
+    "3b638c3b5b92ccad609f83038a6e458365393f829d667e2cc87606ca7b80734a65cdc50a3e82fc828344749551"
+    "4b0101c3fbf449759c876e4b74a662d8863bd5869d84597ebb3f3f5f9e8feedc5b4e548126538d475f94cc7a8b"
+    "895b7bba6873b2996e5a86ad76a973ac86a8f0833ad58a94825f87b9484ec0737a4c9085a2653e8cfd7ec071fe"
+    "feffcafffcc4380835430541ffffd4c4fff70652ff21fc0da8ff04ff0490aa23ff01a049028f1e05472a658cbb"
+    "7bb274f0944dde9dac916e99d3494efeff7fcfaf7b63a950548d44fe00023c73a8699d4c08ff080aff0290fda9"
+    "0b550906470c154406436bad69d84f58bc08ed0dd9dbb40cf5bf03b27a01f9bc08fec615fac2056c34615d1451"
+    "fd59565cac2d3f9b0b419c0315b01a5edc1f06b48b544e0377926f0cb577c9ff2701c08db5ce0823c48b40a368"
+    "c9d1790b8b876961122afeb796ae8dbccb7a32bf8400fbb0cdfd0242b3956960067ea07ac6f8089295916b8ba4"
+    "7f7053789b73c3909b826d8c5e9b8a647d8e86a17d77a1b5a8a4955e819d7a6a4f82a67dc88d94887191719f91"
+    "a0bf165362678e7618a484acd94ff51bfc069be5aa25ff29f504c9ff028dcb00f50b4008d6fffad7fffe8fae22"
+    "850e043802823a18b16258c4019529ffffcb1fa7742baf6a04824300933702ab2e5cb200aeff6eaaa662728639"
+    "9cef438ee53fc79fef8b88f8dd85d74da40971aa345ca90451b73bac7434fdff52adf802bffe28fdff388fb67b"
+    "8cffdb7bfdc7fffeb695d0fc7efbb3b7c9e276fda853fe5cad8150a8415bacfffc8945854f9153fddc5c9af764"
+    "96f97b56fca263f7b4d8dcd69dbcd4b7e1a16d5acfe6f2a2efc0fedfc5fecafffbc8ffb0edc8ffaefd6cb9ff66"
+    "fa5ff7a24857c292a1b6ffbba6fbb2a6c875f7d5601550842e5a884efd54acbf69a4be5cfdaa48b2fba5c4fe82"
+    "ffd8b1c1c6fcffd1df9d5783bf77f6ff474cffc5cb3a2efebcecacfea99398f6b0a0febfa7ffb5c6fcfffbeeac"
+    "90e4c17ef4ccb36ff6d6b4fcfffe7accfd7fc2ff897bc8f675fd63a55af476ff7b3d7afd61e160a552e6fe2f4a"
+    "cea2fdc48efdaaff3289fe05d0fe1dd5174ec0022fefb435c200784a0100f4d054ffa62bfffa86fcc006042e60"
+    "01386a650021ae71812c6fbb7f511239ad487d7f7cf361969e43a2ff78557300394f738e276ab350a74703012d"
+    "020035280137667c3e7f4e1e9ffeb08fff9f0bf77d9d7651769958658b38638b27735c1260460f606602886806"
+    "657432bfac05920a4e6c7a0eba9e88ceb301ac7e04a8b504d2bd0a3b719f5fa052d1768f805b8770b23f01153e"
+    "00114635530a04d9ff0cff0cfe019abc13feff073acfff04107ab0040348017b9203719c3d9973bf9b0cbf9005"
+    "c69c045684ae6ba353ffffe4f1f33fc77986c87f896e750e6454036f7632677a04c2b709f97306be6400ff6f52"
+    "fd411effad01fd8d49fe420fb16002fa4224fdb915fc824ab25f03f43605c875c4fff9d0b8ffebd0fefeb1916e"
+    "b7fffafdde6cc7fdb5fdfdfeeecffeb1fc99e4cbffbefd73b1ff65d767adfed0fcb9cc81b1d27bffa756ffe5ad"
+    "ffcfdcb790d4d9544dfdc1c5ffb19abdf6fe82cbb2a5fbd5ceaefaffff84fefcafa2bffeb0ff9dff964fffbacd"
+    "caa0ffdb5856fffe71a4bf208eab1292990194a617ffb07cff9a8a016795cbf85f8e82fe8f99fb8f8ce7005f6a"
+    "e78ea52b5d340a481eff81c0db4bdaf5054fef1de7d46a7eb17261c8aca9ff724cd648d7f10c45d99b82fc86aa"
+    "c94cbefc2647ddd618c0fa8b580f414e055040fd148f7303885f017f5e007a59016f7c00b1d1fcffb2d00804f9"
+    "004577a57e52a5a5029477069aae07c2be0ee17701fb7d070203e27e1e9c632de9673a3f866f85e03fd8990147"
+    "5d21d0d725de98568d6140efdf4ec88756e45f34e7947e94c83cb994568c601ef96b42477a687fce5daeb0054b"
+    "983fb2661aeef075e6beae8a0146002cfa1fb001499a6200a75e09d4ffffe500008b2e16fd3c06fa2a55820747"
+    "9e01688c0034c442407f2b0a997570f8481cfe2c549109516e1005021bf97200588af1fe6dedfd98eff9fe86a4"
+    "cf6275f7879abe013cf6688eab12390c17930504aa4b006eca0147a13905a83c098b3103c45508aa2704cd5909"
+    "af2f0dfeb20987ae7388b378ff796cfe7b7ce2ca76cba560fce166c9ae74f1da7ac4a661fdee735c8b152138ab"
+    "be01193c999204749553fca180f9ad78d1b67af9ab18d17b35ad6b985e2b01b44c02c14d7f5f007b5804758000"
+    "fe02a29db92c94b21cd0e429a9561ec5c9c782cafc75bbfd5165725b7c99658d6d59656d99cc04acbb0d9dc100"
+    "6488ea6fc276fdb0c0a66fb51ef876a9f9710a5f38f2ab157385955a7d9a6f828aada587507b9cfcf679fb2943"
+    "0c06f7ff0789ffdf22ffc512ffda03fff917fffd37698339748500d1b26fab7e4ca9be70ff9408b9a28165ab7c"
+    "bdf8a302938601889f25a36f24bca80cdc73c9643bcb6843ca66417bf2daef4026ec2d0113bbafc7ac7d61de2a"
+    "2a7e19010fcc08940406c2ac06b1c404f48975b84f4e518b0a437a31668a7d71037a9703cd7584a442a0d0c101"
+    "2000b11805dbb26400750851f4320c0001331d0200062e032a0134d5ffffd3b683d1ffbdfff4f2f6cefcd6fffe"
+    "cffdbc0339f80add08ad03de9a0eea510ac9fb5ffca500551e9167152eff2fef109900faa2a41589a203c7c10c"
+    "4b57db964e02978a84fb5581952e8fbcf5a60e87ccfd46593ae57ffbdd7effffff3778bf80013f7b032320f986"
+    "a87dc2ffff14b79400c0fb2dcb9d06fcb001ffe36ec8fd3dbbf90ffaee669b7a01b0dd16ffab0ffcfc81ae8b0c"
+    "bff128bfbf00ffff14b79400c0fb2dcb9d06fcb001ffe36ec8fd3dbbf90ffaee669b7a01b0dd16ffab0ffcfc81"
+    "ae8b0cbff128"
+)
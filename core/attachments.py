@@ -0,0 +1,224 @@
+"""
+Downloading of attachments to upload them again, e.g. for plain replies.
+"""
+
+import asyncio
+import os
+import tempfile
+import typing
+from collections import OrderedDict
+from io import BytesIO
+from urllib import parse
+
+import discord
+from aiohttp import ClientError, ClientSession, ClientTimeout
+
+from core.models import getLogger
+
+logger = getLogger(__name__)
+
+# Discord's upload limit outside of boosted guilds.
+DEFAULT_UPLOAD_LIMIT = 8 * 1024 * 1024
+
+
+class AttachmentTooLarge(Exception):
+    """Raised when an attachment is larger than the upload limit."""
+
+    def __init__(self, url: str, size: int, limit: int):
+        super().__init__(f"{url} is {size} bytes, over the {limit} bytes limit.")
+        self.url = url
+        self.size = size
+        self.limit = limit
+
+
+class AttachmentFetcher:
+    """
+    Downloads attachments with a bounded concurrency.
+
+    Small attachments are kept in memory and the most recent ones are
+    cached by URL, larger ones are streamed into temporary files.
+
+    Parameters
+    ----------
+    session : ClientSession
+        The HTTP session to download with.
+    max_concurrency : int
+        The number of downloads that can run at once.
+    spool_threshold : int
+        Attachments larger than this (in bytes) are written to disk.
+    timeout : float
+        The total time allowed for a download, in seconds.
+    cache_size : int
+        The total size (in bytes) of the attachments kept in the cache.
+    """
+
+    chunk_size = 64 * 1024
+
+    def __init__(
+        self,
+        session: ClientSession,
+        *,
+        max_concurrency: int = 4,
+        spool_threshold: int = 1024 * 1024,
+        timeout: float = 30,
+        cache_size: int = 16 * 1024 * 1024,
+    ):
+        self.session = session
+        self.spool_threshold = spool_threshold
+        self.timeout = ClientTimeout(total=timeout)
+        self.cache_size = cache_size
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._cache = OrderedDict()
+        self._cached_bytes = 0
+
+    @staticmethod
+    def filename_from_url(url: str) -> str:
+        return os.path.basename(parse.urlsplit(url).path) or "attachment"
+
+    def _cache_get(self, url: str) -> typing.Optional[bytes]:
+        data = self._cache.get(url)
+        if data is not None:
+            self._cache.move_to_end(url)
+        return data
+
+    def _cache_put(self, url: str, data: bytes) -> None:
+        if len(data) > self.cache_size or url in self._cache:
+            return
+        self._cache[url] = data
+        self._cached_bytes += len(data)
+        while self._cached_bytes > self.cache_size:
+            _, evicted = self._cache.popitem(last=False)
+            self._cached_bytes -= len(evicted)
+
+    async def _download(self, url: str, limit: int) -> typing.Tuple[typing.BinaryIO, int]:
+        """Downloads an attachment into memory or a temporary file, returns it and its size."""
+        data = self._cache_get(url)
+        if data is not None:
+            if len(data) > limit:
+                raise AttachmentTooLarge(url, len(data), limit)
+            return BytesIO(data), len(data)
+
+        loop = asyncio.get_event_loop()
+        fp = None
+        chunks = []
+        buffered = size = 0
+        async with self._semaphore:
+            async with self.session.get(url, timeout=self.timeout) as resp:
+                resp.raise_for_status()
+                # Refuse before reading the body when the size is known.
+                if resp.content_length is not None and resp.content_length > limit:
+                    raise AttachmentTooLarge(url, resp.content_length, limit)
+
+                try:
+                    async for chunk in resp.content.iter_chunked(self.chunk_size):
+                        size += len(chunk)
+                        if size > limit:
+                            raise AttachmentTooLarge(url, size, limit)
+                        chunks.append(chunk)
+                        buffered += len(chunk)
+                        if buffered > self.spool_threshold:
+                            # Too large to keep in memory, written to disk off the event loop.
+                            if fp is None:
+                                fp = await loop.run_in_executor(None, _temporary_file)
+                            await loop.run_in_executor(None, fp.writelines, chunks)
+                            chunks, buffered = [], 0
+                    if fp is not None and chunks:
+                        await loop.run_in_executor(None, fp.writelines, chunks)
+                except BaseException:
+                    if fp is not None:
+                        fp.close()
+                    raise
+
+        if fp is None:
+            # Still in memory, keep it for the next time.
+            data = b"".join(chunks)
+            self._cache_put(url, data)
+            return BytesIO(data), size
+
+        fp.seek(0)
+        return fp, size
+
+    async def fetch(
+        self, url: str, *, filename: str = None, limit: int = DEFAULT_UPLOAD_LIMIT
+    ) -> discord.File:
+        """
+        Downloads an attachment.
+
+        Parameters
+        ----------
+        url : str
+            The URL of the attachment.
+        filename : str, optional
+            The filename to upload as, defaults to the last part of the URL.
+        limit : int
+            The maximum size in bytes, usually the upload limit of the destination.
+
+        Returns
+        -------
+        discord.File
+            The attachment, ready to be uploaded.
+
+        Raises
+        ------
+        AttachmentTooLarge
+            The attachment is larger than `limit`.
+        aiohttp.ClientError, asyncio.TimeoutError
+            The download failed.
+        """
+        fp, _ = await self._download(url, limit)
+        return discord.File(fp, filename=filename or self.filename_from_url(url))
+
+    async def fetch_many(
+        self, urls: typing.Iterable[str], *, limit: int = DEFAULT_UPLOAD_LIMIT
+    ) -> typing.Tuple[typing.List[discord.File], typing.List[str]]:
+        """
+        Downloads several attachments concurrently, to be uploaded in one message.
+
+        The upload limit applies to the whole message: the attachments
+        that would take it over `limit` are not kept.
+
+        Returns
+        -------
+        Tuple[List[discord.File], List[str]]
+            The attachments downloaded, in order, and the URLs that
+            could not be downloaded or were too large.
+        """
+        urls = list(urls)
+        results = await asyncio.gather(
+            *(self._download(url, limit) for url in urls), return_exceptions=True
+        )
+
+        files = []
+        failed = []
+        total = 0
+        for url, result in zip(urls, results):
+            if isinstance(result, tuple):
+                fp, size = result
+                if total + size <= limit:
+                    total += size
+                    files.append(discord.File(fp, filename=self.filename_from_url(url)))
+                    continue
+                fp.close()
+                logger.info(
+                    "Not re-uploading attachment %s, the message would be over the %d bytes limit.",
+                    url,
+                    limit,
+                )
+            elif isinstance(result, AttachmentTooLarge):
+                logger.info("Not re-uploading attachment: %s", result)
+            elif isinstance(result, (ClientError, asyncio.TimeoutError)):
+                logger.warning("Failed to download attachment %s: %s.", url, result)
+            else:
+                raise result
+            failed.append(url)
+        return files, failed
+
+
+def _temporary_file() -> typing.BinaryIO:
+    """A temporary file that `discord.File` accepts as a file object, an `io.IOBase`."""
+    fp = tempfile.TemporaryFile()
+    file = getattr(fp, "file", fp)
+    if file is not fp:
+        # On Windows the file is wrapped, the wrapper closes it when collected.
+        file.wrapper = fp
+    return file
@@ -0,0 +1,99 @@
+"""
+Short lived, shared cache of the modmail guild's audit logs.
+"""
+
+import asyncio
+import time
+import typing
+
+import discord
+
+from core.metrics import registry
+from core.models import getLogger
+
+logger = getLogger(__name__)
+
+CACHE_REQUESTS = registry.counter(
+    "modmail_cache_requests_total", "Lookups of the in-memory caches.", ["cache", "result"]
+)
+
+
+class AuditLogCache:
+    """
+    Caches the latest audit log entries per action for a few seconds.
+
+    Concurrent lookups of the same action share a single request, so a
+    burst of deletions (e.g. a category and its channels, or a purge)
+    only costs one audit log fetch.
+
+    Parameters
+    ----------
+    ttl : float
+        How long the fetched entries are reused, in seconds.
+    limit : int
+        The number of entries fetched per action.
+    """
+
+    def __init__(self, ttl: float = 3, limit: int = 10):
+        self.ttl = ttl
+        self.limit = limit
+        self._cache = {}
+        self._pending = {}
+
+    async def _fetch(
+        self, guild: discord.Guild, action: discord.AuditLogAction
+    ) -> typing.List[discord.AuditLogEntry]:
+        logger.debug("Fetching the %s audit logs.", action.name)
+        entries = await guild.audit_logs(limit=self.limit, action=action).flatten()
+        self._cache[guild.id, action] = (time.monotonic() + self.ttl, entries)
+        return entries
+
+    async def entries(
+        self, guild: discord.Guild, action: discord.AuditLogAction, *, fresh: bool = False
+    ) -> typing.List[discord.AuditLogEntry]:
+        """
+        Retrieves the latest audit log entries of `action`.
+
+        Parameters
+        ----------
+        guild : discord.Guild
+            The guild of the audit logs.
+        action : discord.AuditLogAction
+            The action to filter the entries by.
+        fresh : bool
+            Whether cached entries should be ignored. Requests
+            already in flight are still shared.
+        """
+        key = guild.id, action
+        if not fresh:
+            cached = self._cache.get(key)
+            if cached is not None and cached[0] > time.monotonic():
+                CACHE_REQUESTS.inc(cache="audit_logs", result="hit")
+                return cached[1]
+
+        task = self._pending.get(key)
+        CACHE_REQUESTS.inc(cache="audit_logs", result="miss" if task is None else "shared")
+        if task is None:
+            task = self._pending[key] = asyncio.ensure_future(self._fetch(guild, action))
+            task.add_done_callback(lambda _: self._pending.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def find(
+        self,
+        guild: discord.Guild,
+        action: discord.AuditLogAction,
+        predicate: typing.Callable[[discord.AuditLogEntry], bool],
+    ) -> typing.Optional[discord.AuditLogEntry]:
+        """
+        Finds the latest audit log entry of `action` matching `predicate`.
+
+        When the cached entries have no match, they are fetched again
+        once since the entry might have been created in the meantime.
+        """
+        key = guild.id, action
+        cached = key in self._cache and self._cache[key][0] > time.monotonic()
+
+        entry = discord.utils.find(predicate, await self.entries(guild, action))
+        if entry is None and cached:
+            entry = discord.utils.find(predicate, await self.entries(guild, action, fresh=True))
+        return entry
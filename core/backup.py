@@ -0,0 +1,235 @@
+"""
+Streaming export and import of the logs and notes collections.
+
+Documents are written as newline-delimited JSON (MongoDB extended JSON),
+optionally compressed with zstd (`.zst`) or gzip (`.gz`) depending on the
+file name. Both directions go through a cursor / fixed size batches, so
+collections of any size can be moved without loading them in memory.
+
+This module can also be used from the command line::
+
+    python -m core.backup export logs logs.ndjson.zst --since 2021-01-01
+    python -m core.backup import logs logs.ndjson.zst
+"""
+
+import argparse
+import asyncio
+import gzip
+import json
+import sys
+import typing
+from datetime import datetime
+from itertools import islice
+
+from bson import json_util
+from pymongo.errors import BulkWriteError
+
+from core.clients import MongoDBClient, zstandard
+from core.models import getLogger
+
+logger = getLogger(__name__)
+
+COLLECTIONS = ("logs", "notes")
+
+
+def open_ndjson(path: str, mode: str = "r") -> typing.TextIO:
+    """
+    Opens a NDJSON file for text reading or writing,
+    (de)compressing it on the fly based on the file extension.
+    """
+    mode = mode.rstrip("t") + "t"
+    if path.endswith(".zst"):
+        if zstandard is None:
+            raise RuntimeError("The zstandard package is needed for .zst files.")
+        return zstandard.open(path, mode, encoding="utf-8")
+    if path.endswith(".gz"):
+        return gzip.open(path, mode, encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def build_log_query(
+    *,
+    since: datetime = None,
+    until: datetime = None,
+    recipient: typing.Union[int, str] = None,
+    closer: typing.Union[int, str] = None,
+    guild: typing.Union[int, str] = None,
+) -> dict:
+    """
+    Builds the query to filter logs.
+
+    Parameters
+    ----------
+    since : datetime, optional
+        Only logs created at or after this time.
+    until : datetime, optional
+        Only logs created before this time.
+    recipient : Union[int, str], optional
+        Only logs of this recipient ID.
+    closer : Union[int, str], optional
+        Only logs closed by this user ID.
+    guild : Union[int, str], optional
+        Only logs of this guild ID.
+
+    Returns
+    -------
+    dict
+        The query.
+    """
+    query = {}
+    created_at = {}
+    if since is not None:
+        created_at["$gte"] = str(since)
+    if until is not None:
+        created_at["$lt"] = str(until)
+    if created_at:
+        query["created_at"] = created_at
+    if recipient is not None:
+        query["recipient.id"] = str(recipient)
+    if closer is not None:
+        query["closer.id"] = str(closer)
+    if guild is not None:
+        query["guild_id"] = str(guild)
+    return query
+
+
+async def export_collection(
+    db, collection: str, fp: typing.TextIO, query: dict = None, *, batch_size: int = 500
+) -> int:
+    """
+    Streams the documents of `collection` matching `query` into `fp`.
+
+    Archived logs are exported with their full messages.
+    The file writes and decompression run in the default executor.
+
+    Returns
+    -------
+    int
+        The number of documents exported.
+    """
+    loop = asyncio.get_event_loop()
+    count = 0
+    lines = []
+
+    async for doc in db[collection].find(query or {}, batch_size=batch_size):
+        if collection == "logs" and doc.get("archived"):
+            archived = await db.logs_archive.find_one({"_id": doc["_id"]})
+            if archived is not None:
+                raw = await loop.run_in_executor(
+                    None, MongoDBClient._decompress, archived["codec"], archived["messages"]
+                )
+                doc["messages"] = json.loads(raw)
+                del doc["archived"]
+                for field in ("responders", "first_reply", "reply_counts"):
+                    doc.pop(field, None)
+
+        lines.append(json_util.dumps(doc) + "\n")
+        count += 1
+        if len(lines) >= batch_size:
+            await loop.run_in_executor(None, fp.writelines, lines)
+            lines = []
+
+    if lines:
+        await loop.run_in_executor(None, fp.writelines, lines)
+    return count
+
+
+async def import_collection(
+    db, collection: str, fp: typing.TextIO, *, batch_size: int = 500
+) -> typing.Tuple[int, int]:
+    """
+    Streams the documents in `fp` into `collection` with batched inserts.
+
+    Documents that already exist (same `_id`) are skipped.
+
+    Returns
+    -------
+    Tuple[int, int]
+        The number of documents inserted and skipped.
+    """
+    loop = asyncio.get_event_loop()
+    inserted = skipped = 0
+
+    def read_batch():
+        return [json_util.loads(line) for line in islice(fp, batch_size) if line.strip()]
+
+    while True:
+        batch = await loop.run_in_executor(None, read_batch)
+        if not batch:
+            break
+        try:
+            result = await db[collection].insert_many(batch, ordered=False)
+            inserted += len(result.inserted_ids)
+        except BulkWriteError as e:
+            duplicates = sum(1 for err in e.details["writeErrors"] if err["code"] == 11000)
+            if duplicates != len(e.details["writeErrors"]):
+                raise
+            inserted += e.details["nInserted"]
+            skipped += duplicates
+    return inserted, skipped
+
+
+def _parse_date(value: str) -> datetime:
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid date: {value}.")
+
+
+async def _main(args) -> None:
+    from motor.motor_asyncio import AsyncIOMotorClient
+
+    from core.config import ConfigManager
+
+    config = ConfigManager(None)
+    config.populate_cache()
+    mongo_uri = config["connection_uri"] or config["mongo_uri"]
+    if mongo_uri is None:
+        logger.critical("A Mongo URI is necessary, set CONNECTION_URI.")
+        sys.exit(1)
+    db = AsyncIOMotorClient(mongo_uri).modmail_bot
+
+    if args.action == "export":
+        query = {}
+        if args.collection == "logs":
+            query = build_log_query(
+                since=args.since,
+                until=args.until,
+                recipient=args.recipient,
+                closer=args.closer,
+                guild=args.guild,
+            )
+        with open_ndjson(args.path, "w") as fp:
+            count = await export_collection(db, args.collection, fp, query)
+        logger.info("Exported %d document(s) from %s to %s.", count, args.collection, args.path)
+    else:
+        with open_ndjson(args.path, "r") as fp:
+            inserted, skipped = await import_collection(db, args.collection, fp)
+        logger.info(
+            "Imported %d document(s) into %s, %d already existed.",
+            inserted,
+            args.collection,
+            skipped,
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m core.backup", description="Export or import Modmail logs and notes."
+    )
+    parser.add_argument("action", choices=("export", "import"))
+    parser.add_argument("collection", choices=COLLECTIONS)
+    parser.add_argument("path", help="NDJSON file, compressed when ending with .zst or .gz.")
+    filters = parser.add_argument_group("log export filters")
+    filters.add_argument("--since", type=_parse_date, help="Created at or after (ISO date).")
+    filters.add_argument("--until", type=_parse_date, help="Created before (ISO date).")
+    filters.add_argument("--recipient", type=int, help="Recipient user ID.")
+    filters.add_argument("--closer", type=int, help="Closer user ID.")
+    filters.add_argument("--guild", type=int, help="Guild ID.")
+    args = parser.parse_args(argv)
+
+    asyncio.get_event_loop().run_until_complete(_main(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,41 @@
+import asyncio
+import json
 import secrets
+import statistics
 import sys
-from datetime import datetime
+import time
+import zlib
+from datetime import date, datetime, timedelta
 from json import JSONDecodeError
-from typing import Union, Optional
+from typing import Dict, Union, Optional, Tuple
 
 from discord import Member, DMChannel, TextChannel, Message
 from discord.ext import commands
 
 from aiohttp import ClientResponseError, ClientResponse
+from bson import Binary
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import monitoring
 from pymongo.errors import ConfigurationError
+from pymongo.read_preferences import ReadPreference, make_read_preference, read_pref_mode_from_name
 
+from core.metrics import registry
 from core.models import InvalidConfigError, getLogger
 
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
 logger = getLogger(__name__)
 
+DB_LATENCY = registry.histogram(
+    "modmail_db_operation_seconds", "Latency of the commands sent to the database.", ["command"]
+)
+DB_FAILURES = registry.counter(
+    "modmail_db_operation_failures_total", "Database commands that failed.", ["command"]
+)
+
 
 class GitHub:
     """
@@ -313,6 +334,15 @@ class ApiClient:
     async def delete_log_entry(self, key: str) -> bool:
         return NotImplemented
 
+    async def archive_closed_logs(self, before: datetime, limit: int = 100) -> int:
+        return NotImplemented
+
+    async def get_archived_messages(self, key: str) -> Optional[list]:
+        return NotImplemented
+
+    async def get_stats(self, days: int) -> dict:
+        return NotImplemented
+
     async def get_config(self) -> dict:
         return NotImplemented
 
@@ -360,7 +390,42 @@ class ApiClient:
         return NotImplemented
 
 
+class CommandLatencyListener(monitoring.CommandListener):
+    """Records the latency of every command sent through the Mongo driver."""
+
+    def started(self, event):
+        pass
+
+    def succeeded(self, event):
+        DB_LATENCY.observe(event.duration_micros / 1e6, command=event.command_name)
+
+    def failed(self, event):
+        DB_LATENCY.observe(event.duration_micros / 1e6, command=event.command_name)
+        DB_FAILURES.inc(command=event.command_name)
+
+
 class MongoDBClient(ApiClient):
+    # seconds ?stats results are kept in memory
+    STATS_CACHE_TTL = 300
+    # days after which the stats of a day are stored even with unanswered tickets
+    STATS_SETTLE_DAYS = 7
+
+    # config key -> pymongo client option
+    client_options = {
+        "mongo_max_pool_size": "maxPoolSize",
+        "mongo_min_pool_size": "minPoolSize",
+        "mongo_max_idle_time": "maxIdleTimeMS",
+        "mongo_server_selection_timeout": "serverSelectionTimeoutMS",
+        "mongo_compressors": "compressors",
+    }
+    # numeric client option -> smallest value pymongo accepts
+    client_option_minimums = {
+        "maxPoolSize": 1,
+        "minPoolSize": 0,
+        "maxIdleTimeMS": 1,
+        "serverSelectionTimeoutMS": 0,
+    }
+
     def __init__(self, bot):
         mongo_uri = bot.config["connection_uri"]
         if mongo_uri is None:
@@ -374,8 +439,16 @@ class MongoDBClient(ApiClient):
                 logger.critical("A Mongo URI is necessary for the bot to function.")
                 raise RuntimeError
 
+        self.options = self._make_client_options(bot.config)
+
+        self.read_preference = self._make_read_preference(
+            bot.config["mongo_read_preference"], bot.config["mongo_max_staleness"]
+        )
+
         try:
-            db = AsyncIOMotorClient(mongo_uri).modmail_bot
+            db = AsyncIOMotorClient(
+                mongo_uri, event_listeners=[CommandLatencyListener()], **self.options
+            ).modmail_bot
         except ConfigurationError as e:
             logger.critical(
                 "Your MongoDB CONNECTION_URI might be copied wrong, try re-copying from the source again. "
@@ -385,6 +458,76 @@ class MongoDBClient(ApiClient):
             sys.exit(0)
 
         super().__init__(bot, db)
+        self._log_reader = None
+        self._stats_cache = {}
+
+    @classmethod
+    def _make_client_options(cls, config):
+        options = {}
+        for key, option in cls.client_options.items():
+            value = config[key]
+            if value is None:
+                continue
+            minimum = cls.client_option_minimums.get(option)
+            if minimum is not None:
+                try:
+                    value = int(value)
+                except (TypeError, ValueError):
+                    value = None
+                # pymongo raises on invalid values, the bot would not start.
+                if value is None or value < minimum:
+                    logger.warning(
+                        "Invalid %s %s, it must be a number of at least %d, using the default.",
+                        key.upper(),
+                        config[key],
+                        minimum,
+                    )
+                    continue
+            options[option] = value
+
+        if options.get("minPoolSize", 0) > options.get("maxPoolSize", float("inf")):
+            logger.warning(
+                "MONGO_MIN_POOL_SIZE is larger than MONGO_MAX_POOL_SIZE, using the default."
+            )
+            del options["minPoolSize"]
+        return options
+
+    @staticmethod
+    def _make_read_preference(name, max_staleness):
+        try:
+            mode = read_pref_mode_from_name(name)
+        except ValueError:
+            logger.warning("Invalid MONGO_READ_PREFERENCE %s, using primary for logs.", name)
+            mode = read_pref_mode_from_name("primary")
+
+        # primary takes no max staleness, the configured one would fail at startup
+        if max_staleness is None or mode == ReadPreference.PRIMARY.mode:
+            return make_read_preference(mode, None)
+        try:
+            seconds = int(max_staleness)
+        except (TypeError, ValueError):
+            seconds = 0
+        # MongoDB refuses less than 90 seconds when selecting a server, every query would fail.
+        if seconds != -1 and seconds < 90:
+            logger.warning(
+                "Invalid MONGO_MAX_STALENESS %s, it must be at least 90 seconds, ignoring.",
+                max_staleness,
+            )
+            seconds = -1
+        return make_read_preference(mode, None, seconds)
+
+    @property
+    def log_reader(self):
+        """
+        The logs collection used for read-only log browsing and searches.
+
+        Uses the `mongo_read_preference` configured (secondary preferred
+        by default), so heavy staff searches are served by the replica set
+        secondaries and leave the primary to the message relaying writes.
+        """
+        if self._log_reader is None:
+            self._log_reader = self.db.get_collection("logs", read_preference=self.read_preference)
+        return self._log_reader
 
     async def setup_indexes(self):
         """Setup text indexes so we can use the $search operator"""
@@ -405,6 +548,13 @@ class MongoDBClient(ApiClient):
             await coll.create_index(
                 [("messages.content", "text"), ("messages.author.name", "text"), ("key", "text")]
             )
+
+        # Used by the log archiver to find closed logs by age
+        await coll.create_index([("open", 1), ("closed_at", 1)])
+        await self.db.logs_archive.create_index([("guild_id", 1), ("text", "text")])
+        # Used by the ticket stats aggregations
+        await coll.create_index([("guild_id", 1), ("created_at", 1)])
+        await self.db.stats.create_index([("guild_id", 1), ("day", 1)])
         logger.debug("Successfully configured and verified database indexes.")
 
     async def validate_database_connection(self):
@@ -443,7 +593,7 @@ class MongoDBClient(ApiClient):
         projection = {"messages": {"$slice": 5}}
         logger.debug("Retrieving user %s logs.", user_id)
 
-        return await self.logs.find(query, projection).to_list(None)
+        return await self.log_reader.find(query, projection).to_list(None)
 
     async def get_latest_user_logs(self, user_id: Union[str, int]):
         query = {"recipient.id": str(user_id), "guild_id": str(self.bot.guild_id), "open": False}
@@ -455,15 +605,21 @@ class MongoDBClient(ApiClient):
     async def get_responded_logs(self, user_id: Union[str, int]) -> list:
         query = {
             "open": False,
-            "messages": {
-                "$elemMatch": {
-                    "author.id": str(user_id),
-                    "author.mod": True,
-                    "type": {"$in": ["anonymous", "thread_message"]},
-                }
-            },
+            "$or": [
+                {
+                    "messages": {
+                        "$elemMatch": {
+                            "author.id": str(user_id),
+                            "author.mod": True,
+                            "type": {"$in": list(self.REPLY_TYPES)},
+                        }
+                    }
+                },
+                # archived logs only keep a preview of their messages
+                {"responders": str(user_id)},
+            ],
         }
-        return await self.logs.find(query).to_list(None)
+        return await self.log_reader.find(query).to_list(None)
 
     async def get_open_logs(self) -> list:
         query = {"open": True}
@@ -471,10 +627,15 @@ class MongoDBClient(ApiClient):
 
     async def get_log(self, channel_id: Union[str, int]) -> dict:
         logger.debug("Retrieving channel %s logs.", channel_id)
-        return await self.logs.find_one({"channel_id": str(channel_id)})
+        doc = await self.logs.find_one({"channel_id": str(channel_id)})
+        if doc is not None and doc.get("archived"):
+            messages = await self.get_archived_messages(doc["key"])
+            if messages is not None:
+                doc["messages"] = messages
+        return doc
 
     async def get_log_link(self, channel_id: Union[str, int]) -> str:
-        doc = await self.get_log(channel_id)
+        doc = await self.logs.find_one({"channel_id": str(channel_id)}, {"key": 1})
         logger.debug("Retrieving log link for channel %s.", channel_id)
         prefix = self.bot.config["log_url_prefix"].strip("/")
         if prefix == "NONE":
@@ -524,8 +685,442 @@ class MongoDBClient(ApiClient):
 
     async def delete_log_entry(self, key: str) -> bool:
         result = await self.logs.delete_one({"key": key})
+        await self.db.logs_archive.delete_one({"_id": key})
         return result.deleted_count == 1
 
+    @staticmethod
+    def _compress(data: bytes) -> Tuple[str, bytes]:
+        if zstandard is not None:
+            return "zstd", zstandard.ZstdCompressor(level=10).compress(data)
+        return "zlib", zlib.compress(data, 9)
+
+    @staticmethod
+    def _decompress(codec: str, data: bytes) -> bytes:
+        if codec == "zstd":
+            if zstandard is None:
+                raise RuntimeError("The zstandard package is needed to read this archived log.")
+            return zstandard.ZstdDecompressor().decompress(data)
+        return zlib.decompress(data)
+
+    # messages of an archived log kept in the hot stub, for the previews
+    ARCHIVE_PREVIEW_MESSAGES = 5
+    ARCHIVE_PREVIEW_LENGTH = 200
+    REPLY_TYPES = ("anonymous", "thread_message")
+
+    @classmethod
+    def _strip_message(cls, message: dict) -> dict:
+        """A preview of an archived message, kept in the hot logs collection."""
+        author = message.get("author") or {}
+        return {
+            "timestamp": message.get("timestamp"),
+            "content": str(message.get("content") or "")[: cls.ARCHIVE_PREVIEW_LENGTH],
+            "type": message.get("type"),
+            "author": {
+                "id": author.get("id"),
+                "name": author.get("name"),
+                "discriminator": author.get("discriminator"),
+                "mod": author.get("mod"),
+            },
+        }
+
+    @staticmethod
+    def _search_text(messages: list) -> str:
+        """The text of the messages searched by `search_by_text`, with their authors' names."""
+        names = {(m.get("author") or {}).get("name") for m in messages}
+        contents = [str(m.get("content") or "") for m in messages]
+        return "\n".join(contents + sorted(filter(None, names)))
+
+    async def archive_closed_logs(self, before: datetime, limit: int = 100) -> int:
+        """
+        Moves the messages of logs closed before `before` to cold storage.
+
+        The full messages are compressed into the `logs_archive` collection,
+        next to their text indexed for `search_by_text`. The log itself stays
+        in place as a stub with the log's header, a preview of its first
+        messages and the ids of the moderators who replied, so previews,
+        searches and `get_responded_logs` keep working without decompressing
+        the archive. The stub also keeps the first moderator reply and the
+        daily reply counts of each moderator, for the ticket statistics.
+
+        The logviewer reads the logs collection, archived logs only show
+        their preview there. The compression runs in the default executor.
+
+        Returns
+        -------
+        int
+            The number of logs archived.
+        """
+        query = {
+            "open": False,
+            "closed_at": {"$lt": str(before)},
+            "archived": {"$ne": True},
+        }
+        count = 0
+        async for log in self.logs.find(query, limit=limit):
+            messages = log.get("messages") or []
+            raw = json.dumps(messages, separators=(",", ":")).encode("utf-8")
+            codec, data = await self.bot.loop.run_in_executor(None, self._compress, raw)
+
+            await self.db.logs_archive.replace_one(
+                {"_id": log["_id"]},
+                {
+                    "_id": log["_id"],
+                    "key": log["key"],
+                    "guild_id": log.get("guild_id"),
+                    "codec": codec,
+                    "size": len(raw),
+                    "messages": Binary(data),
+                    "text": self._search_text(messages),
+                    "archived_at": str(datetime.utcnow()),
+                },
+                upsert=True,
+            )
+            replies = [
+                m
+                for m in messages
+                if m.get("type") in self.REPLY_TYPES and (m.get("author") or {}).get("mod")
+            ]
+            reply_counts = {}
+            for m in replies:
+                day = str(m.get("timestamp"))[:10]
+                entry = reply_counts.setdefault(
+                    (day, m["author"]["id"]),
+                    {"day": day, "author": {"id": m["author"]["id"]}, "count": 0},
+                )
+                entry["author"]["name"] = m["author"].get("name")
+                entry["count"] += 1
+            preview = messages[: self.ARCHIVE_PREVIEW_MESSAGES]
+            await self.logs.update_one(
+                {"_id": log["_id"]},
+                {
+                    "$set": {
+                        "archived": True,
+                        "messages": [self._strip_message(m) for m in preview],
+                        "responders": sorted({m["author"]["id"] for m in replies}),
+                        "first_reply": self._strip_message(replies[0]) if replies else None,
+                        "reply_counts": list(reply_counts.values()),
+                    }
+                },
+            )
+            count += 1
+            logger.debug(
+                "Archived log %s (%d bytes -> %d bytes).", log["key"], len(raw), len(data)
+            )
+        return count
+
+    async def get_archived_messages(self, key: str) -> Optional[list]:
+        doc = await self.db.logs_archive.find_one({"_id": key})
+        if doc is None:
+            logger.warning("Archived messages for log %s not found.", key)
+            return None
+        raw = await self.bot.loop.run_in_executor(
+            None, self._decompress, doc["codec"], doc["messages"]
+        )
+        return json.loads(raw)
+
+    @staticmethod
+    def _parse_time(field: str) -> dict:
+        """Aggregation expression parsing a stored `str(datetime)` field, to the second."""
+
+        def part(start, length):
+            return {"$toInt": {"$substr": [field, start, length]}}
+
+        return {
+            "$dateFromParts": {
+                "year": part(0, 4),
+                "month": part(5, 2),
+                "day": part(8, 2),
+                "hour": part(11, 2),
+                "minute": part(14, 2),
+                "second": part(17, 2),
+            }
+        }
+
+    async def _aggregate_daily_stats(self, start: date, end: date) -> Dict[str, dict]:
+        """
+        Computes the ticket statistics of every day in [`start`, `end`).
+
+        Archived logs only keep a preview of their messages, their first
+        reply and reply counts are read from the stub instead.
+
+        Returns
+        -------
+        Dict[str, dict]
+            The stats of each day with activity, keyed by ISO date.
+        """
+        guild_id = str(self.bot.guild_id)
+        start, end = str(start), str(end)
+        reply_types = ["thread_message", "anonymous"]
+
+        opened = [
+            {"$match": {"guild_id": guild_id, "created_at": {"$gte": start, "$lt": end}}},
+            {
+                "$project": {
+                    "day": {"$substr": ["$created_at", 0, 10]},
+                    "hour": {"$substr": ["$created_at", 11, 2]},
+                    "created": self._parse_time("$created_at"),
+                    "open": 1,
+                    "reply": {
+                        "$ifNull": [
+                            "$first_reply",
+                            {
+                                "$arrayElemAt": [
+                                    {
+                                        "$filter": {
+                                            "input": "$messages",
+                                            "as": "m",
+                                            "cond": {
+                                                "$and": [
+                                                    {"$eq": ["$$m.author.mod", True]},
+                                                    {"$in": ["$$m.type", reply_types]},
+                                                ]
+                                            },
+                                        }
+                                    },
+                                    0,
+                                ]
+                            },
+                        ]
+                    },
+                }
+            },
+            {
+                "$project": {
+                    "day": 1,
+                    "hour": 1,
+                    "open": 1,
+                    "response": {
+                        "$cond": [
+                            {"$ifNull": ["$reply", False]},
+                            {"$subtract": [self._parse_time("$reply.timestamp"), "$created"]},
+                            None,
+                        ]
+                    },
+                }
+            },
+            {
+                "$group": {
+                    "_id": {"day": "$day", "hour": "$hour"},
+                    "count": {"$sum": 1},
+                    "responses": {"$push": "$response"},
+                    # open tickets still waiting for their first reply
+                    "pending": {
+                        "$sum": {
+                            "$cond": [{"$and": ["$open", {"$eq": ["$response", None]}]}, 1, 0]
+                        }
+                    },
+                }
+            },
+        ]
+        closed = [
+            {
+                "$match": {
+                    "guild_id": guild_id,
+                    "open": False,
+                    "closed_at": {"$gte": start, "$lt": end},
+                }
+            },
+            {"$group": {"_id": {"$substr": ["$closed_at", 0, 10]}, "count": {"$sum": 1}}},
+        ]
+        replies = [
+            {
+                "$match": {
+                    "guild_id": guild_id,
+                    "created_at": {"$lt": end},
+                    "$or": [{"closed_at": None}, {"closed_at": {"$gte": start}}],
+                    "archived": {"$ne": True},
+                }
+            },
+            {
+                "$project": {
+                    "messages.timestamp": 1,
+                    "messages.type": 1,
+                    "messages.author.id": 1,
+                    "messages.author.name": 1,
+                    "messages.author.mod": 1,
+                }
+            },
+            {"$unwind": "$messages"},
+            {
+                "$match": {
+                    "messages.author.mod": True,
+                    "messages.type": {"$in": reply_types},
+                    "messages.timestamp": {"$gte": start, "$lt": end},
+                }
+            },
+            {
+                "$group": {
+                    "_id": {
+                        "day": {"$substr": ["$messages.timestamp", 0, 10]},
+                        "author": "$messages.author.id",
+                    },
+                    "name": {"$last": "$messages.author.name"},
+                    "count": {"$sum": 1},
+                }
+            },
+        ]
+        archived_replies = [
+            {
+                "$match": {
+                    "guild_id": guild_id,
+                    "archived": True,
+                    "created_at": {"$lt": end},
+                    "closed_at": {"$gte": start},
+                }
+            },
+            {"$project": {"reply_counts": 1}},
+            {"$unwind": "$reply_counts"},
+            {"$match": {"reply_counts.day": {"$gte": start, "$lt": end}}},
+            {
+                "$group": {
+                    "_id": {"day": "$reply_counts.day", "author": "$reply_counts.author.id"},
+                    "name": {"$last": "$reply_counts.author.name"},
+                    "count": {"$sum": "$reply_counts.count"},
+                }
+            },
+        ]
+
+        opened, closed, replies, archived_replies = await asyncio.gather(
+            self.log_reader.aggregate(opened, allowDiskUse=True).to_list(None),
+            self.log_reader.aggregate(closed, allowDiskUse=True).to_list(None),
+            self.log_reader.aggregate(replies, allowDiskUse=True).to_list(None),
+            self.log_reader.aggregate(archived_replies, allowDiskUse=True).to_list(None),
+        )
+
+        days = {}
+
+        def get_day(day):
+            if day not in days:
+                days[day] = {
+                    "opened": 0,
+                    "closed": 0,
+                    "hours": [0] * 24,
+                    "response_times": [],
+                    "replies": {},
+                    "pending": 0,
+                }
+            return days[day]
+
+        for doc in opened:
+            stats = get_day(doc["_id"]["day"])
+            stats["opened"] += doc["count"]
+            stats["pending"] += doc["pending"]
+            stats["hours"][int(doc["_id"]["hour"])] += doc["count"]
+            stats["response_times"].extend(
+                ms / 1000 for ms in doc["responses"] if ms is not None and ms >= 0
+            )
+        for doc in closed:
+            get_day(doc["_id"])["closed"] += doc["count"]
+        for doc in replies + archived_replies:
+            entry = get_day(doc["_id"]["day"])["replies"].setdefault(
+                doc["_id"]["author"], {"name": doc["name"], "count": 0}
+            )
+            entry["count"] += doc["count"]
+        return days
+
+    async def get_daily_stats(self, start: date, end: date) -> Dict[str, dict]:
+        """
+        Retrieves the ticket statistics of every day in [`start`, `end`).
+
+        Completed days are computed once and materialized into the `stats`
+        collection, so only the days missing from it (usually just today)
+        go through the aggregation pipelines. The response times are those
+        of the tickets opened that day: a day is only materialized once none
+        of its tickets is waiting for a first reply, or after
+        `STATS_SETTLE_DAYS` days.
+
+        Returns
+        -------
+        Dict[str, dict]
+            The stats of each day, keyed by ISO date.
+        """
+        guild_id = str(self.bot.guild_id)
+        today = datetime.utcnow().date()
+        wanted = [str(start + timedelta(days=i)) for i in range((end - start).days)]
+
+        days = {}
+        async for doc in self.db.stats.find(
+            {"guild_id": guild_id, "day": {"$gte": str(start), "$lt": str(end)}}
+        ):
+            days[doc["day"]] = doc["stats"]
+
+        missing = [day for day in wanted if day not in days]
+        if not missing:
+            return days
+
+        first = date.fromisoformat(missing[0])
+        last = date.fromisoformat(missing[-1]) + timedelta(days=1)
+        computed = await self._aggregate_daily_stats(first, last)
+
+        for day in missing:
+            stats = computed.get(day)
+            if stats is None:
+                stats = {
+                    "opened": 0,
+                    "closed": 0,
+                    "hours": [0] * 24,
+                    "response_times": [],
+                    "replies": {},
+                }
+            pending = stats.pop("pending", 0)
+            days[day] = stats
+            age = (today - date.fromisoformat(day)).days
+            if age > 0 and (not pending or age >= self.STATS_SETTLE_DAYS):
+                await self.db.stats.replace_one(
+                    {"_id": f"{guild_id}:{day}"},
+                    {"_id": f"{guild_id}:{day}", "guild_id": guild_id, "day": day, "stats": stats},
+                    upsert=True,
+                )
+        logger.debug("Computed ticket stats for %d day(s).", len(missing))
+        return days
+
+    async def get_stats(self, days: int) -> dict:
+        """
+        Summarizes the ticket statistics of the last `days` days (today included).
+
+        Results are cached for `STATS_CACHE_TTL` seconds.
+
+        Returns
+        -------
+        dict
+            The number of tickets opened and closed, the median first
+            response time (in seconds, `None` if there were no replies),
+            the replies sent by each moderator and the tickets opened
+            by hour of the day (UTC).
+        """
+        cached = self._stats_cache.get(days)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
+        end = datetime.utcnow().date() + timedelta(days=1)
+        daily = await self.get_daily_stats(end - timedelta(days=days), end)
+
+        result = {
+            "opened": 0,
+            "closed": 0,
+            "median_response": None,
+            "responses": 0,
+            "replies": {},
+            "hours": [0] * 24,
+        }
+        response_times = []
+        for stats in daily.values():
+            result["opened"] += stats["opened"]
+            result["closed"] += stats["closed"]
+            response_times += stats["response_times"]
+            for i, count in enumerate(stats["hours"]):
+                result["hours"][i] += count
+            for mod_id, reply in stats["replies"].items():
+                entry = result["replies"].setdefault(mod_id, {"name": reply["name"], "count": 0})
+                entry["count"] += reply["count"]
+
+        if response_times:
+            result["median_response"] = statistics.median(response_times)
+            result["responses"] = len(response_times)
+
+        self._stats_cache[days] = (time.monotonic() + self.STATS_CACHE_TTL, result)
+        return result
+
     async def get_config(self) -> dict:
         conf = await self.db.config.find_one({"bot_id": self.bot.user.id})
         if conf is None:
@@ -600,20 +1195,31 @@ class MongoDBClient(ApiClient):
         )
 
     async def search_closed_by(self, user_id: Union[int, str]):
-        return await self.logs.find(
+        return await self.log_reader.find(
             {"guild_id": str(self.bot.guild_id), "open": False, "closer.id": str(user_id)},
             {"messages": {"$slice": 5}},
         ).to_list(None)
 
     async def search_by_text(self, text: str, limit: Optional[int]):
-        return await self.bot.db.logs.find(
-            {
-                "guild_id": str(self.bot.guild_id),
-                "open": False,
-                "$text": {"$search": f'"{text}"'},
-            },
-            {"messages": {"$slice": 5}},
+        guild_id = str(self.bot.guild_id)
+        search = {"$search": f'"{text}"'}
+        entries = await self.log_reader.find(
+            {"guild_id": guild_id, "open": False, "$text": search}, {"messages": {"$slice": 5}}
+        ).to_list(limit)
+        if limit is not None and len(entries) >= limit:
+            return entries
+
+        # The text of the archived logs is only indexed in the archive.
+        found = {entry["key"] for entry in entries}
+        archived = await self.db.logs_archive.find(
+            {"guild_id": guild_id, "$text": search}, {"key": 1}
         ).to_list(limit)
+        keys = [doc["key"] for doc in archived if doc["key"] not in found]
+        if keys:
+            entries += await self.log_reader.find(
+                {"key": {"$in": keys}}, {"messages": {"$slice": 5}}
+            ).to_list(None)
+        return entries[:limit] if limit is not None else entries
 
     async def create_note(self, recipient: Member, message: Message, message_id: Union[int, str]):
         await self.db.notes.insert_one(
@@ -0,0 +1,56 @@
+"""
+Lookup of the colour names accepted by the colour config variables.
+
+The names are kept sorted in `core._color_table`, generated from
+`core._color_data`, and found by bisection. The table is only imported
+the first time a colour is looked up.
+"""
+
+import bisect
+import re
+import typing
+from difflib import get_close_matches
+
+SEPARATORS = re.compile(r"[\-+|. ]+")
+
+
+def _find(name: str) -> typing.Optional[str]:
+    from core._color_table import NAMES, VALUES
+
+    i = bisect.bisect_left(NAMES, name)
+    if i == len(NAMES) or NAMES[i] != name:
+        return None
+    return VALUES[6 * i : 6 * i + 6]
+
+
+def lookup_color(name: str) -> typing.Optional[str]:
+    """
+    Finds the hex RGB value of a colour name, e.g. "dark blue" or "xkcd:dark blue".
+
+    Separators (``-+|.`` and spaces) are read as spaces, then ignored if
+    no colour has that name.
+
+    Returns
+    -------
+    Optional[str]
+        The six hex digits of the colour, `None` if there is no colour with that name.
+    """
+    name = SEPARATORS.sub(" ", str(name).lower())
+    hex_ = _find(name)
+    if hex_ is None:
+        hex_ = _find(name.replace(" ", ""))
+    return hex_
+
+
+def suggest_colors(name: str, n: int = 3) -> typing.List[str]:
+    """
+    The `n` colour names closest to a mistyped `name`.
+
+    Prefixed names (e.g. "xkcd:dark blue") are only suggested for prefixed names.
+    """
+    from core._color_table import NAMES
+
+    name = SEPARATORS.sub(" ", str(name).lower()).strip()
+    prefixed = ":" in name
+    candidates = [c for c in NAMES if (":" in c) == prefixed]
+    return get_close_matches(name, candidates, n=n, cutoff=0.6)
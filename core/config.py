@@ -1,7 +1,6 @@
 import asyncio
 import json
 import os
-import re
 import typing
 from copy import deepcopy
 
@@ -11,10 +10,10 @@ import isodate
 import discord
 from discord.ext.commands import BadArgument
 
-from core._color_data import ALL_COLORS
+from core.colors import lookup_color, suggest_colors
 from core.models import DMDisabled, InvalidConfigError, Default, getLogger
 from core.time import UserFriendlyTimeSync
-from core.utils import strtobool, tryint
+from core.utils import human_join, strtobool, tryint
 
 logger = getLogger(__name__)
 load_dotenv()
@@ -34,12 +33,14 @@ class ConfigManager:
         "error_color": str(discord.Color.red()),
         "user_typing": False,
         "mod_typing": False,
+        "thread_channel_typing": True,
         "account_age": isodate.Duration(),
         "guild_age": isodate.Duration(),
         "thread_cooldown": isodate.Duration(),
         "reply_without_command": False,
         "anon_reply_without_command": False,
         "plain_reply_without_command": False,
+        "concurrent_reply_delivery": False,
         # logging
         "log_channel_id": None,
         "mention_channel_id": None,
@@ -122,6 +123,8 @@ class ConfigManager:
         "notification_squad": {},
         "subscriptions": {},
         "closures": {},
+        # internal, the overflow categories created by the category pool
+        "overflow_category_ids": [],
         # misc
         "plugins": [],
         "aliases": {},
@@ -137,6 +140,14 @@ class ConfigManager:
         "mongo_uri": None,
         "database_type": "mongodb",
         "connection_uri": None,  # replace mongo uri in the future
+        # database connection pool
+        "mongo_max_pool_size": None,
+        "mongo_min_pool_size": None,
+        "mongo_max_idle_time": None,
+        "mongo_server_selection_timeout": None,
+        "mongo_compressors": None,
+        "mongo_read_preference": "secondaryPreferred",
+        "mongo_max_staleness": None,
         "owners": None,
         # bot
         "token": None,
@@ -148,20 +159,42 @@ class ConfigManager:
         "disable_updates": False,
         # Logging
         "log_level": "INFO",
+        # size in bytes the log file is rotated at, and the number of old files kept
+        "log_max_bytes": 48000,
+        "log_backup_count": 1,
+        # "text" or "json", the format of the console logs
+        "log_format": "text",
+        # file or OpenTelemetry collector URL the relay traces are exported to
+        "trace_export": None,
+        # serves the Prometheus metrics at /metrics when the port is set
+        "metrics_host": "127.0.0.1",
+        "metrics_port": None,
+        # seconds a callback may block the event loop before its stack is logged, 0 to disable
+        "slow_callback_threshold": 0.25,
+        # move closed logs to the compressed archive after this duration
+        "log_archive_after": isodate.Duration(),
         # data collection
         "data_collection": True,
     }
 
     colors = {"mod_color", "recipient_color", "main_color", "error_color"}
 
-    time_deltas = {"account_age", "guild_age", "thread_auto_close", "thread_cooldown"}
+    time_deltas = {
+        "account_age",
+        "guild_age",
+        "thread_auto_close",
+        "thread_cooldown",
+        "log_archive_after",
+    }
 
     booleans = {
         "user_typing",
         "mod_typing",
+        "thread_channel_typing",
         "reply_without_command",
         "anon_reply_without_command",
         "plain_reply_without_command",
+        "concurrent_reply_delivery",
         "recipient_thread_close",
         "thread_auto_close_silently",
         "thread_move_notify",
@@ -355,14 +388,16 @@ class ConfigManager:
                     raise InvalidConfigError("Invalid color name or hex.")
 
             except InvalidConfigError:
-                name = str(item).lower()
-                name = re.sub(r"[\-+|. ]+", " ", name)
-                hex_ = ALL_COLORS.get(name)
+                hex_ = lookup_color(item)
                 if hex_ is None:
-                    name = re.sub(r"[\-+|. ]+", "", name)
-                    hex_ = ALL_COLORS.get(name)
-                    if hex_ is None:
-                        raise
+                    suggestions = suggest_colors(item)
+                    if suggestions:
+                        raise InvalidConfigError(
+                            "Invalid color name or hex. Did you mean "
+                            + human_join([f"`{name}`" for name in suggestions])
+                            + "?"
+                        )
+                    raise
             return self.__setitem__(key, "#" + hex_)
 
         if key in self.time_deltas:
@@ -0,0 +1,307 @@
+"""
+Lightweight in-process metrics.
+
+Counters, gauges and histograms are kept in a process-wide `registry`
+so that any module can record measurements without holding a reference
+to the bot. All metric types are thread-safe, some of them (e.g. the
+database latency histogram) are updated from driver worker threads.
+"""
+
+import threading
+import time
+import typing
+from contextlib import contextmanager
+
+from core.models import getLogger
+
+__all__ = [
+    "DEFAULT_BUCKETS",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricsRegistry",
+    "registry",
+]
+
+logger = getLogger(__name__)
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class _Metric:
+    type_ = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: typing.Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values = {}
+
+    def __repr__(self):
+        return f"<{type(self).__name__} name={self.name!r}>"
+
+    def _key(self, labels: typing.Dict[str, typing.Any]) -> tuple:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def label_values(self) -> typing.List[typing.Dict[str, str]]:
+        """Returns every label combination that has been recorded so far."""
+        with self._lock:
+            keys = list(self._values)
+        return [dict(zip(self.labelnames, key)) for key in keys]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class Counter(_Metric):
+    """A monotonically increasing value."""
+
+    type_ = "counter"
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def get(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def total(self) -> float:
+        with self._lock:
+            return sum(self._values.values())
+
+    def samples(self):
+        with self._lock:
+            items = list(self._values.items())
+        for key, value in items:
+            yield "", dict(zip(self.labelnames, key)), value
+
+
+class Gauge(_Metric):
+    """
+    A value that can go up and down.
+
+    A gauge can also be bound to a callback with `set_function`,
+    in which case the value is computed whenever it is read.
+    """
+
+    type_ = "gauge"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._function = None
+
+    def set(self, value: float, **labels) -> None:
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels) -> None:
+        self.inc(-amount, **labels)
+
+    def set_function(self, function: typing.Callable[[], float]) -> None:
+        self._function = function
+
+    def get(self, **labels) -> float:
+        if self._function is not None:
+            return self._function()
+        return self._values.get(self._key(labels), 0)
+
+    def samples(self):
+        if self._function is not None:
+            try:
+                value = self._function()
+            except Exception:  # pylint: disable=broad-except
+                logger.warning("Failed to collect %s.", self.name, exc_info=True)
+                return
+            yield "", {}, value
+            return
+        with self._lock:
+            items = list(self._values.items())
+        for key, value in items:
+            yield "", dict(zip(self.labelnames, key)), value
+
+
+class Histogram(_Metric):
+    """
+    Samples observations into cumulative buckets.
+
+    Parameters
+    ----------
+    name : str
+        The name of the metric.
+    documentation : str
+        A short description of the metric.
+    labelnames : Iterable[str]
+        The label names the observations are split by.
+    buckets : Iterable[float]
+        The (sorted) upper bounds of the buckets, in seconds.
+    """
+
+    type_ = "histogram"
+
+    def __init__(self, *args, buckets: typing.Iterable[float] = DEFAULT_BUCKETS, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                # [bucket counts..., +Inf count], sum
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            counts = state[0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+                    break
+            else:
+                counts[-1] += 1
+            state[1] += value
+
+    @contextmanager
+    def time(self, **labels):
+        """Observes the wall time spent in the ``with`` block."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def _state(self, labels):
+        with self._lock:
+            state = self._values.get(self._key(labels))
+            if state is None:
+                return None
+            return list(state[0]), state[1]
+
+    def count(self, **labels) -> int:
+        state = self._state(labels)
+        return sum(state[0]) if state is not None else 0
+
+    def sum(self, **labels) -> float:
+        state = self._state(labels)
+        return state[1] if state is not None else 0.0
+
+    def quantile(self, q: float, **labels) -> typing.Optional[float]:
+        """
+        Estimates the `q` quantile by linear interpolation within the buckets.
+
+        Returns
+        -------
+        Optional[float]
+            The estimated quantile, or `None` if nothing has been observed.
+        """
+        state = self._state(labels)
+        if state is None:
+            return None
+        counts = state[0]
+        total = sum(counts)
+        if not total:
+            return None
+
+        rank = q * total
+        seen = 0
+        lower = 0.0
+        for i, bound in enumerate(self.buckets):
+            if seen + counts[i] >= rank:
+                if not counts[i]:
+                    return bound
+                return lower + (bound - lower) * (rank - seen) / counts[i]
+            seen += counts[i]
+            lower = bound
+        # Falls in the +Inf bucket, the best estimate is the highest bound.
+        return self.buckets[-1]
+
+    def samples(self):
+        with self._lock:
+            items = [(key, list(state[0]), state[1]) for key, state in self._values.items()]
+        for key, counts, total in items:
+            labels = dict(zip(self.labelnames, key))
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                yield "_bucket", {**labels, "le": repr(float(bound))}, cumulative
+            cumulative += counts[-1]
+            yield "_bucket", {**labels, "le": "+Inf"}, cumulative
+            yield "_count", labels, cumulative
+            yield "_sum", labels, total
+
+
+class MetricsRegistry:
+    """Holds every metric of the process, keyed by name."""
+
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def __iter__(self):
+        with self._lock:
+            return iter(list(self._metrics.values()))
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._metrics
+
+    def get(self, name: str) -> typing.Optional[_Metric]:
+        return self._metrics.get(name)
+
+    def _get_or_create(self, cls, name, documentation, labelnames, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, documentation, labelnames, **kwargs)
+            elif not isinstance(metric, cls):
+                raise ValueError(f"Metric {name} is already registered as a {metric.type_}.")
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames=()) -> Counter:
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames=()) -> Gauge:
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+
+    def histogram(
+        self, name: str, documentation: str, labelnames=(), buckets=DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def render(self) -> str:
+        """Renders every metric in the Prometheus text exposition format."""
+        lines = []
+        for metric in sorted(self, key=lambda m: m.name):
+            lines.append(f"# HELP {metric.name} {_escape(metric.documentation, help_=True)}")
+            lines.append(f"# TYPE {metric.name} {metric.type_}")
+            for suffix, labels, value in metric.samples():
+                if labels:
+                    labels = ",".join(f'{k}="{_escape(str(v))}"' for k, v in labels.items())
+                    lines.append(f"{metric.name}{suffix}{{{labels}}} {_format_value(value)}")
+                else:
+                    lines.append(f"{metric.name}{suffix} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str, help_: bool = False) -> str:
+    value = value.replace("\\", "\\\\").replace("\n", "\\n")
+    if not help_:
+        value = value.replace('"', '\\"')
+    return value
+
+
+def _format_value(value: float) -> str:
+    if value != value:
+        return "NaN"
+    if value in (float("inf"), float("-inf")):
+        return "+Inf" if value > 0 else "-Inf"
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+registry = MetricsRegistry()
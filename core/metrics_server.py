@@ -0,0 +1,76 @@
+"""
+Serves the metrics of `core.metrics.registry` to Prometheus.
+
+Enabled with ``METRICS_PORT``, the metrics are then scraped from
+``http://METRICS_HOST:METRICS_PORT/metrics``. Besides the metrics
+recorded by the rest of the bot, the server reports the gateway
+latency.
+"""
+
+import math
+import time
+
+from aiohttp import web
+
+from core.metrics import registry
+from core.models import getLogger
+
+logger = getLogger(__name__)
+
+GATEWAY_LATENCY = registry.gauge(
+    "modmail_gateway_latency_seconds", "Latency between a gateway heartbeat and its ack."
+)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class MetricsServer:
+    """
+    An HTTP server exposing the metrics in the Prometheus text format.
+
+    Parameters
+    ----------
+    bot : ModmailBot
+        The bot.
+    host : str
+        The address to listen on.
+    port : int
+        The port to listen on.
+    """
+
+    def __init__(self, bot, host: str, port: int):
+        self.bot = bot
+        self.host = host
+        self.port = port
+        self._runner = None
+
+    def _gateway_latency(self) -> float:
+        latency = self.bot.latency
+        return latency if math.isfinite(latency) else math.nan
+
+    async def _metrics(self, request: web.Request) -> web.Response:
+        start = time.perf_counter()
+        body = registry.render()
+        logger.debug("Rendered the metrics in %.2fms.", (time.perf_counter() - start) * 1000)
+        return web.Response(body=body.encode("utf-8"), headers={"Content-Type": CONTENT_TYPE})
+
+    async def start(self) -> None:
+        GATEWAY_LATENCY.set_function(self._gateway_latency)
+
+        app = web.Application()
+        app.router.add_get("/metrics", self._metrics)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        try:
+            await web.TCPSite(self._runner, self.host, self.port).start()
+        except Exception:
+            await self._runner.cleanup()
+            self._runner = None
+            raise
+
+        logger.info("Serving metrics on http://%s:%d/metrics.", self.host, self.port)
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
@@ -1,9 +1,13 @@
+import atexit
+import json
 import logging
+import queue
 import re
 import sys
 import os
+from datetime import datetime
 from enum import IntEnum
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from string import Formatter
 
 import discord
@@ -107,27 +111,69 @@ ch.setFormatter(formatter)
 ch_debug = None
 
 
+class _DeferredQueueHandler(QueueHandler):
+    """Enqueues the records as they are, the listener's thread formats them."""
+
+    def prepare(self, record):
+        return record
+
+
+# Loggers only put their records in a queue, they are formatted and written
+# to the console and the log file by the listener's thread, away from the
+# event loop.
+log_queue = queue.SimpleQueue()
+queue_handler = _DeferredQueueHandler(log_queue)
+listener = QueueListener(log_queue, ch, respect_handler_level=True)
+listener.start()
+atexit.register(listener.stop)
+
+
 def getLogger(name=None) -> ModmailLogger:
     logger = logging.getLogger(name)
     logger.setLevel(log_level)
-    logger.addHandler(ch)
-    if ch_debug is not None:
-        logger.addHandler(ch_debug)
+    logger.addHandler(queue_handler)
     loggers.add(logger)
     return logger
 
 
+ansi_escape = re.compile(r"\x1B\[[0-?]*[ -/]*[@-~]")
+
+
+def strip_ansi(text: str) -> str:
+    if "\x1b" not in text:
+        return text
+    return ansi_escape.sub("", text)
+
+
 class FileFormatter(logging.Formatter):
-    ansi_escape = re.compile(r"\x1B\[[0-?]*[ -/]*[@-~]")
+    ansi_escape = ansi_escape
 
     def format(self, record):
-        record.msg = self.ansi_escape.sub("", record.msg)
-        return super().format(record)
+        # The record is shared with the console handler, only its output is stripped.
+        return strip_ansi(super().format(record))
 
 
-def configure_logging(name, level=None):
+class JsonFormatter(logging.Formatter):
+    """Formats the records as JSON objects, one per line."""
+
+    def format(self, record):
+        entry = {
+            "time": datetime.utcfromtimestamp(record.created).isoformat() + "Z",
+            "level": record.levelname,
+            "logger": record.name,
+            "line": record.lineno,
+            "message": strip_ansi(record.getMessage()),
+        }
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        if record.stack_info:
+            entry["stack_info"] = record.stack_info
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+def configure_logging(name, level=None, max_bytes=48000, backup_count=1, json_format=False):
     global ch_debug, log_level
-    ch_debug = RotatingFileHandler(name, mode="a+", maxBytes=48000, backupCount=1)
+    ch_debug = RotatingFileHandler(name, mode="a+", maxBytes=max_bytes, backupCount=backup_count)
 
     formatter_debug = FileFormatter(
         "%(asctime)s %(name)s[%(lineno)d] - %(levelname)s: %(message)s",
@@ -136,14 +182,17 @@ def configure_logging(name, level=None):
     ch_debug.setFormatter(formatter_debug)
     ch_debug.setLevel(logging.DEBUG)
 
+    if json_format:
+        ch.setFormatter(JsonFormatter())
+
     if level is not None:
         log_level = level
 
     ch.setLevel(log_level)
+    listener.handlers = (ch, ch_debug)
 
     for logger in loggers:
         logger.setLevel(log_level)
-        logger.addHandler(ch_debug)
 
 
 class _Default:
@@ -250,3 +250,106 @@ class MessagePaginatorSession(PaginatorSession):
     async def _show_page(self, page) -> None:
         self._set_footer()
         await self.base.edit(content=page, embed=self.embed)
+
+
+class TailPaginatorSession(MessagePaginatorSession):
+    """
+    Pages backwards through a file, the older pages are read when shown.
+
+    ``pages`` holds the pages read so far, the most recent one first.
+
+    Parameters
+    ----------
+    ctx : Context
+        The context of the command.
+    reader : TailReader
+        The reader of the file.
+    fmt : str
+        The format of the pages, e.g. to put the lines in a code block.
+    embed : Embed, optional
+        The embed sent with the pages.
+    """
+
+    def __init__(self, ctx: commands.Context, reader, *, fmt: str = "{}", **options):
+        super().__init__(ctx, **options)
+        self.reader = reader
+        self.fmt = fmt
+
+    async def load_page(self) -> bool:
+        """
+        Reads the next older page in the default executor.
+
+        Returns
+        -------
+        bool
+            Whether there was a page left to read.
+        """
+        lines = await self.ctx.bot.loop.run_in_executor(None, self.reader.read_page)
+        if lines is None:
+            return False
+        self.pages.append(self.fmt.format(lines))
+        return True
+
+    def _set_footer(self):
+        if self.embed is not None:
+            if self.reader.exhausted:
+                footer_text = f"Page {len(self.pages) - self.current} of {len(self.pages)}"
+            else:
+                footer_text = f"Page {self.current + 1} from the end"
+            if self.footer_text:
+                footer_text = footer_text + " • " + self.footer_text
+            self.embed.set_footer(text=footer_text, icon_url=self.embed.footer.icon_url)
+
+    async def create_base(self, item: str) -> None:
+        await self._create_base(item)
+
+        if len(self.pages) == 1 and self.reader.exhausted:
+            self.running = False
+            return
+
+        self.running = True
+        for reaction in self.reaction_map:
+            await self.ctx.bot.add_reaction(self.base, reaction)
+
+    async def show_page(self, index: int) -> None:
+        while index >= len(self.pages) and await self.load_page():
+            pass
+        await super().show_page(index)
+
+    async def previous_page(self) -> None:
+        """
+        Go to the older page.
+        """
+        await self.show_page(self.current + 1)
+
+    async def next_page(self) -> None:
+        """
+        Go to the newer page.
+        """
+        await self.show_page(self.current - 1)
+
+    async def first_page(self) -> None:
+        """
+        Go to the oldest page, reading all of them.
+        """
+
+        def read_all():
+            pages = []
+            lines = self.reader.read_page()
+            while lines is not None:
+                pages.append(self.fmt.format(lines))
+                lines = self.reader.read_page()
+            return pages
+
+        self.pages += await self.ctx.bot.loop.run_in_executor(None, read_all)
+        await self.show_page(len(self.pages) - 1)
+
+    async def last_page(self) -> None:
+        """
+        Go to the most recent page.
+        """
+        await self.show_page(0)
+
+    async def close(self, delete: bool = True) -> typing.Optional[Message]:
+        self.reader.close()
+        return await super().close(delete)
@@ -0,0 +1,148 @@
+"""
+Accounting of the REST calls made to Discord.
+
+`install` wraps the bot's `HTTPClient.request` to count the calls and
+their latency per route, and hooks the `discord.http` logger to record
+the rate limits (429s) discord.py handles internally. Every call is
+attributed to the command or event handler that made it through the
+`origin` context variable, which is inherited by the tasks they spawn.
+"""
+
+import logging
+import threading
+import time
+import typing
+from collections import OrderedDict
+from contextvars import ContextVar
+
+from discord.http import HTTPClient, Route
+
+from core.metrics import registry
+
+origin: ContextVar[str] = ContextVar("origin", default="background")
+_route: ContextVar[typing.Optional[Route]] = ContextVar("route", default=None)
+
+REST_REQUESTS = registry.counter(
+    "modmail_rest_requests_total", "REST calls made to Discord.", ["route", "origin"]
+)
+REST_LATENCY = registry.histogram(
+    "modmail_rest_request_seconds",
+    "Latency of the REST calls made to Discord, rate limit waits included.",
+    ["route"],
+)
+REST_RATELIMITED = registry.counter(
+    "modmail_rest_ratelimited_total",
+    "REST calls that were rate limited (429) by Discord.",
+    ["route", "origin", "scope"],
+)
+REST_RATELIMIT_WAIT = registry.counter(
+    "modmail_rest_ratelimit_wait_seconds_total",
+    "Time spent waiting for rate limits to reset.",
+    ["route"],
+)
+
+
+def route_name(route: Route) -> str:
+    return f"{route.method} {route.path}"
+
+
+class BucketStats:
+    """
+    The calls and rate limits of the most recently used buckets.
+
+    Buckets include channel and guild IDs, so they are kept out of the
+    metrics registry and only the `max_buckets` most recent are tracked.
+    """
+
+    def __init__(self, max_buckets: int = 500):
+        self.max_buckets = max_buckets
+        self._lock = threading.Lock()
+        self._buckets = OrderedDict()
+
+    def _get(self, bucket: str) -> list:
+        stats = self._buckets.get(bucket)
+        if stats is None:
+            # calls, 429s, seconds waited
+            stats = self._buckets[bucket] = [0, 0, 0.0]
+            if len(self._buckets) > self.max_buckets:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(bucket)
+        return stats
+
+    def call(self, bucket: str) -> None:
+        with self._lock:
+            self._get(bucket)[0] += 1
+
+    def ratelimited(self, bucket: str, retry_after: float) -> None:
+        with self._lock:
+            stats = self._get(bucket)
+            stats[1] += 1
+            stats[2] += retry_after
+
+    def top(self, n: int = 10) -> typing.List[typing.Tuple[str, int, int, float]]:
+        """The `n` buckets with the most rate limits, then the most calls."""
+        with self._lock:
+            items = [(bucket, *stats) for bucket, stats in self._buckets.items()]
+        items.sort(key=lambda i: (i[2], i[1]), reverse=True)
+        return items[:n]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+
+
+buckets = BucketStats()
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Records the rate limits logged by `discord.http`.
+
+    The records are emitted from within `HTTPClient.request`,
+    so the route and origin of the call are still in context.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno != logging.WARNING or not record.msg.startswith(
+            ("We are being rate limited", "Global rate limit")
+        ):
+            return True
+
+        route = _route.get()
+        name = route_name(route) if route is not None else "unknown"
+        retry_after = float(record.args[0]) if record.args else 0.0
+        if record.msg.startswith("Global"):
+            # Follows the bucket warning of the same 429.
+            REST_RATELIMITED.inc(route=name, origin=origin.get(), scope="global")
+        else:
+            REST_RATELIMITED.inc(route=name, origin=origin.get(), scope="bucket")
+            REST_RATELIMIT_WAIT.inc(retry_after, route=name)
+            buckets.ratelimited(str(record.args[1]), retry_after)
+        return True
+
+
+def install(http: HTTPClient) -> None:
+    """Wraps `http.request` to account for every REST call."""
+    if getattr(http.request, "__modmail_accounting__", False):
+        return
+    request = http.request
+
+    async def accounted_request(route: Route, **kwargs):
+        name = route_name(route)
+        REST_REQUESTS.inc(route=name, origin=origin.get())
+        buckets.call(route.bucket)
+        token = _route.set(route)
+        start = time.perf_counter()
+        try:
+            return await request(route, **kwargs)
+        finally:
+            REST_LATENCY.observe(time.perf_counter() - start, route=name)
+            _route.reset(token)
+
+    accounted_request.__modmail_accounting__ = True
+    http.request = accounted_request
+
+    logger = logging.getLogger("discord.http")
+    if not any(isinstance(f, RateLimitFilter) for f in logger.filters):
+        logger.addFilter(RateLimitFilter())
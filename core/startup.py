@@ -0,0 +1,152 @@
+"""
+Measures where the time goes while the bot starts.
+
+`StartupProfiler.start` is called before the bot imports its
+dependencies: until `StartupProfiler.stop`, the execution of every
+module imported is timed, like ``python -X importtime`` does. The phases
+of the startup are marked with `StartupProfiler.mark` and the report is
+logged once the bot is ready.
+
+Only the standard library is imported here, so the imports of the
+dependencies are all measured.
+"""
+
+import sys
+import time
+import typing
+from contextlib import contextmanager
+
+
+class ImportTiming(typing.NamedTuple):
+    name: str
+    # seconds spent executing the module, excluding the modules it imported
+    self_time: float
+    cumulative: float
+    # 0 for the modules imported by the bot itself
+    depth: int
+
+
+class _TimedLoader:
+    """Wraps a loader to time the execution of the module."""
+
+    def __init__(self, profiler: "StartupProfiler", loader):
+        self._profiler = profiler
+        self._loader = loader
+
+    def __getattr__(self, item):
+        return getattr(self._loader, item)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        # The module only ever sees its real loader.
+        module.__loader__ = self._loader
+        if module.__spec__ is not None:
+            module.__spec__.loader = self._loader
+        with self._profiler.timing(module.__name__):
+            self._loader.exec_module(module)
+
+
+class _TimingFinder:
+    """Finds the modules with the other finders, and wraps their loaders."""
+
+    def __init__(self, profiler: "StartupProfiler"):
+        self._profiler = profiler
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is None:
+                continue
+            if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                spec.loader = _TimedLoader(self._profiler, spec.loader)
+            return spec
+        return None
+
+
+class StartupProfiler:
+    """
+    Times the imports and the phases of the startup.
+
+    Attributes
+    ----------
+    started_at : float
+        The `time.perf_counter` value when the profiler started.
+    phases : List[Tuple[str, float]]
+        The phases marked, with the seconds since the profiler started.
+    finished : bool
+        Whether the startup is finished.
+    imports : List[ImportTiming]
+        The modules imported while the profiler was installed.
+    """
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.phases = []
+        self.imports = []
+        self.finished = False
+        self._finder = None
+        # seconds spent in the modules imported by the module being imported
+        self._children = []
+
+    def start(self) -> None:
+        self.started_at = time.perf_counter()
+        if self._finder is None:
+            self._finder = _TimingFinder(self)
+            sys.meta_path.insert(0, self._finder)
+
+    def stop(self) -> None:
+        """Stops timing the imports, the startup is finished."""
+        self.finished = True
+        if self._finder is not None:
+            sys.meta_path.remove(self._finder)
+            self._finder = None
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started_at
+
+    def mark(self, phase: str) -> None:
+        """Marks the end of a phase of the startup."""
+        self.phases.append((phase, self.elapsed()))
+
+    @contextmanager
+    def timing(self, name: str):
+        """Times the import of the module `name`."""
+        self._children.append(0.0)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            cumulative = time.perf_counter() - start
+            children = self._children.pop()
+            if self._children:
+                self._children[-1] += cumulative
+            self.imports.append(
+                ImportTiming(name, cumulative - children, cumulative, len(self._children))
+            )
+
+    def slowest_imports(self, n: int = 10) -> typing.List[ImportTiming]:
+        """The `n` slowest of the modules imported by the bot itself."""
+        direct = [i for i in self.imports if i.depth == 0]
+        return sorted(direct, key=lambda i: i.cumulative, reverse=True)[:n]
+
+    def report(self) -> str:
+        lines = []
+        previous = 0.0
+        for phase, at in self.phases:
+            lines.append(f"{phase:<24}{(at - previous) * 1000:>8.0f} ms{at:>8.2f} s")
+            previous = at
+        total = sum(i.cumulative for i in self.imports if i.depth == 0)
+        lines.append(f"Imports: {len(self.imports)} modules, {total * 1000:.0f} ms, slowest:")
+        for timing in self.slowest_imports():
+            lines.append(
+                f"  {timing.name:<30}{timing.cumulative * 1000:>8.0f} ms"
+                f" ({timing.self_time * 1000:.0f} ms itself)"
+            )
+        return "\n".join(lines)
+
+
+profiler = StartupProfiler()
@@ -1,8 +1,9 @@
 import asyncio
 import copy
-import io
 import re
 import typing
+import itertools
+from collections import Counter, OrderedDict
 from datetime import datetime, timedelta
 import time
 from types import SimpleNamespace
@@ -12,10 +13,12 @@ import isodate
 import discord
 from discord.ext.commands import MissingRequiredArgument, CommandError
 
+from core.metrics import registry
 from core.models import DMDisabled, DummyMessage, getLogger
 from core.time import human_timedelta
+from core.tracing import tracer
 from core.utils import (
-    is_image_url,
+    classify_media,
     days,
     match_title,
     match_user_id,
@@ -25,6 +28,371 @@ from core.utils import (
 
 logger = getLogger(__name__)
 
+REPLY_LATENCY = registry.histogram(
+    "modmail_reply_delivery_seconds",
+    "Time to deliver a staff reply to the recipient and the thread channel.",
+    ["mode"],
+)
+TYPING_REQUESTS = registry.counter(
+    "modmail_typing_requests_total", "Typing indicators sent or skipped.", ["result"]
+)
+MESSAGES_RELAYED = registry.counter(
+    "modmail_messages_relayed_total",
+    "Messages relayed from recipients to threads and from staff to recipients.",
+    ["direction"],
+)
+THREADS_OPENED = registry.counter("modmail_threads_opened_total", "Threads opened.")
+THREADS_CLOSED = registry.counter("modmail_threads_closed_total", "Threads closed.")
+OPEN_THREADS = registry.gauge("modmail_open_threads", "Threads currently open.")
+CACHE_REQUESTS = registry.counter(
+    "modmail_cache_requests_total", "Lookups of the in-memory caches.", ["cache", "result"]
+)
+
+
+class TypingCoalescer:
+    """
+    Sends at most one typing indicator per destination every `interval` seconds.
+
+    A typing indicator lasts about ten seconds, triggering it again
+    before that only costs a REST call.
+    """
+
+    def __init__(self, interval: float = 5):
+        self.interval = interval
+        self._last = {}
+
+    async def trigger(
+        self,
+        destination: typing.Union[
+            discord.TextChannel, discord.DMChannel, discord.User, discord.Member
+        ],
+    ) -> bool:
+        """
+        Triggers the typing indicator in `destination`, unless it was recently triggered.
+
+        Returns
+        -------
+        bool
+            Whether a typing indicator was sent.
+        """
+        now = time.monotonic()
+        last = self._last.get(destination.id)
+        if last is not None and now - last < self.interval:
+            TYPING_REQUESTS.inc(result="skipped")
+            return False
+
+        if len(self._last) >= 1000:
+            self._last = {k: v for k, v in self._last.items() if now - v < self.interval}
+        self._last[destination.id] = now
+        await destination.trigger_typing()
+        TYPING_REQUESTS.inc(result="sent")
+        return True
+
+
+class LinkCache:
+    """
+    Maps the IDs of recently relayed messages to the ID of their copy.
+
+    A DM message and its thread channel copy are linked in both
+    directions, so either can be resolved without scanning history.
+    """
+
+    def __init__(self, maxsize: int = 10000):
+        self.maxsize = maxsize
+        self._links = OrderedDict()
+
+    def add(self, message_id: int, linked_id: int) -> None:
+        for key, value in ((message_id, linked_id), (linked_id, message_id)):
+            self._links[key] = value
+            self._links.move_to_end(key)
+        while len(self._links) > self.maxsize:
+            self._links.popitem(last=False)
+
+    def get(self, message_id: int) -> typing.Optional[int]:
+        linked_id = self._links.get(message_id)
+        CACHE_REQUESTS.inc(cache="links", result="miss" if linked_id is None else "hit")
+        return linked_id
+
+
+class ChannelNameRegistry:
+    """
+    Keeps track of the text channel names of the modmail guild.
+
+    Names are reserved synchronously while their channel is being
+    created, so concurrent thread creations never pick the same name.
+    The registry is kept up to date from the channel events.
+    """
+
+    def __init__(self):
+        self._channels = {}  # channel ID -> name
+        self._counts = Counter()
+        self._reserved = Counter()
+        self.populated = False
+
+    def __contains__(self, name: str) -> bool:
+        return self._counts.get(name, 0) > 0 or self._reserved.get(name, 0) > 0
+
+    def populate(self, guild: discord.Guild) -> None:
+        self._channels.clear()
+        self._counts.clear()
+        for channel in guild.text_channels:
+            self.track(channel)
+        self.populated = True
+
+    def track(self, channel: discord.TextChannel) -> None:
+        """Adds or updates the name of `channel`."""
+        old = self._channels.get(channel.id)
+        if old == channel.name:
+            return
+        if old is not None:
+            self._counts[old] -= 1
+            if self._counts[old] <= 0:
+                del self._counts[old]
+        self._channels[channel.id] = channel.name
+        self._counts[channel.name] += 1
+
+    def untrack(self, channel: discord.abc.GuildChannel) -> None:
+        old = self._channels.pop(channel.id, None)
+        if old is not None:
+            self._counts[old] -= 1
+            if self._counts[old] <= 0:
+                del self._counts[old]
+
+    def reserve(
+        self,
+        author: typing.Union[discord.Member, discord.User],
+        guild: discord.Guild,
+        *,
+        exclude_channel: discord.TextChannel = None,
+        force_null: bool = False,
+    ) -> str:
+        """
+        Picks a free channel name for `author` and reserves it until `release` is called.
+
+        `exclude_channel`'s own name is not considered taken.
+        """
+        if not self.populated:
+            self.populate(guild)
+
+        existing = self
+        if exclude_channel is not None and exclude_channel.id in self._channels:
+            own_name = self._channels[exclude_channel.id]
+            existing = {
+                name
+                for name, count in itertools.chain(self._counts.items(), self._reserved.items())
+                if count > 1 or name != own_name
+            }
+
+        name = format_channel_name(author, guild, force_null=force_null, existing=existing)
+        self._reserved[name] += 1
+        return name
+
+    def release(self, name: str) -> None:
+        self._reserved[name] -= 1
+        if self._reserved[name] <= 0:
+            del self._reserved[name]
+
+
+class CategoryPool:
+    """
+    Spreads the thread channels over the main, fallback and overflow categories.
+
+    The number of channels of each category is tracked in memory from
+    the channel events, and the categories are looked up once until the
+    category config or a category channel changes, so picking a category
+    never scans the guild.
+    Overflow categories are cloned from the main category in the
+    background before the pool runs out of room, and deleted again
+    once they are empty and no longer needed.
+    """
+
+    # Discord's limit of channels in a category
+    capacity = 50
+    # Free slots kept available across the pool
+    spare_slots = 10
+
+    def __init__(self, bot):
+        self.bot = bot
+        self._channels = {}  # channel ID -> category ID
+        self._counts = Counter()
+        self._pending = Counter()
+        self._spare_task = None
+        # (the category config values, the categories looked up from them)
+        self._categories = None
+        self.populated = False
+
+    def populate(self, guild: discord.Guild) -> None:
+        self._channels.clear()
+        self._counts.clear()
+        self._categories = None
+        for channel in guild.channels:
+            self.track(channel)
+        self.populated = True
+
+    def track(self, channel: discord.abc.GuildChannel) -> None:
+        """Adds or updates the category of `channel`."""
+        if isinstance(channel, discord.CategoryChannel):
+            self._categories = None
+        old = self._channels.get(channel.id)
+        if old == channel.category_id and channel.id in self._channels:
+            return
+        if old is not None:
+            self._counts[old] -= 1
+        self._channels[channel.id] = channel.category_id
+        if channel.category_id is not None:
+            self._counts[channel.category_id] += 1
+
+    def untrack(self, channel: discord.abc.GuildChannel) -> None:
+        if isinstance(channel, discord.CategoryChannel):
+            self._categories = None
+        old = self._channels.pop(channel.id, None)
+        if old is None:
+            return
+        self._counts[old] -= 1
+        if not self._counts[old]:
+            self._maybe_remove(old)
+
+    def count(self, category: discord.CategoryChannel) -> int:
+        return self._counts[category.id] + self._pending[category.id]
+
+    @property
+    def overflow_ids(self) -> typing.List[int]:
+        return [int(i) for i in self.bot.config["overflow_category_ids"]]
+
+    @property
+    def categories(self) -> typing.List[discord.CategoryChannel]:
+        """The categories of the pool, in order of preference."""
+        config = self.bot.config
+        key = (
+            config["main_category_id"],
+            config["fallback_category_id"],
+            tuple(config["overflow_category_ids"]),
+        )
+        if self._categories is not None and self._categories[0] == key:
+            return self._categories[1]
+
+        guild = self.bot.modmail_guild
+        ids = [config["fallback_category_id"], *self.overflow_ids]
+        categories = [self.bot.main_category]
+        for category_id in ids:
+            category = guild.get_channel(int(category_id)) if category_id else None
+            if isinstance(category, discord.CategoryChannel) and category not in categories:
+                categories.append(category)
+        categories = [c for c in categories if c is not None]
+        # Looking up the main category may have set its id.
+        key = (config["main_category_id"], *key[1:])
+        self._categories = (key, categories)
+        return categories
+
+    def free_slots(self) -> int:
+        return sum(max(self.capacity - self.count(c), 0) for c in self.categories)
+
+    def pick(self) -> typing.Optional[discord.CategoryChannel]:
+        """
+        The main category while it has room, otherwise the least loaded other category.
+        """
+        categories = self.categories
+        if not categories or self.count(categories[0]) < self.capacity:
+            return categories[0] if categories else None
+        others = [c for c in categories[1:] if self.count(c) < self.capacity]
+        if not others:
+            return None
+        return min(others, key=self.count)
+
+    async def acquire(
+        self, category: discord.CategoryChannel = None
+    ) -> typing.Optional[discord.CategoryChannel]:
+        """
+        Picks the category of a new thread channel and holds a slot in it until `release`.
+
+        Only waits for a new overflow category when the whole pool is full.
+
+        Parameters
+        ----------
+        category : discord.CategoryChannel, optional
+            The category requested for the channel, a slot is held in it
+            instead of picking one.
+        """
+        if not self.populated:
+            self.populate(self.bot.modmail_guild)
+
+        if category is None:
+            category = self.pick()
+        if category is None and self.bot.main_category is not None:
+            logger.warning("Every Modmail category is full, waiting for a new one.")
+            self.ensure_spare()
+            await asyncio.shield(self._spare_task)
+            category = self.pick()
+
+        if category is not None:
+            self._pending[category.id] += 1
+        self.ensure_spare()
+        return category
+
+    def release(
+        self, category: discord.CategoryChannel, channel: discord.TextChannel = None
+    ) -> None:
+        """Releases a slot held by `acquire`, `channel` is the channel created in it."""
+        if channel is not None:
+            self.track(channel)
+        if category is not None and self._pending[category.id] > 0:
+            self._pending[category.id] -= 1
+
+    def ensure_spare(self) -> None:
+        """Creates an overflow category in the background if the pool runs low on room."""
+        if self.bot.main_category is None:
+            return
+        if self._spare_task is not None and not self._spare_task.done():
+            return
+        if self.free_slots() >= self.spare_slots:
+            return
+        self._spare_task = self.bot.loop.create_task(self._create_spare())
+
+    async def _create_spare(self) -> None:
+        try:
+            category = await self.bot.main_category.clone(name="Fallback Modmail")
+        except discord.HTTPException:
+            logger.error("Failed to create an overflow category.", exc_info=True)
+            return
+        self._counts[category.id] = 0
+        self._channels[category.id] = None
+        if self.bot.config["fallback_category_id"] is None:
+            self.bot.config.set("fallback_category_id", category.id)
+        else:
+            self.bot.config["overflow_category_ids"] = [*self.overflow_ids, category.id]
+        await self.bot.config.update()
+        logger.info("Created overflow category %s.", category.id)
+
+    def _maybe_remove(self, category_id: int) -> None:
+        """Deletes an empty overflow category when the pool has enough room without it."""
+        if category_id not in self.overflow_ids or self._pending[category_id]:
+            return
+        if self.free_slots() - self.capacity < self.spare_slots * 2:
+            return
+        category = self.bot.modmail_guild.get_channel(category_id)
+
+        async def remove():
+            self.bot.config["overflow_category_ids"] = [
+                i for i in self.overflow_ids if i != category_id
+            ]
+            await self.bot.config.update()
+            if category is not None:
+                try:
+                    await category.delete(reason="Categoria de overflow vazia.")
+                except discord.HTTPException:
+                    logger.warning("Failed to delete overflow category %s.", category_id)
+            logger.info("Removed empty overflow category %s.", category_id)
+
+        self.bot.loop.create_task(remove())
+
+
+class RenderedMessage(typing.NamedTuple):
+    """The embeds of a thread message, built once for every destination."""
+
+    embed: discord.Embed
+    recipient_embed: discord.Embed
+    additional_images: typing.List[discord.Embed]
+
 
 class Thread:
     """Represents a discord Modmail thread"""
@@ -118,23 +486,29 @@ class Thread:
         if category is not None:
             overwrites = None
 
+        names = self.manager.names
+        name = names.reserve(recipient, self.bot.modmail_guild)
         try:
             channel = await self.bot.modmail_guild.create_text_channel(
-                name=format_channel_name(recipient, self.bot.modmail_guild),
+                name=name,
                 category=category,
                 overwrites=overwrites,
                 reason="Criando um canal de ticket.",
             )
         except discord.HTTPException as e:
             # try again but null-discrim (name could be banned)
+            names.release(name)
+            name = names.reserve(recipient, self.bot.modmail_guild, force_null=True)
             try:
                 channel = await self.bot.modmail_guild.create_text_channel(
-                    name=format_channel_name(recipient, self.bot.modmail_guild, force_null=True),
+                    name=name,
                     category=category,
                     overwrites=overwrites,
                     reason="Criando um canal de ticket.",
                 )
             except discord.HTTPException as e:  # Failed to create due to missing perms.
+                names.release(name)
+                self.manager.categories.release(category)
                 logger.critical("An error occurred while creating a thread.", exc_info=True)
                 self.manager.cache.pop(self.id)
 
@@ -147,7 +521,11 @@ class Thread:
                     await self.bot.log_channel.send(embed=embed)
                 return
 
+        names.track(channel)
+        names.release(name)
+        self.manager.categories.release(category, channel)
         self._channel = channel
+        THREADS_OPENED.inc()
 
         try:
             log_url, log_data = await asyncio.gather(
@@ -387,6 +765,7 @@ class Thread:
         except KeyError as e:
             logger.error("Ticket já foi fechado: %s.", e)
             return
+        THREADS_CLOSED.inc()
 
         await self.cancel_closure(all=True)
 
@@ -746,16 +1125,24 @@ class Thread:
                 )
             )
 
+        self._handle_activity()
+        if not self.ready:
+            await self.wait_until_ready()
+
+        # Parsed once, both the recipient and the thread channel copies derive from it.
+        rendered = self.render(message, from_mod=True, anonymous=anonymous)
+
         tasks = []
+        concurrent = self.bot.config["concurrent_reply_delivery"]
+        start = time.perf_counter()
 
         try:
-            await self.send(
-                message,
-                destination=self.recipient,
-                from_mod=True,
-                anonymous=anonymous,
-                plain=plain,
-            )
+            if concurrent:
+                delivered, msg = await self._deliver_concurrently(message, rendered, plain=plain)
+            else:
+                delivered = await self._deliver(
+                    message, self.recipient, rendered, from_mod=True, plain=plain,
+                )
         except Exception as e:
             logger.error("Message delivery failed:", exc_info=True)
             if isinstance(e, discord.Forbidden):
@@ -777,32 +1164,41 @@ class Thread:
                 )
             )
         else:
-            # Send the same thing in the thread channel.
-            msg = await self.send(
-                message, destination=self.channel, from_mod=True, anonymous=anonymous, plain=plain
+            # Send the same thing in the thread channel, the command
+            # message is deleted meanwhile.
+            if not message.attachments:
+                tasks.append(self.bot.loop.create_task(self._delete_message(message)))
+            if not concurrent:
+                try:
+                    msg = await self._deliver(
+                        message, self.channel, rendered, from_mod=True, plain=plain
+                    )
+                except Exception:
+                    logger.error(
+                        "Failed to copy the reply to %s in the thread channel.",
+                        self.recipient,
+                        exc_info=True,
+                    )
+                    msg = None
+            REPLY_LATENCY.observe(
+                time.perf_counter() - start, mode="concurrent" if concurrent else "serial"
             )
+            MESSAGES_RELAYED.inc(direction="to_recipient")
+            if msg is None:
+                # The recipient got the reply, only its copy is missing.
+                msg = await self._send_mirror_warning(message)
+            if msg is not None:
+                self.manager.links.add(delivered.id, msg.id)
 
             tasks.append(
                 self.bot.api.append_log(
                     message,
-                    message_id=msg.id,
+                    message_id=msg.id if msg is not None else "",
                     channel_id=self.channel.id,
                     type_="anonymous" if anonymous else "thread_message",
                 )
             )
 
-            # Cancel closing if a thread message is sent.
-            if self.close_task is not None:
-                await self.cancel_closure()
-                tasks.append(
-                    self.channel.send(
-                        embed=discord.Embed(
-                            color=self.bot.error_color,
-                            description="Fecho calendarizado foi cancelado.",
-                        )
-                    )
-                )
-
         await asyncio.gather(*tasks)
         self.bot.dispatch("thread_reply", self, True, message, anonymous, plain)
 
@@ -820,6 +1216,103 @@ class Thread:
         thread_creation: bool = False,
     ) -> None:
 
+        self._handle_activity()
+
+        if not self.ready:
+            with tracer.span("thread_setup"):
+                await self.wait_until_ready()
+
+        if not from_mod and not note:
+            self.bot.loop.create_task(
+                tracer.wrap(
+                    "append_log", self.bot.api.append_log(message, channel_id=self.channel.id)
+                )
+            )
+
+        destination = destination or self.channel
+
+        with tracer.span("render"):
+            rendered = self.render(
+                message,
+                from_mod=from_mod,
+                note=note,
+                anonymous=anonymous,
+                persistent_note=persistent_note,
+            )
+
+        if (from_mod or note) and not thread_creation:
+            delete_message = not bool(message.attachments)
+            if delete_message and destination == self.channel:
+                await self._delete_message(message)
+
+        with tracer.span("deliver"):
+            msg = await self._deliver(
+                message, destination, rendered, from_mod=from_mod, note=note, plain=plain
+            )
+        if not from_mod and not note and destination == self.channel:
+            self.manager.links.add(message.id, msg.id)
+            MESSAGES_RELAYED.inc(direction="to_thread")
+        return msg
+
+    async def _deliver_concurrently(
+        self, message: discord.Message, rendered: "RenderedMessage", *, plain: bool = False
+    ) -> typing.Tuple[discord.Message, typing.Optional[discord.Message]]:
+        """
+        Sends a staff reply to the recipient and the thread channel at the same time.
+
+        If the delivery to the recipient fails, the messages sent to
+        the thread channel are deleted and the error is raised. If only
+        the thread channel copy fails, the error is logged.
+
+        Returns
+        -------
+        Tuple[discord.Message, Optional[discord.Message]]
+            The messages sent to the recipient and to the thread channel,
+            `None` if the thread channel copy failed.
+        """
+        mirrored = []
+        delivered, mirror = await asyncio.gather(
+            self._deliver(message, self.recipient, rendered, from_mod=True, plain=plain),
+            self._deliver(
+                message, self.channel, rendered, from_mod=True, plain=plain, sent=mirrored
+            ),
+            return_exceptions=True,
+        )
+        if isinstance(delivered, BaseException):
+            if mirrored:
+                logger.debug("Delivery to %s failed, deleting the mirrored reply.", self.recipient)
+                await asyncio.gather(*(m.delete() for m in mirrored), return_exceptions=True)
+            raise delivered
+        if isinstance(mirror, BaseException):
+            logger.error(
+                "Failed to copy the reply to %s in the thread channel.",
+                self.recipient,
+                exc_info=mirror,
+            )
+            return delivered, None
+        return delivered, mirror
+
+    async def _send_mirror_warning(
+        self, message: discord.Message
+    ) -> typing.Optional[discord.Message]:
+        """Sent in the thread channel in place of a reply delivered but not copied there."""
+        description = (
+            "A mensagem foi entregue ao recipiente, mas não pode ser copiada para este canal"
+        )
+        if message.content:
+            description += ":\n\n" + message.content
+        try:
+            return await self.channel.send(
+                embed=discord.Embed(
+                    color=self.bot.error_color, description=truncate(description, 2048)
+                )
+            )
+        except discord.HTTPException:
+            logger.warning("Failed to warn %s about the missing copy.", self.channel)
+            return None
+
+    def _handle_activity(self) -> None:
+        """Restarts the auto close timer and cancels a scheduled closure."""
         self.bot.loop.create_task(
             self._restart_close_timer()
         )  # Start or restart thread auto close
@@ -836,14 +1329,32 @@ class Thread:
                 )
             )
 
-        if not self.ready:
-            await self.wait_until_ready()
+    async def _delete_message(self, message: discord.Message) -> None:
+        try:
+            await message.delete()
+        except Exception as e:
+            logger.warning("Não foi possível apagar mensagem: %s.", e)
 
-        if not from_mod and not note:
-            self.bot.loop.create_task(self.bot.api.append_log(message, channel_id=self.channel.id))
+    def render(
+        self,
+        message: discord.Message,
+        *,
+        from_mod: bool = False,
+        note: bool = False,
+        anonymous: bool = False,
+        persistent_note: bool = False,
+    ) -> "RenderedMessage":
+        """
+        Builds the embeds of a thread message.
 
-        destination = destination or self.channel
+        The message is parsed once; for anonymous staff replies
+        a second embed is derived for the recipient.
 
+        Returns
+        -------
+        RenderedMessage
+            The embeds to send to the thread channel and the recipient.
+        """
         author = message.author
 
         embed = discord.Embed(description=message.content)
@@ -853,31 +1364,12 @@ class Thread:
         system_avatar_url = "https://discordapp.com/assets/f78426a064bc9dd24847519259bc42af.png"
 
         if not note:
-            if anonymous and from_mod and not isinstance(destination, discord.TextChannel):
-                # Anonymously sending to the user.
-                tag = self.bot.config["mod_tag"]
-                if tag is None:
-                    tag = str(author.top_role)
-                name = self.bot.config["anon_username"]
-                if name is None:
-                    name = tag
-                avatar_url = self.bot.config["anon_avatar_url"]
-                if avatar_url is None:
-                    avatar_url = self.bot.guild.icon_url
-                embed.set_author(
-                    name=name,
-                    icon_url=avatar_url,
-                    url=f"https://discordapp.com/channels/{self.bot.guild.id}#{message.id}",
-                )
-            else:
-                # Normal message
-                name = str(author)
-                avatar_url = author.avatar_url
-                embed.set_author(
-                    name=name,
-                    icon_url=avatar_url,
-                    url=f"https://discordapp.com/users/{author.id}#{message.id}",
-                )
+            # Normal message
+            embed.set_author(
+                name=str(author),
+                icon_url=author.avatar_url,
+                url=f"https://discordapp.com/users/{author.id}#{message.id}",
+            )
         else:
             # Special note messages
             embed.set_author(
@@ -886,46 +1378,25 @@ class Thread:
                 url=f"https://discordapp.com/users/{author.id}#{message.id}",
             )
 
-        ext = [(a.url, a.filename, False) for a in message.attachments]
-
-        images = []
-        attachments = []
-        for attachment in ext:
-            if is_image_url(attachment[0]):
-                images.append(attachment)
-            else:
-                attachments.append(attachment)
-
-        image_urls = re.findall(
-            r"http[s]?:\/\/(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*(),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+",
-            message.content,
-        )
-
-        image_urls = [
-            (is_image_url(url, convert_size=False), None, False)
-            for url in image_urls
-            if is_image_url(url, convert_size=False)
-        ]
-        images.extend(image_urls)
-        images.extend(
-            (
-                str(i.image_url) if isinstance(i.image_url, discord.Asset) else i.image_url,
-                f"{i.name} Sticker",
-                True,
-            )
-            for i in message.stickers
-        )
+        images, attachments = classify_media(message)
 
         embedded_image = False
 
-        prioritize_uploads = any(i[1] is not None for i in images)
+        prioritize_uploads = any(i.filename is not None for i in images)
 
         additional_images = []
         additional_count = 1
 
-        for url, filename, is_sticker in images:
+        if note:
+            color = self.bot.main_color
+        elif from_mod:
+            color = self.bot.mod_color
+        else:
+            color = self.bot.recipient_color
+
+        for url, filename, is_sticker, is_image in images:
             if (
-                not prioritize_uploads or ((url is None or is_image_url(url)) and filename)
+                not prioritize_uploads or ((url is None or is_image) and filename)
             ) and not embedded_image:
                 if url is not None:
                     embed.set_image(url=url)
@@ -940,13 +1411,6 @@ class Thread:
                         embed.add_field(name="Image", value=f"[{filename}]({url})")
                 embedded_image = True
             else:
-                if note:
-                    color = self.bot.main_color
-                elif from_mod:
-                    color = self.bot.mod_color
-                else:
-                    color = self.bot.recipient_color
-
                 img_embed = discord.Embed(color=color)
 
                 if url is not None:
@@ -956,43 +1420,70 @@ class Thread:
                     img_embed.title = filename
                 img_embed.set_footer(text=f"Additional Image Upload ({additional_count})")
                 img_embed.timestamp = message.created_at
-                additional_images.append(destination.send(embed=img_embed))
+                additional_images.append(img_embed)
                 additional_count += 1
 
         file_upload_count = 1
 
-        for url, filename, _ in attachments:
+        for url, filename, *_ in attachments:
             embed.add_field(
                 name=f"File upload ({file_upload_count})", value=f"[{filename}]({url})"
             )
             file_upload_count += 1
 
+        embed.colour = color
+        recipient_embed = embed
+
         if from_mod:
-            embed.colour = self.bot.mod_color
-            # Anonymous reply sent in thread channel
-            if anonymous and isinstance(destination, discord.TextChannel):
+            mod_tag = self.bot.config["mod_tag"]
+            if mod_tag is None:
+                mod_tag = str(author.top_role)
+
+            if anonymous:
+                # Anonymous reply sent in thread channel
                 embed.set_footer(text="Resposta anónima")
-            # Normal messages
-            elif not anonymous:
-                mod_tag = self.bot.config["mod_tag"]
-                if mod_tag is None:
-                    mod_tag = str(message.author.top_role)
-                embed.set_footer(text=mod_tag)  # Normal messages
+
+                # Anonymously sending to the user.
+                recipient_embed = embed.copy()
+                name = self.bot.config["anon_username"]
+                if name is None:
+                    name = mod_tag
+                avatar_url = self.bot.config["anon_avatar_url"]
+                if avatar_url is None:
+                    avatar_url = self.bot.guild.icon_url
+                recipient_embed.set_author(
+                    name=name,
+                    icon_url=avatar_url,
+                    url=f"https://discordapp.com/channels/{self.bot.guild.id}#{message.id}",
+                )
+                recipient_embed.set_footer(text=self.bot.config["anon_tag"])
             else:
-                embed.set_footer(text=self.bot.config["anon_tag"])
-        elif note:
-            embed.colour = self.bot.main_color
-        else:
+                embed.set_footer(text=mod_tag)  # Normal messages
+        elif not note:
             embed.set_footer(text=f"Message ID: {message.id}")
-            embed.colour = self.bot.recipient_color
 
-        if (from_mod or note) and not thread_creation:
-            delete_message = not bool(message.attachments)
-            if delete_message and destination == self.channel:
-                try:
-                    await message.delete()
-                except Exception as e:
-                    logger.warning("Não foi possível apagar mensagem: %s.", e)
+        return RenderedMessage(embed, recipient_embed, additional_images)
+
+    async def _deliver(
+        self,
+        message: discord.Message,
+        destination: typing.Union[
+            discord.TextChannel, discord.DMChannel, discord.User, discord.Member
+        ],
+        rendered: "RenderedMessage",
+        *,
+        from_mod: bool = False,
+        note: bool = False,
+        plain: bool = False,
+        sent: typing.List[discord.Message] = None,
+    ) -> discord.Message:
+        """
+        Sends a rendered thread message to `destination`.
+
+        Every message sent is appended to `sent` if given.
+        """
+        to_channel = isinstance(destination, discord.TextChannel)
+        embed = rendered.embed if to_channel else rendered.recipient_embed
 
         if (
             from_mod
@@ -1001,11 +1492,12 @@ class Thread:
         ):
             logger.info("Mandar uma mensagem para %s quando Dm está desativada está ativo", self.recipient)
 
-        try:
-            await destination.trigger_typing()
-        except discord.NotFound:
-            logger.warning("Channel not found.")
-            raise
+        if not to_channel or self.bot.config["thread_channel_typing"]:
+            try:
+                await self.manager.typing.trigger(destination)
+            except discord.NotFound:
+                logger.warning("Channel not found.")
+                raise
 
         if not from_mod and not note:
             mentions = self.get_notifications()
@@ -1013,35 +1505,41 @@ class Thread:
             mentions = None
 
         if plain:
-            if from_mod and not isinstance(destination, discord.TextChannel):
+            if from_mod and not to_channel:
                 # Plain to user
                 if embed.footer.text:
                     plain_message = f"**({embed.footer.text}) "
                 else:
                     plain_message = "**"
                 plain_message += f"{embed.author.name}:** {embed.description}"
-                files = []
-                for i in embed.fields:
-                    if "Image" in i.name:
-                        async with self.bot.session.get(
-                            i.field[i.field.find("http") : -1]
-                        ) as resp:
-                            stream = io.BytesIO(await resp.read())
-                            files.append(discord.File(stream))
+                urls = [
+                    i.value[i.value.find("http") : -1] for i in embed.fields if "Image" in i.name
+                ]
+                files, failed = await self.bot.attachment_fetcher.fetch_many(urls)
+                if failed:
+                    # Too large or unavailable, link them instead.
+                    plain_message += "\n" + "\n".join(failed)
 
                 msg = await destination.send(plain_message, files=files)
             else:
                 # Plain to mods
+                embed = embed.copy()
                 embed.set_footer(text="[PLAIN] " + embed.footer.text)
                 msg = await destination.send(mentions, embed=embed)
 
         else:
             msg = await destination.send(mentions, embed=embed)
+        if sent is not None:
+            sent.append(msg)
 
-        if additional_images:
+        if rendered.additional_images:
             self.ready = False
-            await asyncio.gather(*additional_images)
+            additional = await asyncio.gather(
+                *(destination.send(embed=e) for e in rendered.additional_images)
+            )
             self.ready = True
+            if sent is not None:
+                sent.extend(additional)
 
         return msg
 
@@ -1069,8 +1567,15 @@ class ThreadManager:
     def __init__(self, bot):
         self.bot = bot
         self.cache = {}
+        self.typing = TypingCoalescer()
+        self.links = LinkCache()
+        self.names = ChannelNameRegistry()
+        self.categories = CategoryPool(bot)
+        OPEN_THREADS.set_function(lambda: len(self.cache))
 
     async def populate_cache(self) -> None:
+        self.names.populate(self.bot.modmail_guild)
+        self.categories.populate(self.bot.modmail_guild)
         for channel in self.bot.modmail_guild.text_channels:
             await self.find(channel=channel)
 
@@ -1106,6 +1611,7 @@ class ThreadManager:
             recipient_id = recipient.id
 
         thread = self.cache.get(recipient_id)
+        CACHE_REQUESTS.inc(cache="threads", result="miss" if thread is None else "hit")
         if thread is not None:
             try:
                 await thread.wait_until_ready()
@@ -1149,7 +1655,9 @@ class ThreadManager:
             return None
 
         if user_id in self.cache:
+            CACHE_REQUESTS.inc(cache="threads", result="hit")
             return self.cache[user_id]
+        CACHE_REQUESTS.inc(cache="threads", result="miss")
 
         try:
             recipient = self.bot.get_user(user_id) or await self.bot.fetch_user(user_id)
@@ -1197,20 +1705,6 @@ class ThreadManager:
 
         self.cache[recipient.id] = thread
 
-        # Schedule thread setup for later
-        cat = self.bot.main_category
-        if category is None and len(cat.channels) == 50:
-            fallback_id = self.bot.config["fallback_category_id"]
-            if fallback_id:
-                fallback = discord.utils.get(cat.guild.categories, id=int(fallback_id))
-                if fallback and len(fallback.channels) != 50:
-                    category = fallback
-
-            if not category:
-                category = await cat.clone(name="Fallback Modmail")
-                self.bot.config.set("fallback_category_id", category.id)
-                await self.bot.config.update()
-
         if message and self.bot.config["confirm_thread_creation"]:
             confirm = await message.channel.send(
                 embed=discord.Embed(
@@ -1259,6 +1753,8 @@ class ThreadManager:
                     del self.cache[recipient.id]
                     return thread
 
+        # Schedule thread setup for later
+        category = await self.categories.acquire(category)
         self.bot.loop.create_task(
             thread.setup(creator=creator, category=category, initial_message=message)
         )
@@ -0,0 +1,243 @@
+"""
+Lightweight tracing of the stages a message goes through.
+
+A trace is started with `Tracer.trace` (e.g. for every DM relayed), and
+every `Tracer.span` entered while it is active records its duration in
+it, including the spans of the tasks it spawns since the current trace
+is held in a context variable. Finished traces are kept in memory for
+``?debug trace`` and can be exported as JSON lines to a file, or to an
+OpenTelemetry collector when the OpenTelemetry SDK is installed.
+"""
+
+import json
+import time
+import typing
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from core.metrics import registry
+from core.models import getLogger
+
+try:
+    from opentelemetry import trace as otel_trace
+    from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor
+except ImportError:
+    otel_trace = None
+
+logger = getLogger(__name__)
+
+STAGE_LATENCY = registry.histogram(
+    "modmail_trace_stage_seconds",
+    "Time spent in each stage of the traced operations.",
+    ["trace", "stage"],
+)
+
+_trace: ContextVar[typing.Optional["Trace"]] = ContextVar("trace", default=None)
+_depth: ContextVar[int] = ContextVar("span_depth", default=0)
+
+
+class Stage(typing.NamedTuple):
+    name: str
+    # seconds since the start of the trace
+    offset: float
+    duration: float
+    depth: int
+    error: bool
+    # whether it ended after the trace, e.g. in a task the trace spawned
+    background: bool
+
+
+class Trace:
+    """The stages of a single traced operation."""
+
+    __slots__ = ("name", "attributes", "started_at", "start", "duration", "stages")
+
+    def __init__(self, name: str, attributes: dict):
+        self.name = name
+        self.attributes = attributes
+        self.started_at = time.time()
+        self.start = time.perf_counter()
+        self.duration = None
+        self.stages = []
+
+    def sorted_stages(self) -> typing.List[Stage]:
+        """The stages in the order they started, parents before their children."""
+        return sorted(self.stages, key=lambda s: (s.offset, s.depth))
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "attributes": self.attributes,
+            "started_at": self.started_at,
+            "duration": self.duration,
+            "stages": [stage._asdict() for stage in self.sorted_stages()],
+        }
+
+
+class JsonLinesExporter:
+    """Appends the finished traces to a file, one JSON object per line."""
+
+    def __init__(self, path: str):
+        self.path = path
+        # A single worker keeps the lines in order.
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="trace-export")
+
+    def _write(self, line: str) -> None:
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+    def export(self, trace: Trace) -> None:
+        self._executor.submit(self._write, json.dumps(trace.to_dict(), default=str))
+
+
+class OpenTelemetryExporter:
+    """Sends the finished traces to an OpenTelemetry collector over OTLP/HTTP."""
+
+    def __init__(self, endpoint: str):
+        if otel_trace is None:
+            raise RuntimeError(
+                "The opentelemetry-sdk and opentelemetry-exporter-otlp-proto-http "
+                "packages are needed to export traces to a collector."
+            )
+        provider = TracerProvider(resource=Resource.create({"service.name": "modmail"}))
+        provider.add_span_processor(BatchSpanProcessor(OTLPSpanExporter(endpoint=endpoint)))
+        self._tracer = provider.get_tracer(__name__)
+
+    def export(self, trace: Trace) -> None:
+        def ns(offset):
+            return int((trace.started_at + offset) * 1e9)
+
+        root = self._tracer.start_span(
+            trace.name,
+            start_time=ns(0),
+            attributes={k: str(v) for k, v in trace.attributes.items()},
+        )
+        parents = [root]
+        for stage in trace.sorted_stages():
+            del parents[stage.depth + 1 :]
+            span = self._tracer.start_span(
+                stage.name,
+                context=otel_trace.set_span_in_context(parents[-1]),
+                start_time=ns(stage.offset),
+            )
+            if stage.error:
+                span.set_status(otel_trace.Status(otel_trace.StatusCode.ERROR))
+            span.end(end_time=ns(stage.offset + stage.duration))
+            parents.append(span)
+        root.end(end_time=ns(trace.duration))
+
+
+class Tracer:
+    """
+    Records traces and keeps the most recent ones.
+
+    Parameters
+    ----------
+    max_traces : int
+        The number of finished traces kept in memory.
+    """
+
+    def __init__(self, max_traces: int = 200):
+        self.recent = deque(maxlen=max_traces)
+        self.exporters = []
+
+    def configure(self, export: typing.Optional[str]) -> None:
+        """
+        Sets where the finished traces are exported to.
+
+        Parameters
+        ----------
+        export : Optional[str]
+            The URL of an OpenTelemetry collector's OTLP/HTTP traces
+            endpoint, or the path of a file to write JSON lines to.
+        """
+        self.exporters.clear()
+        if not export:
+            return
+        try:
+            if export.startswith(("http://", "https://")):
+                self.exporters.append(OpenTelemetryExporter(export))
+            else:
+                self.exporters.append(JsonLinesExporter(export))
+        except RuntimeError as e:
+            logger.error("Traces will not be exported: %s", e)
+        else:
+            logger.info("Exporting traces to %s.", export)
+
+    @contextmanager
+    def trace(self, name: str, *, enabled: bool = True, **attributes):
+        """
+        Traces the ``with`` block, unless a trace is already active.
+
+        Parameters
+        ----------
+        name : str
+            The name of the traced operation.
+        enabled : bool
+            Whether to trace the block, convenient for tracing conditionally.
+        **attributes
+            Details of the operation, e.g. IDs, kept with the trace.
+        """
+        if not enabled or _trace.get() is not None:
+            yield None
+            return
+
+        trace = Trace(name, attributes)
+        token = _trace.set(trace)
+        try:
+            yield trace
+        finally:
+            trace.duration = time.perf_counter() - trace.start
+            _trace.reset(token)
+            self.recent.append(trace)
+            for exporter in self.exporters:
+                try:
+                    exporter.export(trace)
+                except Exception:
+                    logger.warning("Failed to export a trace.", exc_info=True)
+
+    @contextmanager
+    def span(self, name: str):
+        """Records the time spent in the ``with`` block as a stage of the current trace."""
+        trace = _trace.get()
+        if trace is None:
+            yield
+            return
+
+        depth = _depth.get()
+        token = _depth.set(depth + 1)
+        start = time.perf_counter()
+        error = False
+        try:
+            yield
+        except BaseException:
+            error = True
+            raise
+        finally:
+            _depth.reset(token)
+            duration = time.perf_counter() - start
+            background = trace.duration is not None
+            trace.stages.append(
+                Stage(name, start - trace.start, duration, depth, error, background)
+            )
+            STAGE_LATENCY.observe(duration, trace=trace.name, stage=name)
+
+    async def wrap(self, name: str, awaitable: typing.Awaitable):
+        """Awaits `awaitable` in a span, e.g. to trace a task."""
+        # Tasks run in a copy of the context, their spans are top level stages.
+        _depth.set(0)
+        with self.span(name):
+            return await awaitable
+
+    def slowest(self, n: int = 5, name: str = None) -> typing.List[Trace]:
+        """The `n` slowest of the recent traces, optionally only those named `name`."""
+        traces = [t for t in self.recent if name is None or t.name == name]
+        return sorted(traces, key=lambda t: t.duration, reverse=True)[:n]
+
+
+tracer = Tracer()
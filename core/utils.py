@@ -1,10 +1,11 @@
+import asyncio
 import base64
 import functools
+import os
 import re
 import string
 import typing
 from difflib import get_close_matches
-from distutils.util import strtobool as _stb  # pylint: disable=import-error
 from itertools import takewhile, zip_longest
 from urllib import parse
 
@@ -18,6 +19,8 @@ __all__ = [
     "format_preview",
     "is_image_url",
     "parse_image_url",
+    "Media",
+    "classify_media",
     "human_join",
     "days",
     "cleanup_code",
@@ -30,21 +33,25 @@ __all__ = [
     "escape_code_block",
     "format_channel_name",
     "tryint",
+    "TailReader",
+    "iter_file",
 ]
 
 
+# distutils.util.strtobool's values, distutils takes long to import
+_TRUE_VALUES = {"y", "yes", "t", "true", "on", "1", "enable"}
+_FALSE_VALUES = {"n", "no", "f", "false", "off", "0", "disable"}
+
+
 def strtobool(val):
     if isinstance(val, bool):
         return val
-    try:
-        return _stb(str(val))
-    except ValueError:
-        val = val.lower()
-        if val == "enable":
-            return 1
-        if val == "disable":
-            return 0
-        raise
+    val = str(val).lower()
+    if val in _TRUE_VALUES:
+        return 1
+    if val in _FALSE_VALUES:
+        return 0
+    raise ValueError(f"invalid truth value {val!r}")
 
 
 class User(commands.MemberConverter):
@@ -118,10 +125,30 @@ def format_preview(messages: typing.List[typing.Dict[str, typing.Any]]):
     return out or "No Messages"
 
 
-def is_image_url(url: str, **kwargs) -> str:
+URL_REGEX = re.compile(
+    r"http[s]?:\/\/(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*(),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+"
+)
+GYAZO_REGEX = re.compile(
+    r"(http[s]?:\/\/)((?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*(),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+)"
+)
+IMAGE_EXTENSIONS = (".png", ".jpg", ".gif", ".jpeg", ".webp")
+
+
+@functools.lru_cache(maxsize=1024)
+def _image_url(url: str, convert_size: bool) -> str:
+    if url.startswith("https://gyazo.com") or url.startswith("http://gyazo.com"):
+        # gyazo support
+        url = GYAZO_REGEX.sub(r"\1i.\2.png", url)
+
+    return parse_image_url(url, convert_size=convert_size)
+
+
+def is_image_url(url: str, *, convert_size=True) -> str:
     """
     Check if the URL is pointing to an image.
 
+    Results are memoized per URL.
+
     Parameters
     ----------
     url : str
@@ -129,18 +156,10 @@ def is_image_url(url: str, **kwargs) -> str:
 
     Returns
     -------
-    bool
-        Whether the URL is a valid image URL.
+    str
+        The image URL, or '' if the URL isn't a valid image URL.
     """
-    if url.startswith("https://gyazo.com") or url.startswith("http://gyazo.com"):
-        # gyazo support
-        url = re.sub(
-            r"(http[s]?:\/\/)((?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*(),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+)",
-            r"\1i.\2.png",
-            url,
-        )
-
-    return parse_image_url(url, **kwargs)
+    return _image_url(url, convert_size)
 
 
 def parse_image_url(url: str, *, convert_size=True) -> str:
@@ -157,10 +176,9 @@ def parse_image_url(url: str, *, convert_size=True) -> str:
     str
         The converted URL, or '' if the URL isn't in the proper format.
     """
-    types = [".png", ".jpg", ".gif", ".jpeg", ".webp"]
     url = parse.urlsplit(url)
 
-    if any(url.path.lower().endswith(i) for i in types):
+    if url.path.lower().endswith(IMAGE_EXTENSIONS):
         if convert_size:
             return parse.urlunsplit((*url[:3], "size=128", url[-1]))
         else:
@@ -168,6 +186,56 @@ def parse_image_url(url: str, *, convert_size=True) -> str:
     return ""
 
 
+class Media(typing.NamedTuple):
+    """An image, sticker or file of a message."""
+
+    url: typing.Optional[str]
+    filename: typing.Optional[str]
+    is_sticker: bool = False
+    # Whether `url` is known to point to an image, it may not for stickers.
+    is_image: bool = True
+
+
+def classify_media(
+    message: discord.Message,
+) -> typing.Tuple[typing.List[Media], typing.List[Media]]:
+    """
+    Sorts the attachments, image links and stickers of a message in a single pass.
+
+    Parameters
+    ----------
+    message : discord.Message
+        The message to classify.
+
+    Returns
+    -------
+    Tuple[List[Media], List[Media]]
+        The images (attachments first, then image links in the
+        content, then stickers) and the other file attachments.
+    """
+    images = []
+    files = []
+    for attachment in message.attachments:
+        if is_image_url(attachment.url):
+            images.append(Media(attachment.url, attachment.filename))
+        else:
+            files.append(Media(attachment.url, attachment.filename, is_image=False))
+
+    if message.content and "http" in message.content:
+        for url in URL_REGEX.findall(message.content):
+            image_url = is_image_url(url, convert_size=False)
+            if image_url:
+                images.append(Media(image_url, None))
+
+    for sticker in message.stickers:
+        url = sticker.image_url
+        if isinstance(url, discord.Asset):
+            url = str(url)
+        is_image = url is not None and bool(is_image_url(url))
+        images.append(Media(url, f"{sticker.name} Sticker", True, is_image))
+    return images, files
+
+
 def human_join(strings):
     if len(strings) <= 2:
         return " or ".join(strings)
@@ -339,8 +407,13 @@ def escape_code_block(text):
     return re.sub(r"```", "`\u200b``", text)
 
 
-def format_channel_name(author, guild, exclude_channel=None, force_null=False):
-    """Sanitises a username for use with text channel names"""
+def format_channel_name(author, guild, exclude_channel=None, force_null=False, existing=None):
+    """
+    Sanitises a username for use with text channel names
+
+    `existing` are the names already taken, by default
+    the names of the text channels of `guild`.
+    """
     name = author.name.lower()
     if force_null:
         name = "null"
@@ -350,8 +423,9 @@ def format_channel_name(author, guild, exclude_channel=None, force_null=False):
     ) + f"-{author.discriminator}"
 
     counter = 1
-    existed = set(c.name for c in guild.text_channels if c != exclude_channel)
-    while new_name in existed:
+    if existing is None:
+        existing = set(c.name for c in guild.text_channels if c != exclude_channel)
+    while new_name in existing:
         new_name = f"{name}_{counter}"  # multiple channels with same name
         counter += 1
 
@@ -363,3 +437,117 @@ def tryint(x):
         return int(x)
     except (ValueError, TypeError):
         return x
+
+
+class TailReader:
+    """
+    Reads a text file backwards from its end, a page of whole lines at a time.
+
+    Only the blocks needed for the requested pages are read. The file is
+    kept open between pages so they stay consistent if it is rotated, and
+    lines written after the first page are not read.
+
+    Parameters
+    ----------
+    path : str
+        The path of the file.
+    page_size : int
+        The maximum number of characters of a page. Longer lines are
+        truncated.
+    block_size : int
+        The number of bytes read at once.
+    """
+
+    def __init__(self, path: str, page_size: int = 1986, block_size: int = 8192):
+        self.path = path
+        self.page_size = page_size
+        self.block_size = block_size
+        self.exhausted = False
+        self._file = None
+        # file offset of the start of the buffer
+        self._pos = None
+        # the bytes read but not paged yet, ending at a line boundary
+        self._buffer = b""
+
+    def read_page(self) -> typing.Optional[str]:
+        """
+        Reads the page preceding the last one read, blocking.
+
+        Returns
+        -------
+        Optional[str]
+            The lines of the page, `None` once the start of the file is reached.
+        """
+        if self.exhausted:
+            return None
+        if self._file is None:
+            try:
+                self._file = open(self.path, "rb")
+            except FileNotFoundError:
+                self.exhausted = True
+                return None
+            self._pos = self._file.seek(0, os.SEEK_END)
+
+        lines = []
+        size = 0
+        while True:
+            start = self._buffer.rfind(b"\n", 0, max(len(self._buffer) - 1, 0)) + 1
+            if start == 0 and self._pos > 0:
+                read = min(self.block_size, self._pos)
+                self._pos -= read
+                self._file.seek(self._pos)
+                self._buffer = self._file.read(read) + self._buffer
+                continue
+            if not self._buffer:
+                break
+
+            line = self._buffer[start:].decode("utf-8", "replace")
+            if len(line) > self.page_size:
+                line = line[: self.page_size - 6] + "[...]\n"
+            if lines and size + len(line) > self.page_size:
+                break
+            self._buffer = self._buffer[:start]
+            lines.append(line)
+            size += len(line)
+
+        if not self._buffer and self._pos == 0:
+            self.exhausted = True
+            self.close()
+        if not lines:
+            return None
+        return "".join(reversed(lines))
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+async def iter_file(
+    path: str, *, limit: int = None, chunk_size: int = 65536
+) -> typing.AsyncIterator[bytes]:
+    """
+    Reads a file in chunks in the default executor, e.g. to stream an upload.
+
+    Parameters
+    ----------
+    path : str
+        The path of the file.
+    limit : int, optional
+        The number of bytes to read at most, e.g. the size of a file
+        that is still being written to when the upload started.
+    chunk_size : int
+        The number of bytes read at once.
+    """
+    loop = asyncio.get_running_loop()
+    f = await loop.run_in_executor(None, open, path, "rb")
+    try:
+        remaining = float("inf") if limit is None else limit
+        while remaining > 0:
+            chunk = await loop.run_in_executor(None, f.read, int(min(chunk_size, remaining)))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+    finally:
+        f.close()
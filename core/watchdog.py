@@ -0,0 +1,180 @@
+"""
+Detects the callbacks that block the event loop.
+
+A heartbeat task wakes up every `LoopWatchdog.interval` seconds and
+records how late it was in the event loop lag histogram. A sampling
+thread checks that the heartbeat keeps beating, when it is late by more
+than the threshold the loop is blocked: the thread captures the stack
+of the loop's thread and the name of the task running, which is logged
+once the loop is unblocked and kept for ``?debug slow``.
+"""
+
+import asyncio
+import sys
+import threading
+import time
+import traceback
+import typing
+import weakref
+from collections import deque
+
+from core.metrics import registry
+from core.models import getLogger
+
+logger = getLogger(__name__)
+
+LOOP_LAG = registry.histogram(
+    "modmail_event_loop_lag_seconds",
+    "Delay of the callbacks scheduled on the event loop.",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5),
+)
+SLOW_CALLBACKS = registry.counter(
+    "modmail_slow_callbacks_total", "Callbacks that blocked the event loop.", ["handler"]
+)
+
+# task -> what it is handling, e.g. "event:on_message"
+_labels = weakref.WeakKeyDictionary()
+
+
+def label_task(label: str) -> None:
+    """Names what the current task is handling, to report it if it blocks the loop."""
+    task = asyncio.current_task()
+    if task is not None:
+        _labels[task] = label
+
+
+def describe_task(task: typing.Optional[asyncio.Task]) -> str:
+    if task is None:
+        return "callback"
+    label = _labels.get(task)
+    if label is not None:
+        return label
+    coro = task.get_coro()
+    return getattr(coro, "__qualname__", None) or repr(coro)
+
+
+class _Sample(typing.NamedTuple):
+    beat: float
+    handler: str
+    stack: traceback.StackSummary
+
+
+class SlowCallback(typing.NamedTuple):
+    handler: str
+    # seconds the loop was blocked, at least
+    duration: float
+    at: float
+    stack: traceback.StackSummary
+
+    def format_stack(self, limit: int = None) -> str:
+        frames = self.stack if limit is None else self.stack[-limit:]
+        return "".join(traceback.format_list(frames))
+
+
+class LoopWatchdog:
+    """
+    Measures the event loop lag and captures the stack of the blocking callbacks.
+
+    Parameters
+    ----------
+    threshold : float
+        The seconds a callback may block the loop before it is reported,
+        `0` to only measure the lag.
+    interval : float
+        The seconds between two heartbeats.
+    max_reports : int
+        The number of slow callbacks kept in memory.
+    max_frames : int
+        The number of innermost frames kept of the captured stacks.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.25,
+        interval: float = 0.1,
+        max_reports: int = 25,
+        max_frames: int = 20,
+    ):
+        self.threshold = threshold
+        self.interval = interval
+        self.max_frames = max_frames
+        self.reports = deque(maxlen=max_reports)
+
+        self._loop = None
+        self._loop_thread_id = None
+        self._beat = 0.0
+        self._sample = None
+        self._task = None
+        self._thread = None
+        self._stopping = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    def start(self) -> None:
+        """Starts watching the running event loop."""
+        if self.running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._beat = time.monotonic()
+        self._task = self._loop.create_task(self._heartbeat())
+        if self.threshold > 0:
+            self._stopping.clear()
+            self._thread = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if self._thread is not None:
+            self._stopping.set()
+            self._thread = None
+
+    async def _heartbeat(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            beat = self._beat = time.monotonic()
+            start = loop.time()
+            await asyncio.sleep(self.interval)
+            lag = max(loop.time() - start - self.interval, 0)
+            LOOP_LAG.observe(lag)
+
+            sample, self._sample = self._sample, None
+            if sample is not None and sample.beat == beat:
+                self._report(sample, lag)
+
+    def _watch(self) -> None:
+        """Runs in the sampling thread."""
+        poll = min(self.threshold / 2, 0.05)
+        captured = None
+        while not self._stopping.wait(poll):
+            beat = self._beat
+            if beat == captured or time.monotonic() - beat - self.interval < self.threshold:
+                continue
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+            try:
+                stack = traceback.extract_stack(frame, limit=self.max_frames)
+            finally:
+                del frame
+            handler = describe_task(asyncio.current_task(self._loop))
+            self._sample = _Sample(beat, handler, stack)
+            captured = beat
+
+    def _report(self, sample: _Sample, lag: float) -> None:
+        slow = SlowCallback(sample.handler, lag, time.time(), sample.stack)
+        self.reports.append(slow)
+        SLOW_CALLBACKS.inc(handler=slow.handler)
+        logger.warning(
+            "The event loop was blocked for %.0fms by %s:\n%s",
+            lag * 1000,
+            slow.handler,
+            slow.format_stack().rstrip(),
+        )
+
+    def slowest(self, n: int = 5) -> typing.List[SlowCallback]:
+        return sorted(self.reports, key=lambda s: s.duration, reverse=True)[:n]
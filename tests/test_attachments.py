@@ -0,0 +1,66 @@
+import asyncio
+import io
+
+from core.attachments import AttachmentFetcher
+
+
+class FakeResponse:
+    def __init__(self, body):
+        self.body = body
+        self.content_length = None
+        self.content = self
+
+    def raise_for_status(self):
+        pass
+
+    async def iter_chunked(self, size):
+        for i in range(0, len(self.body), size):
+            yield self.body[i : i + size]
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        pass
+
+
+class FakeSession:
+    def __init__(self, bodies):
+        self.bodies = bodies
+
+    def get(self, url, **kwargs):
+        return FakeResponse(self.bodies[url])
+
+
+def make_fetcher(bodies):
+    # Created in the running loop, asyncio objects are bound to it before Python 3.10.
+    fetcher = AttachmentFetcher(FakeSession(bodies), spool_threshold=100)
+    fetcher.chunk_size = 16
+    return fetcher
+
+
+def test_large_attachment_is_a_file_object():
+    body = bytes(range(256)) * 2
+
+    async def fetch():
+        return await make_fetcher({"https://cdn/a.png": body}).fetch("https://cdn/a.png")
+
+    file = asyncio.run(fetch())
+
+    # discord.py only takes io.IOBase objects, it opens anything else as a path.
+    # SpooledTemporaryFile is only one since Python 3.11.
+    assert isinstance(file.fp, io.BufferedRandom)
+    assert file.fp.read() == body
+    assert file.filename == "a.png"
+
+
+def test_message_upload_limit():
+    urls = [f"https://cdn/{i}.png" for i in range(3)]
+
+    async def fetch():
+        return await make_fetcher({url: b"x" * 40 for url in urls}).fetch_many(urls, limit=100)
+
+    files, failed = asyncio.run(fetch())
+
+    assert [f.filename for f in files] == ["0.png", "1.png"]
+    assert failed == [urls[2]]
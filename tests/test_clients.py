@@ -0,0 +1,96 @@
+import asyncio
+from datetime import datetime
+
+from mongomock_motor import AsyncMongoMockClient
+from pymongo.read_preferences import Primary, SecondaryPreferred
+
+from core.clients import ApiClient, MongoDBClient
+
+
+class FakeBot:
+    guild_id = 1
+    session = None
+
+    def __init__(self):
+        self.loop = asyncio.get_event_loop()
+
+
+def make_client():
+    client = MongoDBClient.__new__(MongoDBClient)
+    ApiClient.__init__(client, FakeBot(), AsyncMongoMockClient().modmail_bot)
+    return client
+
+
+def test_invalid_read_preference_ignores_max_staleness():
+    # Falls back to primary, which refuses a max staleness.
+    read_preference = MongoDBClient._make_read_preference("secundary", "120")
+
+    assert isinstance(read_preference, Primary)
+
+
+def test_max_staleness():
+    read_preference = MongoDBClient._make_read_preference("secondaryPreferred", "120")
+    assert isinstance(read_preference, SecondaryPreferred)
+    assert read_preference.max_staleness == 120
+
+    read_preference = MongoDBClient._make_read_preference("secondaryPreferred", "30")
+    assert read_preference.max_staleness == -1
+
+
+def test_client_options():
+    config = dict.fromkeys(MongoDBClient.client_options)
+    config.update(
+        mongo_max_pool_size="50",
+        mongo_min_pool_size="-1",
+        mongo_max_idle_time="soon",
+        mongo_server_selection_timeout="0",
+        mongo_compressors="zstd,zlib",
+    )
+
+    options = MongoDBClient._make_client_options(config)
+
+    assert options == {
+        "maxPoolSize": 50,
+        "serverSelectionTimeoutMS": 0,
+        "compressors": "zstd,zlib",
+    }
+
+
+def test_min_pool_size_above_max_is_ignored():
+    config = dict.fromkeys(MongoDBClient.client_options)
+    config.update(mongo_max_pool_size="10", mongo_min_pool_size="20")
+
+    assert MongoDBClient._make_client_options(config) == {"maxPoolSize": 10}
+
+
+def test_archive_round_trip():
+    async def run():
+        client = make_client()
+        messages = [
+            {
+                "timestamp": str(datetime(2021, 1, 1, 10, i)),
+                "content": "x" * 500,
+                "type": "thread_message",
+                "author": {"id": "2", "name": "mod", "discriminator": "0001", "mod": True},
+            }
+            for i in range(10)
+        ]
+        await client.logs.insert_one(
+            {
+                "_id": "a",
+                "key": "a",
+                "open": False,
+                "closed_at": str(datetime(2021, 1, 2)),
+                "messages": messages,
+            }
+        )
+
+        assert await client.archive_closed_logs(datetime(2021, 1, 3)) == 1
+
+        stub = await client.logs.find_one({"_id": "a"})
+        assert stub["archived"] is True
+        assert len(stub["messages"]) == MongoDBClient.ARCHIVE_PREVIEW_MESSAGES
+        assert stub["responders"] == ["2"]
+        assert await client.get_archived_messages("a") == messages
+
+    asyncio.run(run())
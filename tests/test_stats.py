@@ -0,0 +1,163 @@
+import asyncio
+from datetime import date, datetime, timedelta
+
+from mongomock_motor import AsyncMongoMockClient
+
+from core.clients import ApiClient, MongoDBClient
+
+
+class FakeBot:
+    guild_id = 1
+    session = None
+
+    def __init__(self):
+        self.loop = asyncio.get_event_loop()
+
+
+class StatsClient(MongoDBClient):
+    """A client whose aggregations are replaced by canned results."""
+
+    def __init__(self):
+        ApiClient.__init__(self, FakeBot(), AsyncMongoMockClient().modmail_bot)
+        self._stats_cache = {}
+        self.computed = {}
+        self.aggregations = 0
+
+    async def _aggregate_daily_stats(self, start, end):
+        self.aggregations += 1
+        return {day: dict(stats) for day, stats in self.computed.items()}
+
+
+def day_stats(response_times, pending):
+    return {
+        "opened": 1,
+        "closed": 0,
+        "hours": [0] * 23 + [1],
+        "response_times": response_times,
+        "replies": {},
+        "pending": pending,
+    }
+
+
+def test_reply_after_midnight_is_counted():
+    async def run():
+        client = StatsClient()
+        today = datetime.utcnow().date()
+        yesterday = today - timedelta(days=1)
+
+        # Opened late yesterday, still waiting for a reply.
+        client.computed = {str(yesterday): day_stats([], pending=1)}
+        days = await client.get_daily_stats(yesterday, today)
+        assert days[str(yesterday)]["response_times"] == []
+        assert await client.db.stats.count_documents({}) == 0
+
+        # Answered after midnight: yesterday is computed again, then stored.
+        client.computed = {str(yesterday): day_stats([3600.0], pending=0)}
+        days = await client.get_daily_stats(yesterday, today)
+        assert days[str(yesterday)]["response_times"] == [3600.0]
+        assert await client.db.stats.count_documents({}) == 1
+
+        days = await client.get_daily_stats(yesterday, today)
+        assert client.aggregations == 2
+        assert days[str(yesterday)]["response_times"] == [3600.0]
+        assert "pending" not in days[str(yesterday)]
+
+    asyncio.run(run())
+
+
+def test_unanswered_days_settle():
+    async def run():
+        client = StatsClient()
+        today = datetime.utcnow().date()
+        old = today - timedelta(days=MongoDBClient.STATS_SETTLE_DAYS)
+
+        client.computed = {str(old): day_stats([], pending=1)}
+        await client.get_daily_stats(old, old + timedelta(days=1))
+        assert await client.db.stats.count_documents({"day": str(old)}) == 1
+
+    asyncio.run(run())
+
+
+def make_client():
+    client = MongoDBClient.__new__(MongoDBClient)
+    ApiClient.__init__(client, FakeBot(), AsyncMongoMockClient().modmail_bot)
+    client.read_preference = MongoDBClient._make_read_preference("primary", None)
+    client._log_reader = None
+    client._stats_cache = {}
+    return client
+
+
+def message(time, author_id, *, mod=False, type_="thread_message"):
+    return {
+        "timestamp": str(time),
+        "content": "hello",
+        "type": type_,
+        "author": {
+            "id": author_id,
+            "name": f"user{author_id}",
+            "discriminator": "0001",
+            "mod": mod,
+        },
+    }
+
+
+def make_log(key, created, messages, closed=None):
+    return {
+        "_id": key,
+        "key": key,
+        "guild_id": "1",
+        "open": closed is None,
+        "created_at": str(created),
+        "closed_at": None if closed is None else str(closed),
+        "messages": messages,
+    }
+
+
+def test_archived_logs_keep_their_stats():
+    async def run():
+        client = make_client()
+        day = datetime(2021, 1, 4)
+
+        def at(hours):
+            return day + timedelta(hours=hours)
+
+        logs = [
+            make_log(
+                "a",
+                at(10),
+                [
+                    message(at(10), "1"),
+                    message(at(10.5), "2", mod=True),
+                    message(at(11), "3", mod=True, type_="anonymous"),
+                ],
+                closed=at(12),
+            ),
+            # the first reply is past the preview kept when archived
+            make_log(
+                "b",
+                at(15),
+                [message(at(15), "4")] * 6
+                + [message(at(16), "2", mod=True), message(at(17), "2", mod=True)],
+                closed=at(18),
+            ),
+            make_log("c", at(23), [message(at(23), "5")]),
+        ]
+        await client.logs.insert_many(logs)
+        start, end = date(2021, 1, 4), date(2021, 1, 5)
+
+        stats = await client._aggregate_daily_stats(start, end)
+        assert await client.archive_closed_logs(datetime(2021, 1, 5)) == 2
+        assert await client._aggregate_daily_stats(start, end) == stats
+
+        stats = stats["2021-01-04"]
+        assert stats["opened"] == 3
+        assert stats["closed"] == 2
+        assert stats["pending"] == 1
+        assert [i for i, count in enumerate(stats["hours"]) if count] == [10, 15, 23]
+        assert sorted(stats["response_times"]) == [1800, 3600]
+        assert stats["replies"] == {
+            "2": {"name": "user2", "count": 3},
+            "3": {"name": "user3", "count": 1},
+        }
+
+    asyncio.run(run())
@@ -0,0 +1,57 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from core.thread import LinkCache, Thread
+
+
+def make_thread(concurrent):
+    guild = Mock()
+    guild.get_member.return_value = object()
+    bot = SimpleNamespace(
+        config={"concurrent_reply_delivery": concurrent},
+        loop=asyncio.get_running_loop(),
+        guilds=[guild],
+        error_color=0xFF0000,
+        api=SimpleNamespace(append_log=AsyncMock()),
+        dispatch=Mock(),
+    )
+    manager = SimpleNamespace(bot=bot, links=LinkCache())
+    channel = SimpleNamespace(id=2, send=AsyncMock(return_value=SimpleNamespace(id=30)))
+    thread = Thread(manager, SimpleNamespace(id=1, bot=False), channel)
+    thread.ready = True
+    thread._handle_activity = Mock()
+    thread.render = Mock(return_value=object())
+    return thread
+
+
+@pytest.mark.parametrize("concurrent", [False, True])
+def test_reply_mirror_failure(concurrent):
+    async def run():
+        thread = make_thread(concurrent)
+        delivered = SimpleNamespace(id=10)
+
+        async def deliver(message, destination, rendered, **kwargs):
+            if destination is thread.channel:
+                raise OSError("the thread channel copy failed")
+            return delivered
+
+        thread._deliver = deliver
+        message = Mock(content="Olá", attachments=[], delete=AsyncMock())
+        await thread.reply(message)
+
+        # The recipient got the reply: no delivery error, only a warning with the reply.
+        thread.channel.send.assert_awaited_once()
+        description = thread.channel.send.await_args.kwargs["embed"].description
+        assert description.startswith("A mensagem foi entregue ao recipiente")
+        assert "Olá" in description
+
+        message.delete.assert_awaited_once()
+        assert thread.manager.links.get(delivered.id) == 30
+        thread.bot.api.append_log.assert_awaited_once()
+        assert thread.bot.api.append_log.await_args.kwargs["message_id"] == 30
+        thread.bot.dispatch.assert_called_with("thread_reply", thread, True, message, False, False)
+
+    asyncio.run(run())